@@ -191,6 +191,28 @@ def _build_parser() -> argparse.ArgumentParser:
     preflight.add_argument("--skip-monarch", action="store_true", help="Skip Monarch auth check")
     preflight.add_argument("--skip-imap", action="store_true", help="Skip Gmail IMAP connectivity check")
 
+    combo = sub.add_parser(
+        "preflight-and-dry-run",
+        help=(
+            "Run preflight checks and then `sync --dry-run` in a single process "
+            "(one interpreter startup/import graph; used by the portal smoke tests)."
+        ),
+    )
+    combo.add_argument("--config", default="config.yaml", help="Path to YAML config (default: config.yaml)")
+    combo.add_argument("--skip-monarch", action="store_true", help="Skip Monarch auth check during preflight")
+    combo.add_argument("--skip-imap", action="store_true", help="Skip Gmail IMAP connectivity check during preflight")
+    combo.add_argument(
+        "--skip-loans",
+        action="store_true",
+        help="Skip loan details/balance extraction (still extracts payment activity allocations). Useful for testing.",
+    )
+    combo.add_argument("--max-payments", type=int, default=10, help="Max payment detail entries to scan (default: 10)")
+    combo.add_argument(
+        "--payments-since",
+        default="",
+        help="Only create payment transactions for payments on/after this date (YYYY-MM-DD).",
+    )
+
     list_groups = sub.add_parser(
         "list-loan-groups",
         help="Log into your servicer portal and list discovered loan groups (helps you set LOAN_GROUPS).",
@@ -284,6 +306,26 @@ def main(argv: Optional[List[str]] = None) -> int:
         logger.info("Preflight OK")
         return 0
 
+    if args.cmd == "preflight-and-dry-run":
+        # Re-dispatch through main() so both phases behave exactly like the standalone
+        # subcommands, but share one interpreter/import graph instead of two processes.
+        preflight_argv = ["--env-file", args.env_file, "preflight", "--config", args.config]
+        if args.skip_monarch:
+            preflight_argv.append("--skip-monarch")
+        if args.skip_imap:
+            preflight_argv.append("--skip-imap")
+        rc = main(preflight_argv)
+        if rc != 0:
+            return rc
+
+        sync_argv = ["--env-file", args.env_file, "sync", "--config", args.config, "--dry-run"]
+        if args.skip_loans:
+            sync_argv.append("--skip-loans")
+        sync_argv += ["--max-payments", str(args.max_payments)]
+        if args.payments_since:
+            sync_argv += ["--payments-since", args.payments_since]
+        return main(sync_argv)
+
     if args.cmd == "sync":
         cfg = load_config(args.config)
         configure_logging(level=cfg.logging.level, file_path=cfg.logging.file_path)
@@ -348,23 +390,25 @@ def main(argv: Optional[List[str]] = None) -> int:
                 mfa_provider = lambda: poll_gmail_imap_for_code(cfg.gmail_imap, print_code=args.print_mfa_code)
 
                 t_portal = time.time()
-                loan_snapshots, payment_allocations = portal.extract(
-                    groups=groups,
-                    skip_loans=bool(args.skip_loans),
-                    headless=not args.headful,
-                    storage_state_path=storage_state_path,
-                    max_payments_to_scan=args.max_payments,
-                    payments_since=cutoff,
-                    mfa_code_provider=mfa_provider,
-                    mfa_method=cfg.servicer.mfa_method,
-                    force_fresh_session=args.fresh_session,
-                    slow_mo_ms=args.slowmo_ms,
-                    step_debug=args.step_debug,
-                    log_steps=bool(args.log_steps),
-                    step_delay_ms=args.step_delay_ms,
-                    manual_mfa=args.manual_mfa,
-                    allow_empty_loans=args.allow_empty_loans,
-                )
+                # The portal client keeps one Chromium alive across calls; close it when done.
+                with portal:
+                    loan_snapshots, payment_allocations = portal.extract(
+                        groups=groups,
+                        skip_loans=bool(args.skip_loans),
+                        headless=not args.headful,
+                        storage_state_path=storage_state_path,
+                        max_payments_to_scan=args.max_payments,
+                        payments_since=cutoff,
+                        mfa_code_provider=mfa_provider,
+                        mfa_method=cfg.servicer.mfa_method,
+                        force_fresh_session=args.fresh_session,
+                        slow_mo_ms=args.slowmo_ms,
+                        step_debug=args.step_debug,
+                        log_steps=bool(args.log_steps),
+                        step_delay_ms=args.step_delay_ms,
+                        manual_mfa=args.manual_mfa,
+                        allow_empty_loans=args.allow_empty_loans,
+                    )
                 logger.info("Portal extract complete (seconds=%.2f)", time.time() - t_portal)
 
                 # Safety: keep filtering here too, even though extraction now stops scanning older payments early.
@@ -475,17 +519,18 @@ def main(argv: Optional[List[str]] = None) -> int:
         )
         mfa_provider = lambda: poll_gmail_imap_for_code(cfg.gmail_imap, print_code=args.print_mfa_code)
 
-        groups = portal.discover_loan_groups(
-            headless=not args.headful,
-            storage_state_path=storage_state_path,
-            mfa_code_provider=mfa_provider,
-            mfa_method=cfg.servicer.mfa_method,
-            force_fresh_session=args.fresh_session,
-            slow_mo_ms=args.slowmo_ms,
-            step_debug=args.step_debug,
-            step_delay_ms=args.step_delay_ms,
-            manual_mfa=args.manual_mfa,
-        )
+        with portal:
+            groups = portal.discover_loan_groups(
+                headless=not args.headful,
+                storage_state_path=storage_state_path,
+                mfa_code_provider=mfa_provider,
+                mfa_method=cfg.servicer.mfa_method,
+                force_fresh_session=args.fresh_session,
+                slow_mo_ms=args.slowmo_ms,
+                step_debug=args.step_debug,
+                step_delay_ms=args.step_delay_ms,
+                manual_mfa=args.manual_mfa,
+            )
 
         if not groups:
             print("No loan groups found.")
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import date
 
-from pydantic import BaseModel, Field
 from typing import Optional
 
 
-class LoanSnapshot(BaseModel):
+# Plain frozen dataclasses rather than pydantic models: these are internal value
+# carriers built in loops over groups/payments from already-typed parse results, so
+# they don't need validation machinery. slots=True keeps per-instance memory down on
+# long payment scans, and frozen=True makes them safely hashable.
+
+
+@dataclass(frozen=True, slots=True)
+class LoanSnapshot:
     group: str
 
     principal_balance_cents: int
@@ -21,10 +28,11 @@ class LoanSnapshot(BaseModel):
     # Optional metadata useful for debugging/auditing
     raw_effective_interest_rate: Optional[str] = None
     raw_regulatory_interest_rate: Optional[str] = None
-    scraped_at: date = Field(default_factory=lambda: date.today())
+    scraped_at: date = field(default_factory=lambda: date.today())
 
 
-class PaymentAllocation(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PaymentAllocation:
     payment_date: date
     group: str
 
@@ -47,5 +55,3 @@ class PaymentAllocation(BaseModel):
             str(self.payment_total_cents),
         ]
         return "|".join(parts)
-
-
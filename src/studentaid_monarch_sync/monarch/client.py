@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
 import os
 from decimal import Decimal, ROUND_HALF_UP
@@ -141,6 +142,24 @@ class MonarchClient:
         self._category_cache = None
         self._transactions_cache = {}
         self._student_loan_type_subtype = None
+        self._get_transactions_cursor_support: Optional[bool] = None
+
+    def _supports_transaction_cursor(self) -> bool:
+        """
+        Whether the underlying client's get_transactions accepts a keyset ``cursor``.
+
+        Upstream monarchmoneycommunity (pinned) only pages by offset; newer forks add
+        cursor-based paging, which avoids re-scanning earlier pages server-side. Probe
+        the signature once per client rather than guessing per call.
+        """
+        # getattr: test doubles subclassing MonarchClient may skip __init__ entirely.
+        if getattr(self, "_get_transactions_cursor_support", None) is None:
+            try:
+                params = inspect.signature(self._mm.get_transactions).parameters
+                self._get_transactions_cursor_support = "cursor" in params
+            except Exception:
+                self._get_transactions_cursor_support = False
+        return self._get_transactions_cursor_support
 
     async def login(self) -> None:
         # Ensure the session directory exists (important for commands like list-monarch-accounts).
@@ -423,13 +442,16 @@ class MonarchClient:
         limit: int = 100,
         offset: int = 0,
         search: str = "",
+        cursor: str = "",
     ) -> List[Dict[str, Any]]:
         """
         List transactions for an account, optionally filtered by a date range.
 
         NOTE: Monarch's API requires BOTH start_date and end_date when filtering by date.
+        ``cursor`` (last-seen transaction id) is only honored when the underlying client
+        supports keyset paging; callers should check _supports_transaction_cursor().
         """
-        cache_key = (account_id, start_date_iso or "", end_date_iso or "", int(limit), int(offset), search or "")
+        cache_key = (account_id, start_date_iso or "", end_date_iso or "", int(limit), int(offset), search or "", cursor or "")
         if cache_key in self._transactions_cache:
             return list(self._transactions_cache[cache_key])
 
@@ -439,6 +461,8 @@ class MonarchClient:
             "search": search or "",
             "account_ids": [account_id],
         }
+        if cursor:
+            kwargs["cursor"] = cursor
         if start_date_iso and end_date_iso:
             kwargs["start_date"] = start_date_iso
             kwargs["end_date"] = end_date_iso
@@ -449,6 +473,30 @@ class MonarchClient:
         self._transactions_cache[cache_key] = out
         return list(out)
 
+    async def list_transactions_multi(
+        self,
+        account_ids: List[str],
+        *,
+        max_concurrency: int = 8,
+        **kwargs: Any,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch transactions for several accounts concurrently.
+
+        The sync loop walks one Monarch account per loan group; issuing those reads
+        through a bounded gather overlaps their network latency instead of paying a
+        full round-trip per account. Results map account_id -> transactions, in the
+        order given. Keyword args are forwarded to list_transactions.
+        """
+        sem = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+        async def _one(aid: str) -> tuple[str, List[Dict[str, Any]]]:
+            async with sem:
+                return aid, await self.list_transactions(account_id=aid, **kwargs)
+
+        pairs = await asyncio.gather(*(_one(a) for a in account_ids))
+        return dict(pairs)
+
     async def get_most_recent_transaction(self, *, account_id: str) -> Optional[Dict[str, Any]]:
         """
         Fetch the most recent transaction for an account (best-effort).
@@ -497,14 +545,21 @@ class MonarchClient:
         # date+amount-only match as a fallback to use if no strict hit turns up.
         loose_candidate: Optional[Dict[str, Any]] = None
 
+        # Prefer keyset paging (cursor = last-seen txn id) when the client library
+        # supports it: OFFSET paging makes the server re-scan and re-serialize all
+        # earlier pages on every call, which is O(n^2) across a busy day.
+        use_cursor = self._supports_transaction_cursor()
+        last_id = ""
+
         for page in range(pages):
             txns = await self.list_transactions(
                 account_id=account_id,
                 start_date_iso=start_iso,
                 end_date_iso=end_iso,
                 limit=page_size,
-                offset=page * page_size,
+                offset=0 if use_cursor else page * page_size,
                 search=search_term,
+                cursor=last_id,
             )
 
             for t in txns:
@@ -521,6 +576,10 @@ class MonarchClient:
             # If we didn't fill the page, there are no more results.
             if len(txns) < page_size:
                 break
+            if use_cursor:
+                last_id = str(txns[-1].get("id") or "")
+                if not last_id:
+                    break
 
         if loose_candidate is not None:
             logger.info(
@@ -1,29 +1,289 @@
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import logging
 import json
+import mmap
+import os
+import queue
 import random
 import re
-import shutil
+import string
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dataclasses import dataclass
-from datetime import date, datetime, timezone
+from datetime import date
 from pathlib import Path
 from typing import Callable, Optional
 from urllib.parse import urlparse
 
 from playwright.sync_api import Frame, Page, sync_playwright
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional accelerator, stdlib json works fine
+    _orjson = None
+
 from ..models import LoanSnapshot, PaymentAllocation
 from ..util.dates import parse_us_date
 from ..util.money import money_to_cents
 from ..util.debug_bundle import create_debug_bundle
-from .selectors import PortalSelectors
+from .selectors import PortalSelectors, default_selectors
 
 
 logger = logging.getLogger(__name__)
 
 
+def _write_file_bytes(target: Path, data: bytes) -> None:
+    """
+    Write `data` to `target` with a single os.open/os.write (no Python buffering layer).
+
+    os.write may be interrupted by a signal and return a short count, so loop until
+    every byte is flushed.
+    """
+    fd = os.open(str(target), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+class _CaptureNameTable(dict):
+    """str.translate table: filename-safe chars map to themselves, everything else to "_"."""
+
+    def __missing__(self, code: int) -> str:
+        return "_"
+
+
+_CAPTURE_NAME_TRANS = _CaptureNameTable(
+    {ord(c): c for c in string.ascii_letters + string.digits + "_-"}
+)
+
+
+def _fast_file_copy(src: Path, dst: Path) -> None:
+    """
+    Copy `src` to `dst` atomically (tmp sibling + os.replace), preferring zero-copy
+    syscalls: os.copy_file_range (CoW/reflink on btrfs/xfs, common on NAS deployments)
+    then os.sendfile, with a 256 KiB chunked userspace fallback. On the fast paths the
+    bytes never round-trip through Python.
+    """
+    tmp = dst.with_name(dst.name + ".tmp")
+    with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+        sfd, dfd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(sfd).st_size
+        copied = 0
+        if hasattr(os, "copy_file_range"):
+            try:
+                while copied < size:
+                    n = os.copy_file_range(sfd, dfd, size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError:
+                logger.debug("copy_file_range failed; trying sendfile.", exc_info=True)
+        if copied < size and hasattr(os, "sendfile"):
+            try:
+                while copied < size:
+                    n = os.sendfile(dfd, sfd, copied, size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError:
+                logger.debug("sendfile failed; falling back to chunked copy.", exc_info=True)
+        if copied < size:
+            fsrc.seek(copied)
+            while True:
+                chunk = fsrc.read(256 * 1024)
+                if not chunk:
+                    break
+                fdst.write(chunk)
+    os.replace(tmp, dst)
+
+
+# Hot-path patterns, compiled once at import. Several of these run inside 500ms polling
+# loops; re.compile in the loop body recompiled them hundreds of times per login.
+# NOTE: the login-failure patterns previously used doubled backslashes inside raw
+# strings (r"\\s"), which matched a literal backslash and could never hit real portal
+# text — corrected here.
+_RE_ATTEMPTS_LEFT = re.compile(r"You\s+have\s+(\d+)\s+more\s+attempts?", re.I)
+# One alternation so login-failure classification is a single pass over the body text.
+_RE_LOGIN_FAILURE = re.compile(
+    r"(?P<bad_creds>can\s*'\s*t\s+find\s+the\s+user\s+id\s+and\s+password\s+combination)"
+    r"|(?P<invalid>(?:invalid|incorrect).*(?:user\s*id|username|password))"
+    r"|(?P<locked>account\s+will\s+be\s+locked|account\s+locked|too\s+many\s+attempts)",
+    re.I,
+)
+_RE_LOGIN_BTN = re.compile(r"^\s*log\s*in\s*$", re.I)
+_RE_SIGN_OUT = re.compile(r"sign\s*out", re.I)
+_RE_LOG_OUT = re.compile(r"log\s*out", re.I)
+
+# Loan/payment parsing patterns. These run per loan group and per payment row, so they
+# are compiled once here instead of churning re's internal (pattern, flags) cache.
+_RE_GROUP_HEADER = re.compile(r"Group:\s*([^\n\r]+)", re.I)
+_RE_NEXT_GROUP_HEADER = re.compile(r"\n\s*Group:\s*", re.I)
+_RE_GROUP_TOKEN = re.compile(r"([A-Z0-9][A-Z0-9-]{1,31})", re.I)
+_RE_ZERO_BALANCE = re.compile(r"current balance\s*:\s*\$?\s*0\.00")
+_RE_ZERO_AMOUNT_DUE = re.compile(r"current amount due\s*:\s*\$?\s*0\.00")
+_RE_MONEY_VALUE = re.compile(r"[-+]?\$?\s*[\d,]+\.\d{2}")
+_RE_DATE_ONLY = re.compile(r"^\s*\d{1,2}/\d{1,2}/\d{4}\s*$")
+_RE_DATE_AT_LINE_START = re.compile(r"^(\d{1,2}/\d{1,2}/\d{4})\b")
+_RE_ANY_DATE = re.compile(r"\b\d{1,2}/\d{1,2}/\d{4}\b")
+_RE_PAYMENT_DATE_LABELED = re.compile(r"(Payment\s*Date|Date)\s*:\s*(\d{1,2}/\d{1,2}/\d{4})", re.I)
+_RE_TOTAL_LINE = re.compile(r"^Total\b", re.I)
+_RE_TOTAL_ROW = re.compile(
+    r"^Total\s+\$?([\d,]+\.\d{2})\s+\$?([\d,]+\.\d{2})\s+\$?([\d,]+\.\d{2})\s*$", re.I
+)
+# Group IDs are usually 2-char tokens like "AA", but some servicers render hyphenated IDs
+# like "1-01". Accept hyphens as long as the token starts with an alphanumeric.
+_GROUP_TOKEN_PATTERN = r"[A-Z0-9](?:[A-Z0-9-]{1,15})"
+_RE_GROUP_PREFIXED = re.compile(rf"^(?:Loan\s+Group|Group)\s*:?\s*({_GROUP_TOKEN_PATTERN})\b", re.I)
+_RE_GROUP_PREFIXED_ONLY = re.compile(rf"^(?:Loan\s+Group|Group)\s*:?\s*({_GROUP_TOKEN_PATTERN})\s*$", re.I)
+_RE_GROUP_TOKEN_ONLY = re.compile(_GROUP_TOKEN_PATTERN)
+_RE_PAYMENT_REFS = (
+    re.compile(r"Confirmation\s*Number:\s*([A-Z0-9-]+)", re.I),
+    re.compile(r"Payment\s*ID:\s*([A-Z0-9-]+)", re.I),
+    re.compile(r"Reference:\s*([A-Z0-9-]+)", re.I),
+)
+_RE_GROUP_WORD = re.compile(r"\b(?:Loan\s+Group|Group)\b", re.I)
+_RE_DOLLAR_MONEY = re.compile(r"\$\s*[\d,]+\.\d{2}")
+
+# EdFinancial list-row helpers run per table cell; keep their patterns compiled too.
+_RE_NON_MONEY_CHARS = re.compile(r"[^0-9.]")
+_RE_EDF_GROUP_TOKEN = re.compile(r"\s*(\d+-\d+)")
+_RE_MDY_PREFIX = re.compile(r"\s*(\d{1,2})/(\d{1,2})/(\d{4})")
+
+_RE_ALNUM_RUNS = re.compile(r"[a-z0-9]+")
+_RE_UNSAFE_NAME = re.compile(r"[^a-zA-Z0-9_-]+")
+
+# Classifies an allocation-block line in one scan. The old helper ran four to six
+# substring tests per line; one finditer over this alternation visits each keyword
+# hit once and _classify_alloc_label resolves them with the same priority
+# (principal > interest > total-with-qualifier).
+_RE_ALLOC_LABEL = re.compile(
+    r"(?P<principal>principal)|(?P<interest>interest)|(?P<total_w>total)|(?P<qual>applied|amount|payment)",
+    re.I,
+)
+_RE_TOTAL_EXACT = re.compile(r"Total", re.I)
+
+
+def _split_lines(body_text: str) -> list[str]:
+    """Non-empty stripped lines of a body-text dump, stripping each line only once."""
+    return [s for s in (ln.strip() for ln in (body_text or "").splitlines()) if s]
+
+
+# Strips currency symbol, thousands separators, and whitespace in one C-level pass;
+# one translate call beats the equivalent chain of str.replace on short money strings.
+_MONEY_TRANS = str.maketrans("", "", "$, \t")
+
+
+def _money_amounts(s: str) -> list[int]:
+    """
+    All money values on a line, in cents.
+
+    Streaming finditer with direct integer math: _RE_MONEY_VALUE guarantees exactly
+    two decimal digits, so splitting on the dot avoids a Decimal round-trip per cell.
+    This runs on nearly every line of a payment detail dump.
+    """
+    out: list[int] = []
+    for m in _RE_MONEY_VALUE.finditer(s or ""):
+        t = m.group(0).translate(_MONEY_TRANS)
+        neg = t.startswith("-")
+        t = t.lstrip("+-")
+        dot = t.rindex(".")
+        try:
+            cents = int(t[:dot]) * 100 + int(t[dot + 1 :])
+        except ValueError:
+            continue
+        out.append(-cents if neg else cents)
+    return out
+
+
+def _classify_alloc_label(s: str) -> Optional[str]:
+    saw_interest = saw_total = saw_qual = False
+    for m in _RE_ALLOC_LABEL.finditer(s or ""):
+        k = m.lastgroup
+        if k == "principal":
+            return "principal"
+        if k == "interest":
+            saw_interest = True
+        elif k == "total_w":
+            saw_total = True
+        else:
+            saw_qual = True
+    if saw_interest:
+        return "interest"
+    if saw_total and saw_qual:
+        return "total"
+    return None
+
+# All loan-detail fields in one alternation so _parse_loan_snapshot can pull every
+# value from a single pass over the section text instead of one sweep per label.
+# Each alternative captures into a uniquely named group; dispatch is on m.lastgroup.
+_RE_LOAN_FIELDS = re.compile(
+    r"Principal Balance:\s*(?P<principal>\$?[\d,]+\.\d{2})"
+    r"|Outstanding Balance:\s*(?P<outstanding>\$?[\d,]+\.\d{2})"
+    r"|Total Daily Interest Accrual:\s*(?P<daily>\$?[\d,]+\.\d{2})"
+    # Unpaid accrued interest line includes an "as-of" date embedded; skip to the colon.
+    r"|Unpaid Accrued Interest.*?:\s*(?P<accrued>\$?[\d,]+\.\d{2})"
+    r"|Due Date:\s*(?P<due>\d{1,2}/\d{1,2}/\d{4})"
+    r"|Last Payment Received:\s*(?P<lp_amount>\$?[\d,]+\.\d{2})\s+on\s+(?P<lp_date>\d{1,2}/\d{1,2}/\d{4})"
+    r"|Effective Interest Rate:\s*(?P<eff_rate>[^\n\r]+)"
+    r"|Regulatory Interest Rate:\s*(?P<reg_rate>[^\n\r]+)"
+)
+
+
+@lru_cache(maxsize=64)
+def _group_section_start_pattern(group: str) -> "re.Pattern[str]":
+    return re.compile(rf"Group:\s*{re.escape(group)}\b", re.I)
+
+
+@lru_cache(maxsize=64)
+def _escaped_ci_pattern(text: str) -> "re.Pattern[str]":
+    """Compiled case-insensitive literal-match pattern, cached per text."""
+    return re.compile(re.escape(text), re.I)
+
+
+@lru_cache(maxsize=128)
+def _exact_line_pattern(text: str) -> "re.Pattern[str]":
+    """Whole-string literal match allowing surrounding whitespace, cached per text."""
+    return re.compile(rf"^\s*{re.escape(text)}\s*$")
+
+
+@lru_cache(maxsize=32)
+def _token_alternation_pattern(tokens: tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Word-bounded alternation of literal tokens, cached per token set.
+
+    Callers pass tokens pre-sorted longest-first; the configured group set is stable
+    across a run, so this compiles once per session instead of once per call.
+    """
+    return re.compile(r"\b(" + "|".join(map(re.escape, tokens)) + r")\b")
+
+
+def _json_loads_bytes(raw: bytes):
+    """
+    Parse JSON straight from bytes, via orjson when installed (2-6x faster on the
+    dict-heavy storage_state payloads, no intermediate str allocation).
+    """
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _sanitize_capture_name(s: str) -> str:
+    """
+    Filename-safe capture name. str.translate with a precomputed table is ~10x faster
+    than the regex-sub equivalent, and this runs on every captured navigation.
+    """
+    return (s or "").translate(_CAPTURE_NAME_TRANS).strip("_")[:80] or "page"
+
+
 class LoginFormNotFoundError(RuntimeError):
     """
     Raised when we cannot locate the portal login form (username field) after trying common entry points.
@@ -61,11 +321,18 @@ class ServicerPortalClient:
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.creds = creds
-        self.selectors = selectors or PortalSelectors()
+        self.selectors = selectors or default_selectors()
 
         parsed = urlparse(self.base_url)
         self._canonical_host = (parsed.netloc or "").strip().lower()
         self._dark_host = f"dark.{self._canonical_host}" if self._canonical_host else ""
+        # Chromium-level fix for the broken dark-host redirect; computed once so both
+        # launch paths (shared browser and persistent profile) stay in sync.
+        self._host_resolver_rule = (
+            f"--host-resolver-rules=MAP {self._dark_host} {self._canonical_host}"
+            if self._dark_host and self._canonical_host
+            else ""
+        )
         # Provider slug derived from host (e.g. "edfinancial" from edfinancial.studentaid.gov).
         # Used to gate provider-specific behavior so other servicers are unaffected.
         self.provider = self._canonical_host.split(".")[0] if self._canonical_host else ""
@@ -76,9 +343,94 @@ class ServicerPortalClient:
         self._step_counter: int = 0
         self._step_delay_ms: int = 0
 
+        # Rate limit for step screenshots: when the URL hasn't changed and the last shot is
+        # recent, skip the PNG encode + disk write entirely (long flows fire hundreds of steps,
+        # most of them visually redundant).
+        try:
+            self._step_min_interval_ms: int = int(os.environ.get("PORTAL_STEP_MIN_INTERVAL_MS", "250"))
+        except ValueError:
+            self._step_min_interval_ms = 250
+        self._last_step_url: str = ""
+        self._last_step_ns: int = 0
+
+        # Step screenshots are captured synchronously (the shot must see the page as it
+        # is at that breadcrumb) but encoded as viewport JPEGs and written to disk on a
+        # background thread, keeping the ~20ms file write off the navigation critical
+        # path. Opt out with PORTAL_DEBUG_ASYNC=0 for strictly synchronous writes.
+        self._debug_async: bool = (
+            os.environ.get("PORTAL_DEBUG_ASYNC", "1").strip().lower() not in ("0", "false", "no")
+        )
+        self._debug_write_queue: "queue.Queue[Optional[tuple[Path, bytes]]]" = queue.Queue()
+        self._debug_writer: Optional[threading.Thread] = None
+        # Full-page capture scroll-composites the whole document — seconds and tens of
+        # MB on a long Payment Activity page — so failure dumps default to the viewport
+        # too. PORTAL_DEBUG_FULL_PAGE=1 restores whole-page captures when needed.
+        self._debug_full_page: bool = (
+            os.environ.get("PORTAL_DEBUG_FULL_PAGE", "0").strip().lower() in ("1", "true", "yes")
+        )
+
+        # When the Payment Activity list already renders per-group allocation columns,
+        # parse them straight off the list and skip the open/parse/close navigation per
+        # row. Opt out with PORTAL_SCRAPE_PAYMENT_LIST_INLINE=0 if a portal's list
+        # columns turn out to disagree with its detail view.
+        self._scrape_payment_list_inline: bool = (
+            os.environ.get("PORTAL_SCRAPE_PAYMENT_LIST_INLINE", "1").strip().lower()
+            not in ("0", "false", "no")
+        )
+
         # Tracks whether _launch_browser used a real Chrome channel (affects UA override logic).
         self._using_real_chrome_channel: bool = False
 
+        # Long-lived Playwright driver + browser, created lazily by _ensure_browser.
+        # Browser startup dominates session cost while contexts are near-free, so
+        # discover_loan_groups followed by extract shares one Chromium process.
+        self._pw = None
+        self._browser = None
+        self._browser_headless: Optional[bool] = None
+        self._browser_slow_mo: int = 0
+
+        # Chromium channel resolved by the first successful headless launch
+        # ("chrome"/"msedge"/None for bundled). Cached so retries, relaunches and the
+        # parallel worker go straight to the channel that works instead of paying for
+        # failed launch attempts down the fallback chain.
+        self._chromium_channel: Optional[str] = None
+        self._chromium_channel_resolved: bool = False
+
+        # Persistent Chromium profile context (keeps the HTTP disk cache warm across runs).
+        self._persistent_ctx = None
+        self._persistent_ctx_key: Optional[tuple] = None
+        self._persistent_ctx_closed: bool = False
+
+        # Parsed storage_state cache: ((path, mtime, size), data). Lets retry attempts
+        # reuse the parsed dict instead of re-reading the JSON file.
+        self._loaded_storage_state: Optional[tuple[tuple[str, float, int], dict]] = None
+
+        # Short-TTL memo of page-classification signals: id(page) -> (monotonic_ns, signals).
+        self._page_signals_cache: dict[int, tuple[int, dict]] = {}
+
+        # Cookie-banner negative cache: id(page) -> remaining calls to skip. A completed
+        # dismissal pass grants skip credits so polling loops don't re-pay the scan every
+        # 500ms tick; re-injected banners are caught when the credits run out.
+        self._banner_skip_credits: dict[int, int] = {}
+
+        # Body-text cache: id(page) -> (dom fingerprint, text). Several heuristics read
+        # the full rendered body text against the same DOM state; see _body_text.
+        self._body_text_cache: dict[int, tuple[str, str]] = {}
+
+        # Memoized token/label indexes for the last group-sections list, so matching G
+        # configured groups is G dict lookups instead of G full scans.
+        self._section_index_memo: Optional[tuple[object, tuple[dict, dict]]] = None
+
+        # Parsed payment-detail allocations keyed by (body digest, date, groups);
+        # see _parse_payment_allocations. Bounded like the other per-run memos.
+        self._alloc_parse_memo: dict[tuple, list[PaymentAllocation]] = {}
+
+        # Whether page.go_back() reliably returns from a payment detail to the Payment
+        # Activity list (bfcache restore — no server round-trip). Assumed true until a
+        # back attempt lands somewhere without list rows; after that the explicit
+        # close/renavigate path is used for the rest of the session.
+        self._history_back_ok: bool = True
+
     # ------------------------------------------------------------------
     # Shared browser bootstrap helpers (browser-compatibility hardened)
     # ------------------------------------------------------------------
@@ -87,6 +439,33 @@ class ServicerPortalClient:
         "--disable-blink-features=AutomationControlled",
     ]
 
+    # Extra flags for unattended (headless) runs only: trim background services and
+    # memory that a scrape never benefits from. Kept out of headful browse-portal so
+    # manual debugging sees stock browser behavior.
+    _HEADLESS_LAUNCH_ARGS = [
+        "--disable-dev-shm-usage",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-default-apps",
+        "--disable-features=Translate,BackForwardCache",
+    ]
+
+    # High-volume third-party noise we never need for scraping. Blocked at the CDP layer
+    # (Network.setBlockedURLs) instead of ctx.route(): installing any route() handler forces
+    # Network.setCacheDisabled on Chromium, so every navigation refetches JS/CSS/images.
+    # Images stay unblocked so debug screenshots remain representative.
+    _CDP_BLOCKED_URL_PATTERNS = (
+        "*googletagmanager.com*",
+        "*google-analytics.com*",
+        "*analytics.google.com*",
+        "*doubleclick.net*",
+        "*connect.facebook.net*",
+        "*hotjar.com*",
+        "*.woff",
+        "*.woff2",
+        "*.ttf",
+    )
+
     _BROWSER_COMPAT_INIT_SCRIPT = r"""
     (() => {
       // Mask navigator.webdriver
@@ -162,20 +541,22 @@ class ServicerPortalClient:
     })();
     """
 
+    # Dismiss the Transcend consent manager as soon as its host element is injected.
+    #
+    # Deliberately cheap: the mutation observer watches only direct children of <body>
+    # (no subtree), coalesces bursts of mutations into one microtask, bails immediately
+    # when the host element is absent, and disconnects once the banner is handled. The
+    # old version re-ran querySelectorAll('button') + a body.innerText regex on every DOM
+    # mutation, which on a SPA meant thousands of invocations per navigation. Generic
+    # (non-Transcend) banners are still handled Python-side by _dismiss_cookie_banner.
     _CONSENT_DISMISS_SCRIPT = """
     (() => {
       const dismiss = () => {
-        try {
-          const accept = Array.from(document.querySelectorAll('button'))
-            .find(b => /accept\\s+all/i.test((b.textContent || '').trim()));
-          if (accept && /this\\s+site\\s+uses\\s+cookies/i.test(document.body?.innerText || '')) {
-            accept.click();
-          }
-        } catch (_) {}
+        const host = document.getElementById('transcend-consent-manager');
+        if (!host) return false;
 
         try {
-          const host = document.getElementById('transcend-consent-manager');
-          const root = host && host.shadowRoot;
+          const root = host.shadowRoot;
           if (root) {
             const accept = Array.from(root.querySelectorAll('button'))
               .find(b => /accept\\s+all/i.test((b.textContent || '').trim()));
@@ -184,21 +565,70 @@ class ServicerPortalClient:
         } catch (_) {}
 
         try {
-          const host = document.getElementById('transcend-consent-manager');
-          if (host) {
-            host.style.setProperty('display', 'none', 'important');
-            host.style.setProperty('pointer-events', 'none', 'important');
-          }
+          host.style.setProperty('display', 'none', 'important');
+          host.style.setProperty('pointer-events', 'none', 'important');
         } catch (_) {}
+        return true;
       };
 
-      try {
-        dismiss();
-        new MutationObserver(() => dismiss()).observe(document.documentElement, { childList: true, subtree: true });
-      } catch (_) {}
+      let pending = false;
+      let done = false;
+      const observer = new MutationObserver(() => {
+        if (pending || done) return;
+        pending = true;
+        queueMicrotask(() => {
+          pending = false;
+          if (done) return;
+          if (dismiss()) {
+            done = true;
+            try { observer.disconnect(); } catch (_) {}
+          }
+        });
+      });
+
+      const start = () => {
+        try {
+          if (dismiss()) { done = true; return; }
+          observer.observe(document.body || document.documentElement, { childList: true });
+        } catch (_) {}
+      };
+      if (document.body) start();
+      else document.addEventListener('DOMContentLoaded', start, { once: true });
     })();
     """
 
+    # Phrase-major order keeps the "Accept all" preference; the body-text gate stops us
+    # clicking random "OK"/"Agree" buttons on pages with no banner.
+    _CONSENT_CLICK_PHRASES = ("accept all", "accept", "i agree", "agree", "got it", "ok")
+
+    _CONSENT_CLICK_JS = """
+    (phrases) => {
+      const bodyText = ((document.body && document.body.innerText) || '').toLowerCase();
+      if (!bodyText.includes('this site uses cookies')) return false;
+      const els = Array.from(document.querySelectorAll('button, [role="button"], a'));
+      for (const p of phrases) {
+        for (const el of els) {
+          if (((el.innerText || '').trim().toLowerCase()).includes(p)) {
+            el.click();
+            return true;
+          }
+        }
+      }
+      return false;
+    }
+    """
+
+    def _headless_channel_candidates(self) -> tuple[Optional[str], ...]:
+        """Channels to try for a headless launch; collapses to the cached winner once resolved."""
+        if self._chromium_channel_resolved:
+            return (self._chromium_channel,)
+        return ("chrome", "msedge", None)
+
+    def _remember_chromium_channel(self, channel: Optional[str]) -> None:
+        self._chromium_channel = channel
+        self._chromium_channel_resolved = True
+        self._using_real_chrome_channel = channel is not None
+
     def _launch_browser(self, p, *, headless: bool, slow_mo: int):
         """
         Launch Chromium with anti-detection defaults.
@@ -207,24 +637,35 @@ class ServicerPortalClient:
         `--headless=new` and using `headless=False` at Playwright level.
         """
         args = list(self._BROWSER_COMPAT_LAUNCH_ARGS)
+        # Resolve the occasionally-seen "dark" host back to the canonical host at the DNS layer.
+        # This replaces the old ctx.route() URL rewrite, which disabled Chromium's HTTP cache
+        # for the whole context just to cover this rare redirect.
+        if self._host_resolver_rule:
+            args.append(self._host_resolver_rule)
         launch_headless = bool(headless)
         if headless:
             args.append("--headless=new")
+            args.extend(self._HEADLESS_LAUNCH_ARGS)
             launch_headless = False
 
         launch_kwargs = dict(headless=launch_headless, slow_mo=slow_mo, args=args)
 
         if headless:
-            for channel in ("chrome", "msedge", None):
+            for channel in self._headless_channel_candidates():
                 try:
                     kw = {**launch_kwargs}
                     if channel is not None:
                         kw["channel"] = channel
                     browser = p.chromium.launch(**kw)
-                    self._using_real_chrome_channel = channel is not None
+                    self._remember_chromium_channel(channel)
                     return browser
                 except Exception:
                     continue
+            if self._chromium_channel_resolved:
+                # The cached channel stopped working (browser updated/uninstalled?);
+                # re-probe the full chain once.
+                self._chromium_channel_resolved = False
+                return self._launch_browser(p, headless=headless, slow_mo=slow_mo)
             raise RuntimeError("Could not launch any Chromium-based browser (tried chrome, msedge, bundled).")
 
         try:
@@ -245,11 +686,96 @@ class ServicerPortalClient:
                     continue
             raise
 
-    def _create_browser_context(self, browser, *, storage_state: Optional[str] = None):
+    def _ensure_browser(self, *, headless: bool, slow_mo: int):
         """
-        Create a browser context with realistic fingerprint settings.
+        Return a launched browser, reusing the current one when its launch options match.
+
+        Callers still create a fresh context per run (isolation is near-free); only the
+        expensive Chromium launch is shared across extract/discover calls.
         """
-        ctx_kwargs: dict = {
+        if self._browser is not None:
+            try:
+                connected = bool(self._browser.is_connected())
+            except Exception:
+                connected = False
+            if (
+                connected
+                and self._browser_headless == bool(headless)
+                and self._browser_slow_mo == int(slow_mo)
+            ):
+                return self._browser
+            self._close_browser()
+
+        if self._pw is None:
+            self._pw = sync_playwright().start()
+        self._browser = self._launch_browser(self._pw, headless=headless, slow_mo=slow_mo)
+        self._browser_headless = bool(headless)
+        self._browser_slow_mo = int(slow_mo)
+        return self._browser
+
+    def _close_browser(self) -> None:
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                logger.debug("Failed to close shared browser.", exc_info=True)
+            self._browser = None
+        self._browser_headless = None
+
+    def close(self) -> None:
+        """Dispose the shared browser/profile and Playwright driver (safe to call repeatedly)."""
+        self._close_persistent_context()
+        self._close_browser()
+        if self._pw is not None:
+            try:
+                self._pw.stop()
+            except Exception:
+                logger.debug("Failed to stop Playwright driver.", exc_info=True)
+            self._pw = None
+        self._drain_debug_writes()
+
+    def _queue_debug_write(self, path: Path, data: bytes) -> None:
+        """Hand a debug artifact to the background writer (or write inline when disabled)."""
+        if not self._debug_async:
+            _write_file_bytes(path, data)
+            return
+        if self._debug_writer is None or not self._debug_writer.is_alive():
+            self._debug_writer = threading.Thread(
+                target=self._debug_writer_loop, name="portal-debug-writer", daemon=True
+            )
+            self._debug_writer.start()
+        self._debug_write_queue.put((path, data))
+
+    def _debug_writer_loop(self) -> None:
+        while True:
+            item = self._debug_write_queue.get()
+            if item is None:
+                return
+            path, data = item
+            try:
+                _write_file_bytes(path, data)
+            except Exception:
+                logger.debug("Background debug write failed (path=%s).", path, exc_info=True)
+
+    def _drain_debug_writes(self) -> None:
+        """Flush queued debug writes and stop the writer thread (safe to call repeatedly)."""
+        writer = self._debug_writer
+        if writer is None or not writer.is_alive():
+            self._debug_writer = None
+            return
+        self._debug_write_queue.put(None)
+        writer.join(timeout=10)
+        self._debug_writer = None
+
+    def __enter__(self) -> "ServicerPortalClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _context_fingerprint_kwargs(self) -> dict:
+        """Realistic fingerprint settings shared by ephemeral contexts and persistent profiles."""
+        return {
             "user_agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -260,29 +786,242 @@ class ServicerPortalClient:
             "locale": "en-US",
             "extra_http_headers": {"Accept-Language": "en-US,en;q=0.9"},
         }
+
+    def _create_browser_context(self, browser, *, storage_state: Optional[str] = None):
+        """
+        Create a browser context with realistic fingerprint settings.
+        """
+        ctx_kwargs: dict = self._context_fingerprint_kwargs()
         if storage_state:
             ctx_kwargs["storage_state"] = storage_state
 
         return browser.new_context(**ctx_kwargs)
 
-    def _install_context_hooks(self, ctx) -> None:
+    def _profile_dir_for(self, state_path: Optional[Path]) -> Optional[Path]:
+        """
+        Directory of the persistent Chromium profile for this servicer
+        (e.g. data/servicer_storage_state_nelnet_profile).
+
+        A real profile keeps Chromium's HTTP cache on disk, so repeat runs load the portal's
+        JS/CSS mostly from cache instead of refetching everything. Returns None when no
+        storage path is configured or PORTAL_PERSISTENT_PROFILE is disabled.
         """
-        Install route rewrites, browser compatibility patches, and consent-manager dismissal on a browser context.
+        if state_path is None:
+            return None
+        if os.environ.get("PORTAL_PERSISTENT_PROFILE", "1").strip().lower() in ("0", "false", "no"):
+            return None
+        return state_path.with_name(state_path.stem + "_profile")
+
+    def _launch_persistent_context(self, p, *, user_data_dir: Path, headless: bool, slow_mo: int):
+        """
+        Launch a persistent context rooted at `user_data_dir` (same channel fallbacks as
+        `_launch_browser`, same fingerprint settings as `_create_browser_context`).
         """
-        # Rewrite the occasionally-seen "dark" host back to the canonical host.
+        args = list(self._BROWSER_COMPAT_LAUNCH_ARGS)
+        if self._host_resolver_rule:
+            args.append(self._host_resolver_rule)
+        launch_headless = bool(headless)
+        if headless:
+            args.append("--headless=new")
+            args.extend(self._HEADLESS_LAUNCH_ARGS)
+            launch_headless = False
+
+        launch_kwargs = dict(
+            headless=launch_headless,
+            slow_mo=slow_mo,
+            args=args,
+            **self._context_fingerprint_kwargs(),
+        )
+
+        if headless:
+            for channel in self._headless_channel_candidates():
+                try:
+                    kw = {**launch_kwargs}
+                    if channel is not None:
+                        kw["channel"] = channel
+                    ctx = p.chromium.launch_persistent_context(str(user_data_dir), **kw)
+                    self._remember_chromium_channel(channel)
+                    return ctx
+                except Exception:
+                    continue
+            if self._chromium_channel_resolved:
+                # The cached channel stopped working (browser updated/uninstalled?);
+                # re-probe the full chain once.
+                self._chromium_channel_resolved = False
+                return self._launch_persistent_context(
+                    p, user_data_dir=user_data_dir, headless=headless, slow_mo=slow_mo
+                )
+            raise RuntimeError("Could not launch any Chromium-based browser (tried chrome, msedge, bundled).")
+
         try:
-            if self._dark_host and self._canonical_host:
-                def _rewrite(route, request) -> None:
-                    url = request.url
-                    fixed = url.replace(f"://{self._dark_host}", f"://{self._canonical_host}")
-                    route.continue_(url=fixed)
+            ctx = p.chromium.launch_persistent_context(str(user_data_dir), **launch_kwargs)
+            self._using_real_chrome_channel = False
+            return ctx
+        except Exception as e:
+            msg = str(e)
+            if "Executable doesn't exist" not in msg and "Executable doesn't exist at" not in msg:
+                raise
+            logger.warning("Playwright Chromium executable missing; falling back to system browser channel. (%s)", msg)
+            for channel in ("chrome", "msedge"):
+                try:
+                    ctx = p.chromium.launch_persistent_context(str(user_data_dir), **{**launch_kwargs, "channel": channel})
+                    self._using_real_chrome_channel = True
+                    return ctx
+                except Exception:
+                    continue
+            raise
+
+    def _ensure_persistent_context(self, *, user_data_dir: Path, headless: bool, slow_mo: int):
+        """
+        Return the long-lived persistent context, launching (or relaunching) it as needed.
+
+        Context hooks are installed once here; per-run callers must not re-install them.
+        """
+        key = (str(user_data_dir), bool(headless), int(slow_mo))
+        if self._persistent_ctx is not None:
+            if self._persistent_ctx_key == key and not self._persistent_ctx_closed:
+                return self._persistent_ctx
+            self._close_persistent_context()
+
+        if self._pw is None:
+            self._pw = sync_playwright().start()
+
+        user_data_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            ctx = self._launch_persistent_context(
+                self._pw, user_data_dir=user_data_dir, headless=headless, slow_mo=slow_mo
+            )
+        except Exception as e:
+            # A corrupted profile can fail the launch outright; quarantine it (like we do for
+            # corrupt storage_state JSON) and retry once with a fresh profile.
+            logger.warning(
+                "Failed to launch persistent browser profile; quarantining and retrying with a fresh one. (%s)", e
+            )
+            self._quarantine_file(user_data_dir, prefix="profile")
+            user_data_dir.mkdir(parents=True, exist_ok=True)
+            ctx = self._launch_persistent_context(
+                self._pw, user_data_dir=user_data_dir, headless=headless, slow_mo=slow_mo
+            )
+
+        self._install_context_hooks(ctx)
+        self._persistent_ctx = ctx
+        self._persistent_ctx_key = key
+        self._persistent_ctx_closed = False
+        try:
+            ctx.on("close", lambda _=None: setattr(self, "_persistent_ctx_closed", True))
+        except Exception:
+            pass
+        return ctx
+
+    def _close_persistent_context(self) -> None:
+        if self._persistent_ctx is not None:
+            try:
+                self._persistent_ctx.close()
+            except Exception:
+                logger.debug("Failed to close persistent context.", exc_info=True)
+            self._persistent_ctx = None
+            self._persistent_ctx_key = None
+
+    def _dispose_run_context(self, ctx) -> None:
+        """
+        Close a per-run context. The shared persistent context stays alive (its on-disk cache
+        is the whole point); we only close its pages.
+        """
+        if ctx is not None and ctx is self._persistent_ctx:
+            for pg in list(getattr(ctx, "pages", []) or []):
+                try:
+                    pg.close()
+                except Exception:
+                    pass
+            return
+        try:
+            ctx.close()
+        except Exception:
+            logger.debug("Failed to close run context.", exc_info=True)
+
+    def _context_for_attempt(
+        self,
+        *,
+        attempt_idx: int,
+        force_fresh_session: bool,
+        state_path: Optional[Path],
+        profile_dir: Optional[Path],
+        browser,
+        headless: bool,
+        slow_mo: int,
+    ):
+        """
+        Build the browser context for one login attempt.
+
+        Returns (ctx, use_storage). With a persistent profile the cookies live in the profile
+        itself, so a fresh-session attempt clears them (keeping the HTTP cache warm) instead of
+        skipping a storage_state file.
+        """
+        use_storage = attempt_idx == 0 and not force_fresh_session
+
+        if profile_dir is not None:
+            ctx = self._ensure_persistent_context(
+                user_data_dir=profile_dir, headless=headless, slow_mo=slow_mo
+            )
+            if not use_storage:
+                try:
+                    ctx.clear_cookies()
+                except Exception:
+                    logger.debug("Failed to clear cookies on persistent context.", exc_info=True)
+            return ctx, use_storage
 
-                ctx.route(
-                    re.compile(rf".*://{re.escape(self._dark_host)}/.*", re.I),
-                    _rewrite,
+        use_storage = use_storage and state_path is not None and state_path.exists()
+
+        # Self-heal: if the persisted Playwright storage_state JSON is corrupted, quarantine it and
+        # fall back to a fresh session (or restore from .bak if available). The validator returns
+        # the parsed dict, which we pass directly so the driver doesn't re-parse the file.
+        storage: Optional[dict] = None
+        if use_storage and state_path is not None:
+            storage = self._validate_or_restore_storage_state(state_path)
+        use_storage = storage is not None
+
+        try:
+            ctx = self._create_browser_context(browser, storage_state=storage)
+        except Exception as e:
+            # If storage_state is invalid/corrupt, Playwright can fail before we ever get a Page.
+            if use_storage and state_path is not None:
+                logger.warning(
+                    "Failed to create browser context with stored session; falling back to fresh session. (%s)",
+                    e,
                 )
+                self._quarantine_file(state_path, prefix="storage_state")
+                use_storage = False
+                ctx = self._create_browser_context(browser, storage_state=None)
+            else:
+                raise
+
+        self._install_context_hooks(ctx)
+        return ctx, use_storage
+
+    def _install_context_hooks(self, ctx) -> None:
+        """
+        Install request blocking, browser compatibility patches, and consent-manager dismissal on a browser context.
+
+        This is the single install point for every context we create (extract, discovery,
+        browse-portal, persistent profile, parallel worker) — don't re-grow per-call-site
+        copies; they drift.
+
+        The dark-host fix lives in `_launch_browser` (--host-resolver-rules) so we never need a
+        route() handler here — route() would disable the HTTP cache for the whole context.
+        """
+        # Block analytics/fonts per page over CDP; unlike route(), this keeps the cache enabled.
+        def _install_page_request_blocking(page) -> None:
+            try:
+                session = ctx.new_cdp_session(page)
+                session.send("Network.enable")
+                session.send("Network.setBlockedURLs", {"urls": list(self._CDP_BLOCKED_URL_PATTERNS)})
+            except Exception:
+                logger.debug("Failed to install CDP request blocking.", exc_info=True)
+
+        try:
+            ctx.on("page", _install_page_request_blocking)
         except Exception:
-            logger.debug("Failed to install dark-host rewrite route.", exc_info=True)
+            logger.debug("Failed to hook context page event for request blocking.", exc_info=True)
 
         ctx.add_init_script(self._BROWSER_COMPAT_INIT_SCRIPT)
         ctx.add_init_script(self._CONSENT_DISMISS_SCRIPT)
@@ -291,6 +1030,54 @@ class ServicerPortalClient:
         """Inject a small randomized delay to mimic human interaction timing."""
         page.wait_for_timeout(random.randint(min_ms, max_ms))
 
+    # Cap for body-text debug dumps (256 KiB). `page.inner_text("body")` serializes the whole
+    # rendered DOM text — multi-MB on large loan pages — so we slice inside the browser to keep
+    # the CDP payload small. Nobody reads a .txt dump past the first few hundred KB anyway.
+    _BODY_TEXT_DUMP_MAX_CHARS = 262_144
+
+    def _body_text_snapshot(self, page: Page) -> str:
+        """
+        Rendered body text for debug artifacts, truncated browser-side before it crosses the
+        CDP boundary (avoids shipping megabytes over the WebSocket for a debug dump).
+        """
+        return page.evaluate(
+            "(max) => (document.body && document.body.innerText ? document.body.innerText.slice(0, max) : '')",
+            self._BODY_TEXT_DUMP_MAX_CHARS,
+        )
+
+    def _body_text(self, page: Page) -> str:
+        """
+        Full rendered body text, cached per DOM state.
+
+        page.inner_text("body") serializes everything over CDP (megabytes on long payment
+        pages), and several heuristics want it against the same unchanged DOM. A cheap
+        in-browser fingerprint (URL + body child count + scroll height) decides whether
+        the cached copy is still valid, so repeated reads cost one tiny evaluate instead
+        of another full serialization. Navigation or DOM churn changes the fingerprint,
+        which invalidates naturally — no explicit invalidation hooks needed.
+        """
+        try:
+            fp = page.evaluate(
+                "() => location.href + ':' + (document.body ? document.body.childElementCount : -1)"
+                " + ':' + (document.body ? document.body.scrollHeight : -1)"
+            )
+        except Exception:
+            fp = None
+        pid = id(page)
+        if fp is not None:
+            cached = self._body_text_cache.get(pid)
+            if cached is not None and cached[0] == fp:
+                return cached[1]
+        try:
+            text = page.inner_text("body")
+        except Exception:
+            text = ""
+        if fp is not None:
+            if len(self._body_text_cache) >= 8:
+                self._body_text_cache.clear()
+            self._body_text_cache[pid] = (fp, text)
+        return text
+
     def extract(
         self,
         *,
@@ -310,6 +1097,7 @@ class ServicerPortalClient:
         step_delay_ms: int = 0,
         manual_mfa: bool = False,
         allow_empty_loans: bool = False,
+        parallel_sections: bool = True,
     ) -> tuple[list[LoanSnapshot], list[PaymentAllocation]]:
         # Configure per-run step logging/debug behavior.
         self._step_log_enabled = bool(step_debug or log_steps)
@@ -320,113 +1108,106 @@ class ServicerPortalClient:
         state_path = Path(storage_state_path) if storage_state_path else None
         Path(debug_dir).mkdir(parents=True, exist_ok=True)
 
-        def _install_context_hooks(ctx) -> None:
-            # Keep local callsites unchanged while delegating to the shared implementation.
-            self._install_context_hooks(ctx)
+        # With a persistent profile, Chromium's disk cache (and cookies) survive across runs;
+        # otherwise fall back to a shared browser with ephemeral contexts.
+        profile_dir = self._profile_dir_for(state_path)
+        browser = None
+        if profile_dir is None:
+            browser = self._ensure_browser(headless=headless, slow_mo=int(slow_mo_ms or 0))
+
+        # Attempt 1: reuse stored session (unless force_fresh_session).
+        # Attempt 2: fresh session (no stored cookies) — helpful when stored state causes
+        # weird redirects (e.g. `dark.<provider>.studentaid.gov`) or other edge cases.
+        attempts = 1 if force_fresh_session else 2
+
+        for attempt_idx in range(attempts):
+            ctx, use_storage = self._context_for_attempt(
+                attempt_idx=attempt_idx,
+                force_fresh_session=force_fresh_session,
+                state_path=state_path,
+                profile_dir=profile_dir,
+                browser=browser,
+                headless=headless,
+                slow_mo=int(slow_mo_ms or 0),
+            )
 
-        with sync_playwright() as p:
-            browser = self._launch_browser(p, headless=headless, slow_mo=int(slow_mo_ms or 0))
+            page = ctx.new_page()
             try:
-                # Attempt 1: reuse stored session (unless force_fresh_session).
-                # Attempt 2: fresh session (no stored cookies) — helpful when stored state causes
-                # weird redirects (e.g. `dark.<provider>.studentaid.gov`) or other edge cases.
-                attempts = 1 if force_fresh_session else 2
-
-                for attempt_idx in range(attempts):
-                    use_storage = (
-                        attempt_idx == 0
-                        and not force_fresh_session
-                        and state_path is not None
-                        and state_path.exists()
-                    )
-
-                    # Self-heal: if the persisted Playwright storage_state JSON is corrupted, quarantine it and
-                    # fall back to a fresh session (or restore from .bak if available).
-                    if use_storage and state_path is not None:
-                        use_storage = self._validate_or_restore_storage_state(state_path)
-
-                    storage = str(state_path) if use_storage else None
-
-                    ctx = None
-                    try:
-                        ctx = self._create_browser_context(browser, storage_state=storage)
-                    except Exception as e:
-                        # If storage_state is invalid/corrupt, Playwright can fail before we ever get a Page.
-                        if use_storage and state_path is not None:
-                            logger.warning(
-                                "Failed to create browser context with stored session; falling back to fresh session. (%s)",
-                                e,
-                            )
-                            self._quarantine_file(state_path, prefix="storage_state")
-                            use_storage = False
-                            ctx = self._create_browser_context(browser, storage_state=None)
-                        else:
-                            raise
-
-                    _install_context_hooks(ctx)
+                self._step(page, debug_dir=debug_dir, name=f"start_attempt_{attempt_idx+1}")
+                self._login(
+                    page,
+                    mfa_code_provider=mfa_code_provider,
+                    mfa_method=mfa_method,
+                    debug_dir=debug_dir,
+                    manual_mfa=manual_mfa,
+                )
 
-                    page = ctx.new_page()
-                    try:
-                        self._step(page, debug_dir=debug_dir, name=f"start_attempt_{attempt_idx+1}")
-                        self._login(
-                            page,
-                            mfa_code_provider=mfa_code_provider,
-                            mfa_method=mfa_method,
-                            debug_dir=debug_dir,
-                            manual_mfa=manual_mfa,
-                        )
+                # Persist session state to reduce MFA prompts (best-effort).
+                if state_path is not None:
+                    self._export_storage_state(ctx, state_path)
 
-                        # Persist session state to reduce MFA prompts (best-effort).
-                        if state_path is not None:
-                            state_path.parent.mkdir(parents=True, exist_ok=True)
-                            ctx.storage_state(path=str(state_path))
-                            self._backup_storage_state(state_path)
-
-                        if skip_loans:
-                            logger.info("Skipping loan details extraction (--skip-loans).")
-                            loans: list[LoanSnapshot] = []
-                        else:
-                            loans = self._extract_loans(
-                                page,
-                                groups=groups,
-                                debug_dir=debug_dir,
-                                allow_empty_loans=bool(allow_empty_loans),
-                            )
-                        payments = self._extract_payment_allocations(
-                            page,
-                            groups=groups,
-                            debug_dir=debug_dir,
-                            max_payments_to_scan=max_payments_to_scan,
-                            payments_since=payments_since,
-                            expected_groups=set(groups) if groups else None,
+                if skip_loans:
+                    logger.info("Skipping loan details extraction (--skip-loans).")
+                    loans: list[LoanSnapshot] = []
+                    payments = self._extract_payment_allocations(
+                        page,
+                        groups=groups,
+                        debug_dir=debug_dir,
+                        max_payments_to_scan=max_payments_to_scan,
+                        payments_since=payments_since,
+                        expected_groups=set(groups) if groups else None,
+                    )
+                elif parallel_sections and state_path is not None:
+                    loans, payments = self._extract_sections_parallel(
+                        page,
+                        groups=groups,
+                        debug_dir=debug_dir,
+                        max_payments_to_scan=max_payments_to_scan,
+                        payments_since=payments_since,
+                        allow_empty_loans=bool(allow_empty_loans),
+                        state_path=state_path,
+                        headless=headless,
+                    )
+                else:
+                    loans = self._extract_loans(
+                        page,
+                        groups=groups,
+                        debug_dir=debug_dir,
+                        allow_empty_loans=bool(allow_empty_loans),
+                    )
+                    payments = self._extract_payment_allocations(
+                        page,
+                        groups=groups,
+                        debug_dir=debug_dir,
+                        max_payments_to_scan=max_payments_to_scan,
+                        payments_since=payments_since,
+                        expected_groups=set(groups) if groups else None,
+                    )
+                return loans, payments
+            except Exception as e:
+                # If the first attempt fails, retry once with a fresh session.
+                #
+                # We always do this for browser/DNS error pages, and we also do it for the common
+                # "login form not found" scenario which can happen when a persisted storage_state
+                # lands us on an unexpected intermediate page.
+                if attempt_idx == 0 and not force_fresh_session:
+                    retry_for_browser_error = self._looks_like_browser_error(page)
+                    retry_for_login_form = (
+                        use_storage
+                        and isinstance(e, LoginFormNotFoundError)
+                        and not self._looks_logged_in(page)
+                    )
+                    retry_for_access_denied = isinstance(e, PortalAccessDeniedError)
+                    if retry_for_browser_error or retry_for_login_form or retry_for_access_denied:
+                        logger.warning(
+                            "Portal navigation/login failed%s; retrying once with a fresh session (no stored cookies).",
+                            " (stored session)" if use_storage else "",
                         )
-                        return loans, payments
-                    except Exception as e:
-                        # If the first attempt fails, retry once with a fresh session.
-                        #
-                        # We always do this for browser/DNS error pages, and we also do it for the common
-                        # "login form not found" scenario which can happen when a persisted storage_state
-                        # lands us on an unexpected intermediate page.
-                        if attempt_idx == 0 and not force_fresh_session:
-                            retry_for_browser_error = self._looks_like_browser_error(page)
-                            retry_for_login_form = (
-                                use_storage
-                                and isinstance(e, LoginFormNotFoundError)
-                                and not self._looks_logged_in(page)
-                            )
-                            retry_for_access_denied = isinstance(e, PortalAccessDeniedError)
-                            if retry_for_browser_error or retry_for_login_form or retry_for_access_denied:
-                                logger.warning(
-                                    "Portal navigation/login failed%s; retrying once with a fresh session (no stored cookies).",
-                                    " (stored session)" if use_storage else "",
-                                )
-                                self._save_debug(page, debug_dir=debug_dir, name_prefix="retry_fresh_session")
-                                continue
-                        raise
-                    finally:
-                        ctx.close()
+                        self._save_debug(page, debug_dir=debug_dir, name_prefix="retry_fresh_session")
+                        continue
+                raise
             finally:
-                browser.close()
+                self._dispose_run_context(ctx)
 
     def discover_loan_groups(
         self,
@@ -457,107 +1238,87 @@ class ServicerPortalClient:
         state_path = Path(storage_state_path) if storage_state_path else None
         Path(debug_dir).mkdir(parents=True, exist_ok=True)
 
-        def _install_context_hooks(ctx) -> None:
-            self._install_context_hooks(ctx)
+        profile_dir = self._profile_dir_for(state_path)
+        browser = None
+        if profile_dir is None:
+            browser = self._ensure_browser(headless=headless, slow_mo=int(slow_mo_ms or 0))
+
+        for attempt_idx in range(2):
+            ctx, use_storage = self._context_for_attempt(
+                attempt_idx=attempt_idx,
+                force_fresh_session=force_fresh_session,
+                state_path=state_path,
+                profile_dir=profile_dir,
+                browser=browser,
+                headless=headless,
+                slow_mo=int(slow_mo_ms or 0),
+            )
 
-        with sync_playwright() as p:
-            browser = self._launch_browser(p, headless=headless, slow_mo=int(slow_mo_ms or 0))
+            page = ctx.new_page()
             try:
-                for attempt_idx in range(2):
-                    use_storage = (
-                        attempt_idx == 0 and not force_fresh_session and state_path is not None and state_path.exists()
-                    )
-                    if use_storage and state_path is not None:
-                        use_storage = self._validate_or_restore_storage_state(state_path)
+                self._step(page, debug_dir=debug_dir, name=f"discover_start_attempt_{attempt_idx+1}")
+                self._login(
+                    page,
+                    mfa_code_provider=mfa_code_provider,
+                    mfa_method=mfa_method,
+                    debug_dir=debug_dir,
+                    manual_mfa=manual_mfa,
+                )
 
-                    storage = str(state_path) if use_storage else None
+                if state_path is not None:
+                    self._export_storage_state(ctx, state_path)
 
-                    ctx = None
-                    try:
-                        ctx = self._create_browser_context(browser, storage_state=storage)
-                    except Exception as e:
-                        if use_storage and state_path is not None:
-                            logger.warning(
-                                "Failed to create browser context with stored session; falling back to fresh session. (%s)",
-                                e,
-                            )
-                            self._quarantine_file(state_path, prefix="storage_state")
-                            use_storage = False
-                            ctx = self._create_browser_context(browser, storage_state=None)
-                        else:
-                            raise
-
-                    _install_context_hooks(ctx)
+                # Navigate to loan details and parse "Group:" headers.
+                self._wait_for_post_login_ready(page, debug_dir=debug_dir, timeout_ms=90_000)
+                if self.provider == "edfinancial":
+                    return self._edf_discover_loan_groups(page, debug_dir=debug_dir)
+                self._goto_section(page, self.selectors.nav_my_loans_text, debug_dir=debug_dir)
 
-                    page = ctx.new_page()
+                # Some portals render multiple "My Loans" targets (nav, dashboard cards, footer).
+                # We try to click the most likely navigation candidate first, but still keep a hard
+                # fallback: if clicks don't land us on the loan details view, go directly by URL.
+                if not self._wait_for_text_attached(page, "Group:", timeout_ms=15_000):
                     try:
-                        self._step(page, debug_dir=debug_dir, name=f"discover_start_attempt_{attempt_idx+1}")
-                        self._login(
-                            page,
-                            mfa_code_provider=mfa_code_provider,
-                            mfa_method=mfa_method,
-                            debug_dir=debug_dir,
-                            manual_mfa=manual_mfa,
-                        )
-
-                        if state_path is not None:
-                            state_path.parent.mkdir(parents=True, exist_ok=True)
-                            ctx.storage_state(path=str(state_path))
-                            self._backup_storage_state(state_path)
-
-                        # Navigate to loan details and parse "Group:" headers.
-                        self._wait_for_post_login_ready(page, debug_dir=debug_dir, timeout_ms=90_000)
-                        if self.provider == "edfinancial":
-                            return self._edf_discover_loan_groups(page, debug_dir=debug_dir)
-                        self._goto_section(page, self.selectors.nav_my_loans_text, debug_dir=debug_dir)
-
-                        # Some portals render multiple "My Loans" targets (nav, dashboard cards, footer).
-                        # We try to click the most likely navigation candidate first, but still keep a hard
-                        # fallback: if clicks don't land us on the loan details view, go directly by URL.
-                        if not self._wait_for_body_text_contains(page, "Group:", timeout_ms=15_000):
-                            try:
-                                page.goto(f"{self.base_url}/loan-details", wait_until="domcontentloaded")
-                                self._wait_for_settle(page, timeout_ms=30_000)
-                            except Exception:
-                                # We'll validate below; if still not loaded, we'll raise with debug artifacts.
-                                pass
+                        # "commit" returns as soon as the navigation lands; the "Group:" wait
+                        # below is the actual readiness check, so there's nothing to settle here.
+                        page.goto(f"{self.base_url}/loan-details", wait_until="commit")
+                    except Exception:
+                        # We'll validate below; if still not loaded, we'll raise with debug artifacts.
+                        pass
 
-                        if not self._wait_for_body_text_contains(page, "Group:", timeout_ms=30_000):
-                            self._save_debug(page, debug_dir=debug_dir, name_prefix="discover_groups_not_loaded")
-                            raise RuntimeError(
-                                f"Loan details page did not load (missing 'Group:' sections). url={getattr(page, 'url', '')!r}"
-                            )
+                if not self._wait_for_text_attached(page, "Group:", timeout_ms=30_000):
+                    self._save_debug(page, debug_dir=debug_dir, name_prefix="discover_groups_not_loaded")
+                    raise RuntimeError(
+                        f"Loan details page did not load (missing 'Group:' sections). url={getattr(page, 'url', '')!r}"
+                    )
 
-                        body = page.inner_text("body")
-                        sections = self._extract_all_group_sections(body)
-                        groups: list[tuple[str, str]] = []
-                        seen: set[str] = set()
-                        for token, label, _ in sections:
-                            key = token or label
-                            if not key or key in seen:
-                                continue
-                            groups.append((token, label))
-                            seen.add(key)
-                        return groups
-                    except Exception as e:
-                        if attempt_idx == 0 and not force_fresh_session:
-                            retry_for_browser_error = self._looks_like_browser_error(page)
-                            retry_for_login_form = (
-                                use_storage and isinstance(e, LoginFormNotFoundError) and not self._looks_logged_in(page)
-                            )
-                            retry_for_access_denied = isinstance(e, PortalAccessDeniedError)
-                            if retry_for_browser_error or retry_for_login_form or retry_for_access_denied:
-                                logger.warning(
-                                    "Portal navigation/login failed%s; retrying once with a fresh session (no stored cookies).",
-                                    " (stored session)" if use_storage else "",
-                                )
-                                self._save_debug(page, debug_dir=debug_dir, name_prefix="discover_retry_fresh_session")
-                                continue
-                        raise
-                    finally:
-                        ctx.close()
+                groups: list[tuple[str, str]] = []
+                seen: set[str] = set()
+                for label in self._group_header_labels(page):
+                    token = self._group_token_from_label(label)
+                    key = token or label
+                    if not key or key in seen:
+                        continue
+                    groups.append((token, label))
+                    seen.add(key)
+                return groups
+            except Exception as e:
+                if attempt_idx == 0 and not force_fresh_session:
+                    retry_for_browser_error = self._looks_like_browser_error(page)
+                    retry_for_login_form = (
+                        use_storage and isinstance(e, LoginFormNotFoundError) and not self._looks_logged_in(page)
+                    )
+                    retry_for_access_denied = isinstance(e, PortalAccessDeniedError)
+                    if retry_for_browser_error or retry_for_login_form or retry_for_access_denied:
+                        logger.warning(
+                            "Portal navigation/login failed%s; retrying once with a fresh session (no stored cookies).",
+                            " (stored session)" if use_storage else "",
+                        )
+                        self._save_debug(page, debug_dir=debug_dir, name_prefix="discover_retry_fresh_session")
+                        continue
+                raise
             finally:
-                browser.close()
+                self._dispose_run_context(ctx)
 
     def browse_and_capture(
         self,
@@ -588,11 +1349,31 @@ class ServicerPortalClient:
 
         state_path = Path(storage_state_path) if storage_state_path else None
 
-        def _sanitize(s: str) -> str:
-            return re.sub(r"[^a-zA-Z0-9_-]+", "_", (s or "")).strip("_")[:80] or "page"
-
         capture_counter = {"n": 0}
         last_url_by_page: dict[int, str] = {}
+        last_sig_by_page: dict[int, tuple[int, int]] = {}
+
+        # Disk writes happen on a single background thread so SPA route changes aren't
+        # blocked on compression + IO for each capture. The Playwright thread only grabs
+        # the bytes (page objects are thread-bound); the writer owns all file output.
+        write_q: "queue.Queue[Optional[tuple[Path, object]]]" = queue.Queue()
+
+        def _writer_loop() -> None:
+            while True:
+                item = write_q.get()
+                if item is None:
+                    return
+                target, payload = item
+                try:
+                    if isinstance(payload, bytes):
+                        _write_file_bytes(target, payload)
+                    else:
+                        target.write_text(str(payload), encoding="utf-8")
+                except Exception:
+                    logger.debug("Failed to write capture artifact: %s", target, exc_info=True)
+
+        writer = threading.Thread(target=_writer_loop, name="browse-capture-writer", daemon=True)
+        writer.start()
 
         def _capture(page: Page, *, reason: str) -> None:
             try:
@@ -606,27 +1387,51 @@ class ServicerPortalClient:
                 return
             last_url_by_page[pid] = url
 
+            # framenavigated also fires for hashchange/pushState rerenders where the DOM
+            # hasn't changed. A cheap in-browser sampling checksum (length + every 997th
+            # char) decides whether anything is new without shipping the HTML over CDP.
+            try:
+                sig = page.evaluate(
+                    "() => { const s = document.documentElement.outerHTML; let h = 0;"
+                    " for (let i = 0; i < s.length; i += 997) { h = (h * 31 + s.charCodeAt(i)) | 0; }"
+                    " return [s.length, h]; }"
+                )
+                sig = (int(sig[0]), int(sig[1])) if isinstance(sig, (list, tuple)) else None
+            except Exception:
+                sig = None
+            if sig is not None:
+                if reason != "manual" and last_sig_by_page.get(pid) == sig:
+                    return
+                last_sig_by_page[pid] = sig
+
             capture_counter["n"] += 1
             n = capture_counter["n"]
-            name = _sanitize(url.split("?", 1)[0].split("#", 1)[0]) if url else "unknown"
-            prefix = f"cap_{n:03d}_{_sanitize(reason)}_{name}"
+            name = _sanitize_capture_name(url.split("?", 1)[0].split("#", 1)[0]) if url else "unknown"
+            prefix = f"cap_{n:03d}_{_sanitize_capture_name(reason)}_{name}"
 
             try:
-                page.screenshot(path=str(cap_dir / f"{prefix}.png"), full_page=True)
+                # Viewport-only JPEG: ~5-10x fewer bytes than a full-page PNG, and these
+                # captures are for eyeballing flows, not pixel-perfect archival.
+                data = page.screenshot(full_page=False, type="jpeg", quality=70)
+                write_q.put((cap_dir / f"{prefix}.jpg", data))
             except Exception:
                 pass
             try:
-                (cap_dir / f"{prefix}.html").write_text(page.content(), encoding="utf-8")
-            except Exception:
-                pass
-            try:
-                (cap_dir / f"{prefix}.txt").write_text(page.inner_text("body"), encoding="utf-8")
+                # HTML and body text in one CDP round-trip instead of separate
+                # page.content() / inner-text calls; the text is capped like
+                # _body_text_snapshot to keep artifacts bounded.
+                dom = page.evaluate(
+                    "(max) => ({"
+                    " html: document.documentElement ? document.documentElement.outerHTML : '',"
+                    " text: document.body && document.body.innerText"
+                    "   ? document.body.innerText.slice(0, max) : '' })",
+                    self._BODY_TEXT_DUMP_MAX_CHARS,
+                )
+                write_q.put((cap_dir / f"{prefix}.html", dom.get("html", "")))
+                write_q.put((cap_dir / f"{prefix}.txt", dom.get("text", "")))
             except Exception:
                 pass
 
-        def _install_context_hooks(ctx) -> None:
-            self._install_context_hooks(ctx)
-
         bundle_path: Optional[Path] = None
         err: Optional[BaseException] = None
         try:
@@ -635,12 +1440,11 @@ class ServicerPortalClient:
                 try:
                     storage = None
                     if state_path and state_path.exists() and not force_fresh_session:
-                        if self._validate_or_restore_storage_state(state_path):
-                            storage = str(state_path)
+                        storage = self._validate_or_restore_storage_state(state_path)
 
                     ctx = self._create_browser_context(browser, storage_state=storage)
                     try:
-                        _install_context_hooks(ctx)
+                        self._install_context_hooks(ctx)
 
                         page = ctx.new_page()
 
@@ -654,8 +1458,14 @@ class ServicerPortalClient:
 
                         page.on("framenavigated", _on_nav)
 
-                        page.goto(self.base_url, wait_until="domcontentloaded")
-                        self._wait_for_settle(page)
+                        # Wait only for the DOM the first capture/login needs, not for
+                        # analytics beacons to finish loading.
+                        page.goto(self.base_url, wait_until="commit")
+                        try:
+                            page.wait_for_selector("body", state="attached", timeout=30_000)
+                        except Exception:
+                            pass
+                        self._dismiss_cookie_banner(page, timeout_ms=3_000)
                         _capture(page, reason="start")
 
                         if not no_login:
@@ -667,9 +1477,7 @@ class ServicerPortalClient:
                                 manual_mfa=manual_mfa,
                             )
                             if state_path is not None:
-                                state_path.parent.mkdir(parents=True, exist_ok=True)
-                                ctx.storage_state(path=str(state_path))
-                                self._backup_storage_state(state_path)
+                                self._export_storage_state(ctx, state_path)
                             _capture(page, reason="after_login")
 
                         print(
@@ -678,20 +1486,24 @@ class ServicerPortalClient:
                         )
 
                         # Wait until either the page closes OR the browser disconnects.
-                        # Some platforms keep the app alive after closing the last window; polling avoids hangs.
-                        while True:
-                            try:
-                                if page.is_closed():
-                                    break
-                            except Exception:
-                                break
+                        # Event-driven: close/disconnect handlers set the flag, and a page
+                        # close aborts the pending wait_for_timeout immediately. The 5s
+                        # heartbeat (down from a 500ms spin) only covers platforms where
+                        # "disconnected" isn't delivered (e.g. the app staying alive after
+                        # the last window closes). Note the sync API only dispatches event
+                        # handlers while we're inside a Playwright call, so the heartbeat
+                        # doubles as the event pump.
+                        done = threading.Event()
+                        page.on("close", lambda _=None: done.set())
+                        browser.on("disconnected", lambda _=None: done.set())
+                        while not done.is_set():
                             try:
-                                if not browser.is_connected():
+                                if page.is_closed() or not browser.is_connected():
                                     break
                             except Exception:
                                 break
                             try:
-                                page.wait_for_timeout(500)
+                                page.wait_for_timeout(5_000)
                             except Exception:
                                 break
                     finally:
@@ -708,6 +1520,12 @@ class ServicerPortalClient:
             # Still produce a bundle even if Playwright/browser exits unexpectedly or user Ctrl+C's.
             err = e
         finally:
+            # Flush pending capture writes before bundling so the zip is complete.
+            try:
+                write_q.put(None)
+                writer.join(timeout=10)
+            except Exception:
+                pass
             try:
                 # Always write a bundle on exit (even if an exception occurred).
                 bundle_path = create_debug_bundle(
@@ -733,53 +1551,169 @@ class ServicerPortalClient:
         # e.g. data/servicer_storage_state_nelnet.json -> data/servicer_storage_state_nelnet.json.bak
         return state_path.with_name(state_path.name + ".bak")
 
-    def _validate_or_restore_storage_state(self, state_path: Path) -> bool:
+    @staticmethod
+    def _storage_state_cache_key(path: Path) -> Optional[tuple[str, float, int]]:
+        try:
+            st = path.stat()
+            return (str(path), st.st_mtime, st.st_size)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _storage_state_looks_valid_fast(raw) -> bool:
         """
-        Return True if we should use `state_path` as Playwright storage_state.
+        Byte-level structural screen for a storage_state payload.
 
-        If the JSON is corrupted, we quarantine it and attempt to restore from `<file>.bak`.
-        If that fails, return False so the caller uses a fresh session.
+        Accepts any bytes-like buffer (including a read-only mmap, so a reject need not
+        copy the file into the heap). True means "plausibly valid, worth parsing"; False
+        means the full JSON parse can be skipped (empty/truncated/garbage file). The
+        substring checks are C-level memchr scans — far cheaper than decoding the whole
+        cookie jar just to reject it.
         """
+        if len(raw) == 0:
+            return False
+        if not bytes(raw[:64]).lstrip().startswith(b"{"):
+            return False
+        return raw.find(b'"cookies"') >= 0 or raw.find(b'"origins"') >= 0
+
+    @staticmethod
+    def _parse_storage_state(path: Path) -> Optional[dict]:
         try:
-            raw = state_path.read_text(encoding="utf-8")
-            data = json.loads(raw)
-            if isinstance(data, dict) and ("cookies" in data or "origins" in data):
-                return True
+            # A real storage_state is at most a few MB; anything enormous is corruption,
+            # and treating it as invalid (quarantine + restore) beats parsing gigabytes.
+            if path.stat().st_size > 50_000_000:
+                return None
+            # Screen against a read-only mmap: the structural check runs over file-backed
+            # pages the OS can evict freely, and a rejected file is never copied into the
+            # Python heap. Callers need the parsed dict (it goes straight to new_context),
+            # so on a pass we materialize the bytes once for the JSON parse.
+            fd = os.open(str(path), os.O_RDONLY)
+            try:
+                with contextlib.closing(mmap.mmap(fd, 0, access=mmap.ACCESS_READ)) as mm:
+                    if not ServicerPortalClient._storage_state_looks_valid_fast(mm):
+                        return None
+                    raw = bytes(mm)
+            finally:
+                os.close(fd)
         except Exception:
-            pass
+            return None
+        try:
+            data = _json_loads_bytes(raw)
+        except Exception:
+            return None
+        if not (isinstance(data, dict) and ("cookies" in data or "origins" in data)):
+            return None
+        # Strip already-expired cookies so we don't ship dead bytes into Chromium's
+        # cookie store ("expires" is unix seconds; -1 marks a session cookie).
+        cookies = data.get("cookies")
+        if isinstance(cookies, list):
+            now = time.time()
+            data["cookies"] = [
+                c
+                for c in cookies
+                if not (
+                    isinstance(c, dict)
+                    and isinstance(c.get("expires"), (int, float))
+                    and 0 < c["expires"] < now
+                )
+            ]
+        return data
+
+    def _validate_or_restore_storage_state(self, state_path: Path) -> Optional[dict]:
+        """
+        Return the parsed storage_state dict if `state_path` is usable, else None.
+
+        The dict is handed straight to `new_context` (Playwright accepts it in place of a
+        file path), so the driver never re-opens and re-parses the JSON — and the result is
+        cached by (path, mtime, size) so retry attempts don't re-read the file either.
+
+        If the JSON is corrupted, we quarantine it and attempt to restore from `<file>.bak`.
+        If that fails, return None so the caller uses a fresh session.
+        """
+        key = self._storage_state_cache_key(state_path)
+        cached = self._loaded_storage_state
+        if key is not None and cached is not None and cached[0] == key:
+            return cached[1]
+
+        data = self._parse_storage_state(state_path)
+        if data is not None:
+            if key is not None:
+                self._loaded_storage_state = (key, data)
+            return data
 
         logger.warning("storage_state file is invalid JSON; ignoring and attempting restore from backup: %s", state_path)
         self._quarantine_file(state_path, prefix="storage_state")
+        self._loaded_storage_state = None
 
         bak = self._storage_state_backup_path(state_path)
         if bak.exists():
-            try:
-                raw = bak.read_text(encoding="utf-8")
-                data = json.loads(raw)
-                if isinstance(data, dict) and ("cookies" in data or "origins" in data):
-                    shutil.copy2(bak, state_path)
+            data = self._parse_storage_state(bak)
+            if data is not None:
+                try:
+                    _fast_file_copy(bak, state_path)
                     logger.warning("Restored storage_state from backup: %s", bak)
-                    return True
-            except Exception:
-                logger.debug("Failed to restore storage_state from backup.", exc_info=True)
+                except Exception:
+                    logger.debug("Failed to restore storage_state from backup.", exc_info=True)
+                key = self._storage_state_cache_key(state_path)
+                if key is not None:
+                    self._loaded_storage_state = (key, data)
+                return data
 
-        return False
+        return None
 
     def _backup_storage_state(self, state_path: Path) -> None:
         """
         Best-effort: keep a last-known-good copy of Playwright storage_state so we can self-heal if the JSON corrupts.
         """
         try:
-            bak = self._storage_state_backup_path(state_path)
-            # Only write a backup if the JSON looks valid.
-            if self._validate_or_restore_storage_state(state_path):
-                shutil.copy2(state_path, bak)
+            # Validation is answered from the parsed-state cache on the common path,
+            # so this doesn't re-parse the JSON.
+            if self._validate_or_restore_storage_state(state_path) is None:
+                return
+            _fast_file_copy(state_path, self._storage_state_backup_path(state_path))
         except Exception:
             logger.debug("Failed to write storage_state backup.", exc_info=True)
 
+    @staticmethod
+    def _storage_state_digest(data: dict) -> bytes:
+        return hashlib.blake2b(
+            json.dumps(data, sort_keys=True).encode("utf-8"), digest_size=16
+        ).digest()
+
+    def _export_storage_state(self, ctx, state_path: Path) -> None:
+        """
+        Persist the context's storage state, skipping the disk write when it is
+        equivalent to what we loaded.
+
+        On the common cached-session run (stored cookies accepted, no MFA prompt) the
+        state hasn't changed; comparing digests of the canonical JSON avoids rewriting
+        hundreds of KB plus the .bak copy on every run.
+        """
+        try:
+            current = ctx.storage_state()
+        except Exception:
+            logger.debug("Failed to read storage state from context.", exc_info=True)
+            return
+
+        loaded = self._loaded_storage_state
+        if (
+            loaded is not None
+            and loaded[0][0] == str(state_path)
+            and self._storage_state_digest(loaded[1]) == self._storage_state_digest(current)
+        ):
+            logger.debug("storage_state unchanged since load; skipping rewrite: %s", state_path)
+            return
+
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        state_path.write_text(json.dumps(current), encoding="utf-8")
+        key = self._storage_state_cache_key(state_path)
+        if key is not None:
+            self._loaded_storage_state = (key, current)
+        self._backup_storage_state(state_path)
+
     def _quarantine_file(self, path: Path, *, prefix: str) -> None:
         try:
-            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
             path.replace(path.with_name(f"{prefix}.{path.name}.corrupt-{stamp}"))
         except Exception:
             logger.debug("Failed to quarantine file=%s", path, exc_info=True)
@@ -851,19 +1785,28 @@ class ServicerPortalClient:
             self._step(page, debug_dir=debug_dir, name="login_form_visible")
 
             def _first_visible(scope, selector: str):
-                loc = scope.locator(selector)
+                # One evaluate returns the index of the first visible match; probing
+                # nth(i).is_visible() cost a CDP round-trip per hidden template input.
                 try:
-                    n = min(int(loc.count()), 25)
+                    idx = scope.evaluate(
+                        """
+                        (sel) => {
+                          const els = Array.from(document.querySelectorAll(sel)).slice(0, 25);
+                          for (let i = 0; i < els.length; i++) {
+                            const r = els[i].getBoundingClientRect();
+                            const s = getComputedStyle(els[i]);
+                            if (r.width > 0 && r.height > 0 && s.visibility !== 'hidden' && s.display !== 'none') return i;
+                          }
+                          return -1;
+                        }
+                        """,
+                        selector,
+                    )
                 except Exception:
-                    n = 0
-                for i in range(n):
-                    cand = loc.nth(i)
-                    try:
-                        if cand.is_visible():
-                            return cand
-                    except Exception:
-                        continue
-                return None
+                    return None
+                if not isinstance(idx, int) or idx < 0:
+                    return None
+                return scope.locator(selector).nth(idx)
 
             user_input = _first_visible(frame, self.selectors.username_input)
             if user_input is None:
@@ -913,13 +1856,16 @@ class ServicerPortalClient:
                 logger.info(
                     "Manual MFA mode: complete the MFA in the opened browser (enter the code + click Verify)."
                 )
-                # Wait until we are no longer on an MFA-looking page.
-                deadline = time.time() + 180
-                while time.time() < deadline:
-                    if not self._looks_like_mfa(page):
-                        break
-                    page.wait_for_timeout(500)
-                if self._looks_like_mfa(page):
+                # Wait until we are no longer on an MFA-looking page. wait_for_function runs
+                # the predicate inside the browser, so we wake on the actual transition
+                # instead of burning 500ms polling quanta over CDP.
+                try:
+                    page.wait_for_function(
+                        self._MFA_GONE_JS,
+                        arg=self.selectors.mfa_code_input,
+                        timeout=180_000,
+                    )
+                except Exception:
                     self._save_debug(page, debug_dir=debug_dir, name_prefix="mfa_manual_timeout")
                     raise TimeoutError("Timed out waiting for manual MFA completion.")
             else:
@@ -953,30 +1899,34 @@ class ServicerPortalClient:
 
         self._step(page, debug_dir=debug_dir, name="login_complete")
 
-    def _best_effort_login_failure_reason(self, page: Page) -> Optional[str]:
+    def _best_effort_login_failure_reason(self, page: Page, *, body_text: Optional[str] = None) -> Optional[str]:
         """
         Try to produce an actionable login failure message from the portal UI.
 
+        Callers that already captured the body text (e.g. alongside a debug save) can pass it via
+        `body_text` so we don't re-serialize the whole page just to classify the failure.
+
         This is intentionally conservative: if we can't find a clear message, return None and let the
         caller raise a generic error (with debug artifacts saved).
         """
-        try:
-            body = page.inner_text("body")
-        except Exception:
-            body = ""
+        if body_text is None:
+            try:
+                body_text = self._body_text_snapshot(page)
+            except Exception:
+                body_text = ""
 
-        txt = (body or "").strip()
+        txt = (body_text or "").strip()
         if not txt:
             return None
 
-        # Common invalid-credential wording observed on Aidvantage.
-        if re.search(r"can\\s*'\\s*t\\s+find\\s+the\\s+user\\s+id\\s+and\\s+password\\s+combination", txt, re.I):
-            attempts_left = None
-            m = re.search(r"You\\s+have\\s+(\\d+)\\s+more\\s+attempts?", txt, re.I)
-            if m:
-                attempts_left = m.group(1)
+        m = _RE_LOGIN_FAILURE.search(txt)
+        if not m:
+            return None
 
-            extra = f" (attempts left: {attempts_left})" if attempts_left else ""
+        # Common invalid-credential wording observed on Aidvantage.
+        if m.group("bad_creds"):
+            am = _RE_ATTEMPTS_LEFT.search(txt)
+            extra = f" (attempts left: {am.group(1)})" if am else ""
             return (
                 "Login failed: the servicer portal rejected your User ID / Password. "
                 "Double-check SERVICER_USERNAME and SERVICER_PASSWORD and try again."
@@ -984,22 +1934,183 @@ class ServicerPortalClient:
             )
 
         # Generic invalid/incorrect password messages.
-        if re.search(r"(invalid|incorrect).*(user\\s*id|username|password)", txt, re.I):
+        if m.group("invalid"):
             return (
                 "Login failed: the servicer portal reports your credentials are invalid/incorrect. "
                 "Double-check SERVICER_USERNAME and SERVICER_PASSWORD and try again."
             )
 
         # Account lock / throttling hints.
-        if re.search(r"account\\s+will\\s+be\\s+locked|account\\s+locked|too\\s+many\\s+attempts", txt, re.I):
-            return (
-                "Login failed: the portal indicates your account may be locked or you are out of attempts. "
-                "Try logging in manually in a browser to confirm account status, then retry."
+        return (
+            "Login failed: the portal indicates your account may be locked or you are out of attempts. "
+            "Try logging in manually in a browser to confirm account status, then retry."
+        )
+
+    # Signals younger than this are reused; the login-state loops poll at 500ms, so each
+    # tick computes the bundle once even though it checks several predicates.
+    _PAGE_SIGNALS_TTL_NS = 200_000_000
+
+    # All main-document login-state signals in one in-browser pass: one CDP round-trip
+    # per classification instead of one per locator query (15+ for _looks_logged_in
+    # alone). Text checks mirror get_by_text(exact=False): lowercase substring match.
+    _PAGE_SIGNALS_JS = """
+    (sel) => {
+      const bodyText = ((document.body && document.body.innerText) || '').toLowerCase();
+      const has = (t) => bodyText.includes(t);
+      const clickables = Array.from(
+        document.querySelectorAll('button, a, [role="button"], [role="link"], input[type="submit"]')
+      );
+      const nameMatch = (re) => clickables.some((el) => re.test(((el.innerText || el.value || '') + '').trim()));
+      return {
+        hasLoginBtn: nameMatch(/^\\s*log\\s*in\\s*$/i),
+        hasLoginCta: nameMatch(/^\\s*(sign\\s*in|log\\s*in|login)\\s*$/i),
+        hasCreateAccount: has('create online account') || has('create an account'),
+        hasPrevLoggedIn: has('previously logged in'),
+        hasUsernameInput: !!document.querySelector(sel.username),
+        url: location.href,
+        hasManageAcct: has('manage my account'),
+        hasMyLoansAcct: has('my loans for account'),
+        hasPaymentActivity: has('payment activity'),
+        hasTotalBalance: has('total current balance'),
+        hasTotalDue: has('total payment due'),
+        hasZeroBalance: has('$0 balance loans'),
+        hasLoanDetailsLink: !!document.querySelector('a[href="/loan-details"]'),
+        hasPaymentsBtn: !!document.querySelector('button#Payments'),
+        hasProfileBtn: !!document.querySelector('button#myProfileButton'),
+        hasSignOut: nameMatch(/sign\\s*out/i) || nameMatch(/log\\s*out/i),
+        hasCodeInput: !!document.querySelector(sel.mfaCode),
+        hasMfaText: has('verification code') || has('one-time') || has('mfa') || has('security code'),
+        hasLoadingCard: !!document.querySelector('[data-cy="loading-card"]'),
+        hasGatherText: has('please wait while we gather your data.'),
+        hasAppCallback: !!document.querySelector('app-callback'),
+      };
+    }
+    """
+
+    _LOGIN_CTA_RE = re.compile(r"^\s*(sign\s*in|log\s*in|login)\s*$", re.I)
+
+    # In-browser disjunction of "we can classify this page" for _wait_for_auth_state_known:
+    # any authenticated marker, a visible login form, a login CTA, or an MFA prompt.
+    _AUTH_STATE_KNOWN_JS = """
+    (sel) => {
+      const bodyText = ((document.body && document.body.innerText) || '').toLowerCase();
+      const has = (t) => bodyText.includes(t);
+      const clickables = Array.from(
+        document.querySelectorAll('button, a, [role="button"], [role="link"], input[type="submit"]')
+      );
+      const nameMatch = (re) => clickables.some((el) => re.test(((el.innerText || el.value || '') + '').trim()));
+      if (/\\/(dashboard|loan-details|manage)|\\/payments\\/|\\/payment-activity/.test(location.pathname)) return true;
+      if (has('manage my account') || has('my loans for account') || has('payment activity')) return true;
+      if (document.querySelector('a[href="/loan-details"], button#Payments, button#myProfileButton')) return true;
+      if (nameMatch(/sign\\s*out/i) || nameMatch(/log\\s*out/i)) return true;
+      const u = document.querySelector(sel.username);
+      if (u) { const r = u.getBoundingClientRect(); if (r.width > 0 && r.height > 0) return true; }
+      if (nameMatch(/^\\s*(sign\\s*in|log\\s*in|login)\\s*$/i)) return true;
+      if (document.querySelector(sel.mfaCode)) return true;
+      if (has('verification code') || has('one-time') || has('security code')) return true;
+      return false;
+    }
+    """
+
+    # In-browser "manual MFA finished" predicate: the negation of the hasCodeInput/hasMfaText
+    # signals, so the browser can notify us the moment the MFA screen goes away instead of us
+    # polling it over CDP every 500ms.
+    _MFA_GONE_JS = """
+    (mfaCode) => {
+      const bodyText = ((document.body && document.body.innerText) || '').toLowerCase();
+      const has = (t) => bodyText.includes(t);
+      if (document.querySelector(mfaCode)) return false;
+      return !has('verification code') && !has('one-time') && !has('mfa') && !has('security code');
+    }
+    """
+
+    def _page_signals(self, page: Page) -> dict:
+        """
+        One bundled pass over the login-state heuristics, memoized per page for a short TTL.
+
+        _wait_for_auth_state_known, _ensure_login_form_visible and _login all consult
+        _looks_logged_in/_looks_like_mfa from polling loops; each predicate costs a pile
+        of locator round-trips over CDP, so without the memo every tick paid for the same
+        queries up to three times. The signals themselves come from a single
+        page.evaluate; the locator-based computations remain as a fallback for pages
+        where evaluation fails (e.g. mid-navigation).
+        """
+        now = time.monotonic_ns()
+        cached = self._page_signals_cache.get(id(page))
+        if cached is not None and now - cached[0] < self._PAGE_SIGNALS_TTL_NS:
+            return cached[1]
+
+        raw: Optional[dict] = None
+        try:
+            raw = page.evaluate(
+                self._PAGE_SIGNALS_JS,
+                {"username": self.selectors.username_input, "mfaCode": self.selectors.mfa_code_input},
             )
+        except Exception:
+            raw = None
+
+        if isinstance(raw, dict):
+            signals = {
+                "logged_in": self._logged_in_from_signals(page, raw),
+                "mfa": bool(raw.get("hasCodeInput") or raw.get("hasMfaText")),
+                "login_cta": bool(raw.get("hasLoginCta")),
+                "post_login_loading": bool(
+                    raw.get("hasLoadingCard") or raw.get("hasGatherText") or raw.get("hasAppCallback")
+                ),
+            }
+        else:
+            signals = {
+                "logged_in": self._compute_looks_logged_in(page),
+                "mfa": self._compute_looks_like_mfa(page),
+                "login_cta": self._compute_has_login_cta(page),
+                "post_login_loading": self._compute_looks_like_post_login_loading(page),
+            }
+        if len(self._page_signals_cache) >= 64:
+            # Bound the memo. Entries live for 200ms, so growth past this means stale
+            # ids from closed pages; clearing is harmless and keeps lookups cheap.
+            self._page_signals_cache.clear()
+        self._page_signals_cache[id(page)] = (now, signals)
+        return signals
+
+    def _logged_in_from_signals(self, page: Page, s: dict) -> bool:
+        """Same precedence as _compute_looks_logged_in, fed from the batched signals."""
+        if s.get("hasLoginBtn") and (s.get("hasCreateAccount") or s.get("hasPrevLoggedIn")):
+            return False
+        if s.get("hasUsernameInput"):
+            return False
+        # The batch only sees the main document; iframe-hosted login forms still need
+        # the frame walk (only when frames beyond the main one actually exist).
+        try:
+            if len(page.frames) > 1 and self._find_frame_with_selector(page, self.selectors.username_input) is not None:
+                return False
+        except Exception:
+            pass
+        url = s.get("url") or ""
+        if any(part in url for part in ("/dashboard", "/loan-details", "/payments/", "/payment-activity", "/manage")):
+            return True
+        if s.get("hasManageAcct") or s.get("hasMyLoansAcct") or s.get("hasPaymentActivity"):
+            return True
+        if self.provider == "edfinancial" and (
+            s.get("hasTotalBalance") or s.get("hasTotalDue") or s.get("hasZeroBalance")
+        ):
+            return True
+        if s.get("hasLoanDetailsLink") or s.get("hasPaymentsBtn") or s.get("hasProfileBtn"):
+            return True
+        return bool(s.get("hasSignOut"))
 
-        return None
+    def _compute_has_login_cta(self, page: Page) -> bool:
+        for role in ("button", "link"):
+            try:
+                if page.get_by_role(role, name=self._LOGIN_CTA_RE).count() > 0:
+                    return True
+            except Exception:
+                pass
+        return False
 
     def _looks_logged_in(self, page: Page) -> bool:
+        return self._page_signals(page)["logged_in"]
+
+    def _compute_looks_logged_in(self, page: Page) -> bool:
         """
         Heuristic detection of an already-authenticated session.
         """
@@ -1007,7 +2118,7 @@ class ServicerPortalClient:
         # The portal sometimes keeps you on `/welcome` even if storage_state exists; do NOT treat that as logged in
         # when the page clearly offers login/registration CTAs.
         try:
-            login_btn = page.get_by_role("button", name=re.compile(r"^\s*log\s*in\s*$", re.I))
+            login_btn = page.get_by_role("button", name=_RE_LOGIN_BTN)
             if login_btn.count() > 0:
                 # If the welcome/register CTAs are present alongside a Log In button, we're logged out.
                 if (
@@ -1078,14 +2189,14 @@ class ServicerPortalClient:
             pass
 
         # Sign-out UI is a strong signal we are authenticated.
-        for pat in (r"sign\s*out", r"log\s*out"):
+        for pat in (_RE_SIGN_OUT, _RE_LOG_OUT):
             try:
-                if page.get_by_role("link", name=re.compile(pat, re.I)).count() > 0:
+                if page.get_by_role("link", name=pat).count() > 0:
                     return True
             except Exception:
                 pass
             try:
-                if page.get_by_role("button", name=re.compile(pat, re.I)).count() > 0:
+                if page.get_by_role("button", name=pat).count() > 0:
                     return True
             except Exception:
                 pass
@@ -1098,13 +2209,14 @@ class ServicerPortalClient:
         This tries to get us to the actual login form and returns the frame containing it.
         """
         # Try a few times: click sign-in entry, then re-check for form.
+        sel = self.selectors  # bound once; read on every iteration below
         for _ in range(8):
             # If the app finishes routing to an authenticated dashboard while we're hunting for the login form,
             # bail out and let the caller treat this as "already logged in".
             if self._looks_logged_in(page):
                 return None
 
-            frame = self._find_frame_with_selector(page, self.selectors.username_input, require_visible=True)
+            frame = self._find_frame_with_selector(page, sel.username_input, require_visible=True)
             if frame:
                 return frame
 
@@ -1118,7 +2230,7 @@ class ServicerPortalClient:
                     page.get_by_text("Please Read Before Continuing", exact=False).count() > 0
                     or page.get_by_text("Unauthorized use of this information system", exact=False).count() > 0
                 )
-                accept = page.locator(self.selectors.federal_disclaimer_accept_selector)
+                accept = page.locator(sel.federal_disclaimer_accept_selector)
                 if looks_like_disclaimer and accept.count() > 0 and accept.first.is_visible():
                     accept.first.click()
                     self._wait_for_settle(page, timeout_ms=20_000)
@@ -1134,10 +2246,10 @@ class ServicerPortalClient:
                 continue
 
             # Try clicking a "Sign in / Log in" entry point if present.
-            self._click_first_by_texts(page, self.selectors.sign_in_entry_texts, ignore_missing=True)
+            self._click_first_by_texts(page, sel.sign_in_entry_texts, ignore_missing=True)
 
             # Fallback: some entry points aren't exposed as semantic buttons/links.
-            for t in self.selectors.sign_in_entry_texts:
+            for t in sel.sign_in_entry_texts:
                 try:
                     cand = page.get_by_text(t, exact=False)
                     if cand.count() > 0:
@@ -1163,38 +2275,38 @@ class ServicerPortalClient:
         This is intentionally best-effort (no exception) because portal pages vary; it just reduces race conditions.
         """
         deadline = time.time() + (timeout_ms / 1000)
-        login_cta_re = re.compile(r"^\s*(sign\s*in|log\s*in|login)\s*$", re.I)
+        sel = self.selectors
         while time.time() < deadline:
             # Keep overlays out of the way while we wait.
             self._dismiss_cookie_banner(page, timeout_ms=3_000)
 
-            if self._looks_logged_in(page):
+            signals = self._page_signals(page)
+            if signals["logged_in"] or signals["mfa"]:
                 return
 
             try:
-                if self._find_frame_with_selector(page, self.selectors.username_input, require_visible=True) is not None:
+                if self._find_frame_with_selector(page, sel.username_input, require_visible=True) is not None:
                     return
             except Exception:
                 pass
 
-            if self._looks_like_mfa(page):
-                return
-
             # If a login CTA is present, we already know we're in a "logged out" state.
             # No need to burn the full timeout just to classify this page.
+            if signals["login_cta"]:
+                return
+
+            # Suspend in-browser until any known state appears (wait_for_function polls at
+            # the page's natural cadence, no Python wakeups). Sliced so the iframe check
+            # and banner dismissal above stay responsive — the function can't see frames.
             try:
-                if page.get_by_role("button", name=login_cta_re).count() > 0:
-                    return
-            except Exception:
-                pass
-            try:
-                if page.get_by_role("link", name=login_cta_re).count() > 0:
-                    return
+                page.wait_for_function(
+                    self._AUTH_STATE_KNOWN_JS,
+                    arg={"username": sel.username_input, "mfaCode": sel.mfa_code_input},
+                    timeout=2_500,
+                )
             except Exception:
                 pass
 
-            page.wait_for_timeout(500)
-
     def _maybe_complete_login_choice(self, page: Page) -> bool:
         """
         On the portal welcome/login flow, there's a page with radio choices:
@@ -1230,7 +2342,7 @@ class ServicerPortalClient:
 
             # Detect by presence of the radio / label text.
             access_radio = page.get_by_role(
-                "radio", name=re.compile(re.escape(self.selectors.login_choice_access_text), re.I)
+                "radio", name=_escaped_ci_pattern(self.selectors.login_choice_access_text)
             )
             if access_radio.count() == 0:
                 # Sometimes the label isn't wired to radio role correctly; fall back to text.
@@ -1252,7 +2364,7 @@ class ServicerPortalClient:
 
             # Click Continue
             cont = page.get_by_role(
-                "button", name=re.compile(re.escape(self.selectors.login_choice_continue_text), re.I)
+                "button", name=_escaped_ci_pattern(self.selectors.login_choice_continue_text)
             )
             if cont.count() > 0:
                 cont.first.click()
@@ -1267,7 +2379,7 @@ class ServicerPortalClient:
 
             # Sometimes Continue is a link-styled button
             cont_link = page.get_by_role(
-                "link", name=re.compile(re.escape(self.selectors.login_choice_continue_text), re.I)
+                "link", name=_escaped_ci_pattern(self.selectors.login_choice_continue_text)
             )
             if cont_link.count() > 0:
                 cont_link.first.click()
@@ -1284,22 +2396,30 @@ class ServicerPortalClient:
             logger.debug("Failed while attempting login-choice step; continuing.", exc_info=True)
             return False
 
+    # One round-trip per frame: presence and visibility are both answered in-browser
+    # instead of a count() plus up to 25 nth().is_visible() calls per frame. Hidden
+    # template inputs behind a disclaimer gate therefore still don't count as visible.
+    _FRAME_SELECTOR_PROBE_JS = """
+    (args) => {
+      const els = document.querySelectorAll(args.sel);
+      if (els.length === 0) return false;
+      if (!args.visible) return true;
+      for (const e of els) {
+        const r = e.getBoundingClientRect();
+        const s = getComputedStyle(e);
+        if (r.width > 0 && r.height > 0 && s.visibility !== 'hidden' && s.display !== 'none') return true;
+      }
+      return false;
+    }
+    """
+
     def _find_frame_with_selector(self, page: Page, selector: str, *, require_visible: bool = False) -> Optional[Frame]:
         for frame in page.frames:
             try:
-                loc = frame.locator(selector)
-                if loc.count() <= 0:
-                    continue
-                if not require_visible:
+                if frame.evaluate(
+                    self._FRAME_SELECTOR_PROBE_JS, {"sel": selector, "visible": bool(require_visible)}
+                ):
                     return frame
-                # Only consider the selector "present" if at least one match is visible.
-                # Some portals render hidden template inputs behind a disclaimer gate.
-                for i in range(min(int(loc.count()), 25)):
-                    try:
-                        if loc.nth(i).is_visible():
-                            return frame
-                    except Exception:
-                        continue
             except Exception:
                 continue
         return None
@@ -1311,7 +2431,7 @@ class ServicerPortalClient:
         for t in texts:
             # button
             try:
-                btn = scope.get_by_role("button", name=re.compile(re.escape(t), re.I))
+                btn = scope.get_by_role("button", name=_escaped_ci_pattern(t))
                 if btn.count() > 0:
                     btn.first.click()
                     return
@@ -1319,7 +2439,7 @@ class ServicerPortalClient:
                 pass
             # link
             try:
-                link = scope.get_by_role("link", name=re.compile(re.escape(t), re.I))
+                link = scope.get_by_role("link", name=_escaped_ci_pattern(t))
                 if link.count() > 0:
                     link.first.click()
                     return
@@ -1329,19 +2449,35 @@ class ServicerPortalClient:
         if not ignore_missing:
             raise RuntimeError(f"Could not find clickable element for any of: {texts}")
 
+    # Resolves once the DOM is parsed AND the browser has had an idle slice (capped at 500ms),
+    # replacing the old domcontentloaded wait + unconditional 500ms sleep pair.
+    _SETTLE_JS = """
+    () => new Promise((res) => {
+      const go = () => (window.requestIdleCallback
+        ? requestIdleCallback(() => res(true), { timeout: 500 })
+        : setTimeout(() => res(true), 250));
+      if (document.readyState === 'complete' || document.readyState === 'interactive') go();
+      else document.addEventListener('DOMContentLoaded', go, { once: true });
+    })
+    """
+
     def _wait_for_settle(self, page: Page, *, timeout_ms: int = 10_000) -> None:
         """
         Avoid `networkidle` — many modern sites keep background requests running forever.
+        The idle-callback promise lets a quiet page settle in a few ms instead of always
+        paying a fixed post-load sleep.
         """
         try:
-            page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
+            page.wait_for_function(self._SETTLE_JS, timeout=timeout_ms)
         except Exception:
             pass
-        page.wait_for_timeout(500)
         # Consent banners are often injected after initial load; try to clear them quickly.
         self._dismiss_cookie_banner(page, timeout_ms=3_000)
 
     def _looks_like_post_login_loading(self, page: Page) -> bool:
+        return self._page_signals(page)["post_login_loading"]
+
+    def _compute_looks_like_post_login_loading(self, page: Page) -> bool:
         """
         Detect the portal's post-login OIDC callback loading view (seen as:
         "Loading... Please wait while we gather your data.").
@@ -1379,17 +2515,37 @@ class ServicerPortalClient:
             return
 
         logger.info("Portal is finalizing the login session (callback loading). Waiting up to %.1fs...", timeout_ms / 1000)
-        deadline = time.time() + (timeout_ms / 1000)
-        while time.time() < deadline:
-            if not self._looks_like_post_login_loading(page):
-                return
+        try:
+            # One native in-browser wait instead of a 500ms Python polling loop: the
+            # predicate runs at the page's own cadence and the Python thread sleeps.
+            page.wait_for_function(
+                "() => !document.querySelector('[data-cy=\"loading-card\"]')"
+                " && !document.querySelector('app-callback')"
+                " && !((document.body && document.body.innerText) || '')"
+                ".includes('Please wait while we gather your data.')",
+                timeout=timeout_ms,
+            )
+        except Exception:
+            self._save_debug(page, debug_dir=debug_dir, name_prefix="post_login_loading_timeout")
+            raise TimeoutError("Portal post-login loading did not finish in time (still showing callback spinner).")
 
-            # Consent banners can still pop in and block; keep them cleared.
-            self._dismiss_cookie_banner(page, timeout_ms=3_000)
-            page.wait_for_timeout(500)
+        # Consent banners can pop in while the callback settles; clear them once after.
+        self._dismiss_cookie_banner(page, timeout_ms=3_000)
+
+    def _wait_for_text_attached(self, page: Page, needle: str, *, timeout_ms: int) -> bool:
+        """
+        Wait for an element containing `needle` to be attached, via the text locator engine.
 
-        self._save_debug(page, debug_dir=debug_dir, name_prefix="post_login_loading_timeout")
-        raise TimeoutError("Portal post-login loading did not finish in time (still showing callback spinner).")
+        Cheaper than `_wait_for_body_text_contains` for text that lives inside a single
+        element (like the "Group:" headers): each innerText poll forces a full-page layout
+        flush, while the locator wait matches per-element. Use the body-text variant only
+        when the needle may span element boundaries.
+        """
+        try:
+            page.locator(f"text={needle}").first.wait_for(state="attached", timeout=timeout_ms)
+            return True
+        except Exception:
+            return False
 
     def _wait_for_body_text_contains(self, page: Page, needle: str, *, timeout_ms: int) -> bool:
         """
@@ -1406,6 +2562,9 @@ class ServicerPortalClient:
         except Exception:
             return False
 
+    # After a completed dismissal pass, skip this many subsequent calls for the page.
+    _BANNER_RECHECK_EVERY = 10
+
     def _dismiss_cookie_banner(self, page: Page, *, timeout_ms: int = 20_000) -> None:
         """
         Best-effort cookie banner dismissal (doesn't fail if not present).
@@ -1413,63 +2572,83 @@ class ServicerPortalClient:
         The portal uses a Transcend consent manager that may be injected late and/or inside an iframe,
         and sometimes isn't exposed via accessibility roles. We therefore search all frames and
         click by visible text.
+
+        Called from every polling loop, so a completed pass (dismissed or no banner found)
+        is remembered per page and the next _BANNER_RECHECK_EVERY calls return immediately;
+        without this the loops re-paid the full multi-second scan on every tick.
         """
-        # First, try to hide the Transcend host (works even if consent is rendered in a CLOSED shadow root).
-        try:
-            page.evaluate(
-                """
-                () => {
-                  const host = document.getElementById('transcend-consent-manager');
-                  if (!host) return false;
-                  host.style.setProperty('display', 'none', 'important');
-                  host.style.setProperty('pointer-events', 'none', 'important');
-                  return true;
-                }
-                """
-            )
-        except Exception:
-            pass
+        pid = id(page)
+        credits = self._banner_skip_credits.get(pid, 0)
+        if credits > 0:
+            self._banner_skip_credits[pid] = credits - 1
+            return
 
-        # Poll briefly; the consent UI is often injected after DOMContentLoaded.
-        attempts = max(1, int(timeout_ms / 250))
-        for _ in range(attempts):
+        # Hiding the Transcend host is handled by the _CONSENT_DISMISS_SCRIPT init script
+        # (a MutationObserver that hides the host the moment it is injected), so no per-call
+        # evaluate is needed here; this method only covers the click fallbacks and the rare
+        # re-injection after the observer has disconnected.
+
+        # Poll with exponential backoff (50ms doubling to a 500ms cap); the banner
+        # usually resolves within the first tick or two, so a fixed 250ms cadence
+        # mostly added latency. One evaluate per frame per tick does banner detection
+        # and the click in-page, replacing the previous 6+ locator round-trips per
+        # frame (presence probe, "Accept all" button/text, then five fallback phrasings).
+        # The banner only ever lives in the main frame or a consent-manager iframe
+        # (identifiable by URL), so the sweep iterates a filtered frame list instead
+        # of re-snapshotting the full frame tree (ad/tracking iframes included) on
+        # every tick. Refreshed every few ticks in case the consent iframe attaches late.
+        def _consent_frames() -> list:
             try:
-                frames = page.frames
+                main = page.main_frame
+                return [
+                    fr
+                    for fr in page.frames
+                    if fr is main
+                    or not fr.url
+                    or "consent" in fr.url.lower()
+                    or "transcend" in fr.url.lower()
+                ]
             except Exception:
-                frames = []
+                return []
+
+        deadline = time.time() + (timeout_ms / 1000.0)
+        delay_ms = 50
+        tick = 0
+        frames = _consent_frames()
+        while True:
+            if tick and tick % 4 == 0:
+                frames = _consent_frames()
+            tick += 1
 
             for fr in frames:
                 try:
-                    # If the banner isn't present, don't spam clicks.
-                    banner_present = fr.get_by_text("This site uses cookies", exact=False)
-                    if banner_present.count() == 0:
-                        continue
-
-                    # Consent banner buttons: "Accept all" / "Reject all"
-                    accept_btn = fr.locator('button:has-text("Accept all")')
-                    if accept_btn.count() > 0:
-                        accept_btn.first.click(timeout=2_000, force=True)
-                        page.wait_for_timeout(300)
-                        return
-
-                    # Text fallback (sometimes the element isn't a <button>)
-                    accept_all = fr.get_by_text("Accept all", exact=False)
-                    if accept_all.count() > 0:
-                        accept_all.first.click(timeout=2_000, force=True)
-                        page.wait_for_timeout(300)
+                    if fr.evaluate(self._CONSENT_CLICK_JS, list(self._CONSENT_CLICK_PHRASES)):
+                        # Wait for the host to actually leave the DOM instead of a blind 300ms.
+                        try:
+                            page.wait_for_function(
+                                "() => !document.getElementById('transcend-consent-manager')",
+                                timeout=2_000,
+                            )
+                        except Exception:
+                            pass
+                        self._banner_skip_credits[pid] = self._BANNER_RECHECK_EVERY
                         return
-
-                    # Fallback: other common consent button phrasings
-                    for txt in ("Accept", "I agree", "Agree", "Got it", "OK"):
-                        cand = fr.get_by_text(txt, exact=False)
-                        if cand.count() > 0:
-                            cand.first.click(timeout=2_000, force=True)
-                            page.wait_for_timeout(300)
-                            return
                 except Exception:
                     continue
 
-            page.wait_for_timeout(250)
+            # If the Transcend host isn't in the DOM at all, the banner was either never
+            # injected or already handled; stop sweeping frames — the init-script
+            # observer catches any late injection.
+            try:
+                if page.evaluate("() => document.getElementById('transcend-consent-manager') === null"):
+                    break
+            except Exception:
+                pass
+
+            if time.time() >= deadline:
+                break
+            page.wait_for_timeout(delay_ms)
+            delay_ms = min(delay_ms * 2, 500)
 
         # Final fallback: attempt to remove the host entirely (only affects consent UI).
         try:
@@ -1484,8 +2663,13 @@ class ServicerPortalClient:
             )
         except Exception:
             pass
+        # No banner found (or it's been force-removed): negative-cache that too.
+        self._banner_skip_credits[pid] = self._BANNER_RECHECK_EVERY
 
     def _looks_like_mfa(self, page: Page) -> bool:
+        return self._page_signals(page)["mfa"]
+
+    def _compute_looks_like_mfa(self, page: Page) -> bool:
         # Heuristic: presence of a numeric code input and Email option.
         code_inputs = page.locator(self.selectors.mfa_code_input)
         if code_inputs.count() > 0:
@@ -1690,7 +2874,7 @@ class ServicerPortalClient:
     def _edf_money_to_cents(s: str) -> int:
         s = s or ""
         neg = ("-" in s) or ("(" in s)
-        digits = re.sub(r"[^0-9.]", "", s)
+        digits = _RE_NON_MONEY_CHARS.sub("", s)
         if not digits:
             return 0
         val = int(round(float(digits) * 100))
@@ -1698,12 +2882,12 @@ class ServicerPortalClient:
 
     @staticmethod
     def _edf_group_token(loan_name: str) -> str:
-        m = re.match(r"\s*(\d+-\d+)", loan_name or "")
+        m = _RE_EDF_GROUP_TOKEN.match(loan_name or "")
         return m.group(1) if m else ""
 
     @staticmethod
     def _edf_parse_mdy(s: str):
-        m = re.match(r"\s*(\d{1,2})/(\d{1,2})/(\d{4})", s or "")
+        m = _RE_MDY_PREFIX.match(s or "")
         if not m:
             return None
         return date(int(m.group(3)), int(m.group(1)), int(m.group(2)))
@@ -1897,18 +3081,24 @@ class ServicerPortalClient:
         except Exception:
             logger.debug("Could not click Email MFA option (continuing).", exc_info=True)
 
-        # Best-effort click Send/Continue.
-        for t in (self.selectors.mfa_send_code_text, "Continue", "Next"):
-            try:
-                btn = page.get_by_role("button", name=t)
-                if btn.count() > 0:
-                    btn.first.click()
-                    break
-            except Exception:
-                continue
+        # Best-effort click Send/Continue. One CSS union instead of three get_by_role
+        # probes; the MFA screen shows exactly one of these, so DOM order is safe.
+        try:
+            btn = page.locator(
+                f'button:text-is("{self.selectors.mfa_send_code_text}"), '
+                'button:text-is("Continue"), button:text-is("Next")'
+            )
+            if btn.count() > 0:
+                btn.first.click()
+        except Exception:
+            logger.debug("Could not click MFA send/continue button (continuing).", exc_info=True)
 
-        # Wait for code input to be visible.
-        page.wait_for_timeout(1000)
+        # Wait for the code input to actually become visible (the old fixed 1s sleep
+        # either overshot on fast loads or undershot on slow ones).
+        try:
+            page.locator(self.selectors.mfa_code_input).first.wait_for(state="visible", timeout=10_000)
+        except Exception:
+            logger.debug("MFA code input not visible yet; proceeding best-effort.", exc_info=True)
         self._step(page, debug_dir=debug_dir, name="mfa_code_input_visible")
 
         # Best-effort: check "remember this device/client" so the portal may skip MFA for ~90 days.
@@ -1939,7 +3129,17 @@ class ServicerPortalClient:
 
         self._wait_for_settle(page)
         self._step(page, debug_dir=debug_dir, name="mfa_after_submit")
-        page.wait_for_timeout(750)
+        # Event-driven post-submit wait: the code input disappearing means the portal
+        # accepted the code; the rejection banner appearing means it did not.
+        try:
+            page.wait_for_function(
+                "(sel) => !document.querySelector(sel)"
+                " || (((document.body && document.body.innerText) || '').includes('Invalid code entered'))",
+                arg=self.selectors.mfa_code_input,
+                timeout=10_000,
+            )
+        except Exception:
+            logger.debug("MFA post-submit state did not settle in time.", exc_info=True)
 
         # If the code was rejected, stop immediately (otherwise later steps fail confusingly).
         if page.get_by_text("Invalid code entered", exact=False).count() > 0:
@@ -1970,7 +3170,7 @@ class ServicerPortalClient:
             pass
 
         try:
-            body = page.inner_text("body")
+            body = self._body_text(page)
             if "DNS_PROBE_FINISHED_NXDOMAIN" in body:
                 return True
             if "This site can’t be reached" in body or "This site can't be reached" in body:
@@ -1986,7 +3186,7 @@ class ServicerPortalClient:
         when anti-automation detection fires (especially in headless mode).
         """
         try:
-            body = (page.inner_text("body") or "").strip()
+            body = (self._body_text(page) or "").strip()
             if not body or len(body) > 500:
                 return False
             low = body.lower()
@@ -2010,6 +3210,80 @@ class ServicerPortalClient:
                 "See https://github.com/mattebad/monarch-studentaid-sync/issues/9 for discussion."
             )
 
+    def _extract_sections_parallel(
+        self,
+        page: Page,
+        *,
+        groups: list[str],
+        debug_dir: str,
+        max_payments_to_scan: int,
+        payments_since: Optional[date],
+        allow_empty_loans: bool,
+        state_path: Path,
+        headless: bool,
+    ) -> tuple[list[LoanSnapshot], list[PaymentAllocation]]:
+        """
+        Run loan extraction on the logged-in page while a worker thread scans payment activity.
+
+        Sync Playwright objects are bound to the thread that created them, so the worker starts
+        its own driver/browser and joins the authenticated session via the storage_state we just
+        exported after login. Both flows are network-bound, so overlapping them roughly halves
+        the scraping phase; if the worker fails for any reason we fall back to the sequential
+        scan on the main session.
+        """
+        expected_groups = set(groups) if groups else None
+
+        def _payments_worker() -> list[PaymentAllocation]:
+            with sync_playwright() as p:
+                browser = self._launch_browser(p, headless=headless, slow_mo=0)
+                try:
+                    ctx = self._create_browser_context(browser, storage_state=str(state_path))
+                    try:
+                        self._install_context_hooks(ctx)
+                        wpage = ctx.new_page()
+                        wpage.goto(self.base_url, wait_until="domcontentloaded")
+                        self._wait_for_settle(wpage)
+                        self._wait_for_post_login_ready(wpage, debug_dir=debug_dir, timeout_ms=60_000)
+                        if not self._looks_logged_in(wpage):
+                            raise RuntimeError("Parallel payment scan: stored session was not accepted.")
+                        return self._extract_payment_allocations(
+                            wpage,
+                            groups=groups,
+                            debug_dir=debug_dir,
+                            max_payments_to_scan=max_payments_to_scan,
+                            payments_since=payments_since,
+                            expected_groups=expected_groups,
+                        )
+                    finally:
+                        ctx.close()
+                finally:
+                    browser.close()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            fut = pool.submit(_payments_worker)
+            loans = self._extract_loans(
+                page,
+                groups=groups,
+                debug_dir=debug_dir,
+                allow_empty_loans=allow_empty_loans,
+            )
+            try:
+                payments = fut.result()
+            except Exception:
+                logger.warning(
+                    "Parallel payment scan failed; re-running payment extraction sequentially on the main session.",
+                    exc_info=True,
+                )
+                payments = self._extract_payment_allocations(
+                    page,
+                    groups=groups,
+                    debug_dir=debug_dir,
+                    max_payments_to_scan=max_payments_to_scan,
+                    payments_since=payments_since,
+                    expected_groups=expected_groups,
+                )
+        return loans, payments
+
     def _extract_loans(
         self,
         page: Page,
@@ -2031,17 +3305,18 @@ class ServicerPortalClient:
         self._goto_section(page, self.selectors.nav_my_loans_text, debug_dir=debug_dir)
 
         # Wait for the loan details content to actually render before parsing.
-        if not self._wait_for_body_text_contains(page, "Group:", timeout_ms=15_000):
+        if not self._wait_for_text_attached(page, "Group:", timeout_ms=15_000):
             try:
-                page.goto(f"{self.base_url}/loan-details", wait_until="domcontentloaded")
-                self._wait_for_settle(page, timeout_ms=30_000)
+                # "commit" returns as soon as the navigation lands; the "Group:" wait
+                # below is the actual readiness check, so there's nothing to settle here.
+                page.goto(f"{self.base_url}/loan-details", wait_until="commit")
             except Exception:
                 # We'll validate below; if still not loaded, we'll raise with debug artifacts.
                 pass
 
-        if not self._wait_for_body_text_contains(page, "Group:", timeout_ms=30_000):
+        if not self._wait_for_text_attached(page, "Group:", timeout_ms=30_000):
             self._save_debug(page, debug_dir=debug_dir, name_prefix="loan_details_not_loaded")
-            body_text = page.inner_text("body")
+            body_text = self._body_text(page)
             if allow_empty_loans and self._looks_like_empty_loans_summary(body_text):
                 logger.warning(
                     "Loan details page shows no active loans (zero balance); skipping loan snapshot extraction."
@@ -2054,24 +3329,102 @@ class ServicerPortalClient:
         # The "My Loans" page lists all groups on a single page. Our earlier approach of
         # parsing the entire page for each group caused every group to pick the *first* match.
         # Instead, slice the page text per-group and parse within that slice.
-        full_text = page.inner_text("body")
-
-        sections = self._extract_all_group_sections(full_text)
+        sections = self._group_sections_from_page(page)
         if not sections:
             self._save_debug(page, debug_dir=debug_dir, name_prefix="loan_details_no_groups_found")
             raise RuntimeError("Could not find any 'Group:' sections on the loan details page.")
 
-        out: list[LoanSnapshot] = []
-        for group in groups:
+        self._step(page, debug_dir=debug_dir, name="loans_before_parse_groups")
+
+        # Prebuild the section indexes on this thread so workers don't race to build them.
+        self._group_section_index(sections)
+
+        def _parse_one(group: str) -> LoanSnapshot:
             try:
-                self._step(page, debug_dir=debug_dir, name=f"loans_before_parse_group_{group}")
                 group_text = self._match_group_section_text(sections, group=group)
-                out.append(self._parse_loan_snapshot(group=group, body_text=group_text))
+                return self._parse_loan_snapshot(group=group, body_text=group_text)
             except Exception:
-                self._save_debug(page, debug_dir=debug_dir, name_prefix=f"loan_{group}_error")
+                logger.error("Failed to parse loan snapshot for group=%s", group)
                 raise
+
+        # Matching + parsing is pure string work on the already-materialized sections
+        # (no Playwright calls, which are thread-bound), so it is safe to fan out.
+        try:
+            if len(groups) > 1:
+                with ThreadPoolExecutor(max_workers=min(4, len(groups))) as pool:
+                    out = list(pool.map(_parse_one, groups))
+            else:
+                out = [_parse_one(group) for group in groups]
+        except Exception:
+            self._save_debug(page, debug_dir=debug_dir, name_prefix="loan_parse_error")
+            raise
+        return out
+
+    # Slices the body text into per-group sections inside the browser, so only the
+    # section strings (a few KB each) cross CDP instead of the whole body text.
+    _GROUP_SECTIONS_JS = """
+    () => {
+      const txt = (document.body && document.body.innerText) || '';
+      const re = /Group:\\s*([^\\n\\r]+)/gi;
+      const marks = [];
+      let m;
+      while ((m = re.exec(txt)) !== null) marks.push([m.index, (m[1] || '').trim()]);
+      return marks.map(([start, label], i) => ({
+        label,
+        text: txt.slice(start, i + 1 < marks.length ? marks[i + 1][0] : txt.length),
+      }));
+    }
+    """
+
+    def _group_sections_from_page(self, page: Page) -> list[tuple[str, str, str]]:
+        """
+        Group sections scanned and sliced in-browser (same shape as
+        _extract_all_group_sections, which remains the fallback when evaluation fails).
+        """
+        try:
+            raw = page.evaluate(self._GROUP_SECTIONS_JS)
+        except Exception:
+            logger.debug("In-browser group sectioning failed; falling back to body text.", exc_info=True)
+            raw = None
+        if raw is None:
+            return self._extract_all_group_sections(self._body_text(page))
+        out: list[tuple[str, str, str]] = []
+        for item in raw:
+            label = str(item.get("label") or "").strip()
+            out.append((self._group_token_from_label(label), label, str(item.get("text") or "")))
         return out
 
+    def _group_header_labels(self, page: Page) -> list[str]:
+        """
+        Return the raw text after each "Group:" header, scanning entirely in-browser.
+
+        Discovery only needs the header labels, so there's no reason to ship the full
+        body text (often hundreds of KB) across the CDP connection just to regex it in
+        Python — the browser returns a small JSON array of label strings instead.
+        """
+        try:
+            labels = page.evaluate(
+                """() => {
+                  const text = (document.body && document.body.innerText) || '';
+                  const out = [];
+                  const re = /Group:\\s*([^\\n\\r]+)/gi;
+                  let m;
+                  while ((m = re.exec(text)) !== null) out.push((m[1] || '').trim());
+                  return out;
+                }"""
+            )
+            return [str(label) for label in (labels or [])]
+        except Exception:
+            # Fall back to the full-text path used by loan extraction.
+            logger.debug("In-browser group header scan failed; falling back to body text.", exc_info=True)
+            return [label for _, label, _ in self._extract_all_group_sections(self._body_text(page))]
+
+    @staticmethod
+    def _group_token_from_label(label: str) -> str:
+        """Best-effort short group ID (e.g. "AA", "1-01") parsed from the start of a header label."""
+        tok_m = _RE_GROUP_TOKEN.match(label)
+        return tok_m.group(1).upper() if tok_m else ""
+
     def _extract_all_group_sections(self, full_text: str) -> list[tuple[str, str, str]]:
         """
         Return a list of discovered group sections from the loan-details page.
@@ -2084,8 +3437,15 @@ class ServicerPortalClient:
         - Servicers are not consistent about group label formats. We avoid hardcoding AA/AB assumptions.
         - group_token is best-effort and may be empty if we can't parse a token.
         """
+        # C-level substring screen before the regex sweep: the empty-loans page has no
+        # group headers at all, so don't pay the NFA walk over 200KB+ of body text just
+        # to find nothing. Both casings are checked since the header match itself is
+        # deliberately case-insensitive (servicers vary).
+        if "Group:" not in full_text and "group:" not in full_text:
+            return []
+
         # Find every "Group:" header and slice to the next header (or end of text).
-        matches = list(re.finditer(r"Group:\s*([^\n\r]+)", full_text, flags=re.I))
+        matches = list(_RE_GROUP_HEADER.finditer(full_text))
         if not matches:
             return []
 
@@ -2096,10 +3456,7 @@ class ServicerPortalClient:
             section_text = full_text[start:end]
 
             label = (m.group(1) or "").strip()
-            tok_m = re.match(r"([A-Z0-9][A-Z0-9-]{1,31})", label, flags=re.I)
-            token = tok_m.group(1).upper() if tok_m else ""
-
-            out.append((token, label, section_text))
+            out.append((self._group_token_from_label(label), label, section_text))
         return out
 
     def _looks_like_empty_loans_summary(self, body_text: str) -> bool:
@@ -2109,9 +3466,9 @@ class ServicerPortalClient:
         t = (body_text or "").casefold()
         if "group and loan summary" not in t:
             return False
-        if not re.search(r"current balance\s*:\s*\$?\s*0\.00", t):
+        if not _RE_ZERO_BALANCE.search(t):
             return False
-        if not re.search(r"current amount due\s*:\s*\$?\s*0\.00", t):
+        if not _RE_ZERO_AMOUNT_DUE.search(t):
             return False
         return True
 
@@ -2154,16 +3511,27 @@ class ServicerPortalClient:
         # Strong signal: expected group token appears in detail text.
         expected = {g.strip().upper() for g in (expected_groups or set()) if (g or "").strip()}
         if expected:
-            token_re = re.compile(r"\b(" + "|".join(map(re.escape, sorted(expected, key=len, reverse=True))) + r")\b")
+            token_re = _token_alternation_pattern(tuple(sorted(expected, key=len, reverse=True)))
             if token_re.search(text):
                 return True
 
         # Generic fallback when expected groups are unavailable.
-        if re.search(r"\b(?:Loan\s+Group|Group)\b", text, re.I):
-            if re.search(r"\$\s*[\d,]+\.\d{2}", text):
+        if _RE_GROUP_WORD.search(text):
+            if _RE_DOLLAR_MONEY.search(text):
                 return True
         return False
 
+    # One evaluate_all finds the first visible candidate, scrolls it into view, and
+    # clicks it in-page — replacing the count + nth/is_visible/scroll/click probe loop
+    # (2-3 CDP round-trips per candidate) with a single call.
+    _CLICK_FIRST_VISIBLE_JS = (
+        "els => {"
+        " const e = els.find((x) => x.offsetParent !== null);"
+        " if (e) { e.scrollIntoView({ block: 'center' }); e.click(); return true; }"
+        " return false;"
+        " }"
+    )
+
     def _click_payment_history_all(self, page: Page) -> bool:
         try:
             selects = page.locator("select")
@@ -2181,47 +3549,26 @@ class ServicerPortalClient:
         except Exception:
             pass
 
-        for loc in (
-            page.get_by_role("button", name=re.compile(r"Last\s+12\s+Months", re.I)),
-            page.get_by_text("Last 12 Months", exact=True),
-        ):
-            try:
-                n = min(int(loc.count()), 10)
-            except Exception:
-                n = 0
-            for i in range(n):
-                el = loc.nth(i)
-                try:
-                    if not el.is_visible():
-                        continue
-                    el.scroll_into_view_if_needed(timeout=2_000)
-                    el.click(timeout=5_000)
-                    self._wait_for_settle(page)
-                    break
-                except Exception:
-                    continue
-
-        targets = (
-            page.get_by_role("button", name=re.compile(r"^All$", re.I)),
-            page.get_by_role("link", name=re.compile(r"^All$", re.I)),
-            page.get_by_text("All", exact=True),
+        # CSS text selectors stay in Playwright's native engine; get_by_role walks the
+        # whole tree computing accessible names per probe.
+        loc = page.locator(
+            'button:has-text("Last 12 Months"), a:has-text("Last 12 Months"), '
+            '[role="button"]:has-text("Last 12 Months")'
         )
-        for loc in targets:
-            try:
-                n = min(int(loc.count()), 10)
-            except Exception:
-                n = 0
-            for i in range(n):
-                el = loc.nth(i)
-                try:
-                    if not el.is_visible():
-                        continue
-                    el.scroll_into_view_if_needed(timeout=2_000)
-                    el.click(timeout=5_000)
-                    self._wait_for_settle(page)
-                    return True
-                except Exception:
-                    continue
+        try:
+            if loc.evaluate_all(self._CLICK_FIRST_VISIBLE_JS):
+                self._wait_for_settle(page)
+        except Exception:
+            pass
+
+        # :text-is keeps the exact-match semantics ("All" must not match "Install" etc.).
+        targets = page.locator('button:text-is("All"), a:text-is("All"), [role="button"]:text-is("All")')
+        try:
+            if targets.evaluate_all(self._CLICK_FIRST_VISIBLE_JS):
+                self._wait_for_settle(page)
+                return True
+        except Exception:
+            pass
         return False
 
     def _click_payment_date_entry(self, page: Page, dt_str: str, *, details_link_first: bool = False) -> None:
@@ -2230,10 +3577,13 @@ class ServicerPortalClient:
 
         `details_link_first=True` prioritizes the known CRI table anchor selector.
         """
-        esc_dt = re.escape(dt_str)
-        details_link = page.locator("a.detailsLink").filter(has_text=re.compile(rf"^\s*{esc_dt}\s*$"))
-        role_link = page.get_by_role("link", name=re.compile(rf"^\s*{esc_dt}\s*$"))
-        role_button = page.get_by_role("button", name=re.compile(rf"^\s*{esc_dt}\s*$"))
+        # Date strings are digits and slashes, so embedding them in :text-is is safe.
+        # The CSS unions stay in the native selector engine instead of role-walking the
+        # tree once per strategy; we can't pre-tag rows with a data attribute because the
+        # list re-renders on every return navigation between detail views.
+        details_link = page.locator("a.detailsLink").filter(has_text=_exact_line_pattern(dt_str))
+        role_link = page.locator(f'a:text-is("{dt_str}"), [role="link"]:text-is("{dt_str}")')
+        role_button = page.locator(f'button:text-is("{dt_str}"), [role="button"]:text-is("{dt_str}")')
         exact_text = page.get_by_text(dt_str, exact=True)
 
         candidates = (
@@ -2258,6 +3608,21 @@ class ServicerPortalClient:
 
         raise RuntimeError(f"Could not click payment date entry: {dt_str}")
 
+    # In-browser readiness probe mirroring _looks_like_payment_detail_context, so the
+    # detail-wait polling ticks don't serialize the whole body text over CDP just to
+    # learn the detail view hasn't rendered yet.
+    _PAYMENT_DETAIL_READY_JS = """
+    (tokens) => {
+      const text = (document.body && document.body.innerText) || '';
+      if (!text.trim()) return false;
+      const esc = (s) => s.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
+      for (const t of tokens) {
+        if (new RegExp('\\\\b' + esc(t) + '\\\\b').test(text)) return true;
+      }
+      return /\\b(?:Loan\\s+Group|Group)\\b/i.test(text) && /\\$\\s*[\\d,]+\\.\\d{2}/.test(text);
+    }
+    """
+
     def _wait_for_payment_detail_context(
         self,
         page: Page,
@@ -2268,20 +3633,48 @@ class ServicerPortalClient:
         """
         Poll briefly for payment detail content to appear after clicking a payment date.
         Returns the latest body text (detail or list).
+
+        Readiness is probed in-browser; the full body text is fetched only once, when the
+        detail is ready (or at timeout for the caller's retry diagnostics).
         """
         deadline = time.time() + (timeout_ms / 1000.0)
-        latest = ""
+        tokens = sorted(
+            {g.strip().upper() for g in (expected_groups or set()) if (g or "").strip()},
+            key=len,
+            reverse=True,
+        )
         while time.time() < deadline:
             try:
-                latest = page.inner_text("body")
+                if page.evaluate(self._PAYMENT_DETAIL_READY_JS, tokens):
+                    return self._body_text(page)
             except Exception:
-                latest = ""
-
-            if self._looks_like_payment_detail_context(latest, expected_groups=expected_groups):
-                return latest
+                logger.debug("Payment detail readiness probe failed; retrying.", exc_info=True)
 
             page.wait_for_timeout(250)
-        return latest
+        return self._body_text(page)
+
+    def _group_section_index(self, sections: list[tuple[str, str, str]]) -> tuple[dict, dict]:
+        """
+        (token -> section_text, uppercased label -> section_text) indexes for `sections`.
+
+        Memoized on list identity: the extraction loop resolves every configured group
+        against the same sections list, so the indexes are built once per page instead
+        of re-scanning the list per group. First occurrence wins, matching the original
+        linear-scan semantics.
+        """
+        memo = self._section_index_memo
+        if memo is not None and memo[0] is sections:
+            return memo[1]
+        by_token: dict[str, str] = {}
+        by_label: dict[str, str] = {}
+        for token, label, section_text in sections:
+            if token:
+                by_token.setdefault(token.upper(), section_text)
+            lbl = (label or "").strip().upper()
+            if lbl:
+                by_label.setdefault(lbl, section_text)
+        self._section_index_memo = (sections, (by_token, by_label))
+        return by_token, by_label
 
     def _match_group_section_text(self, sections: list[tuple[str, str, str]], *, group: str) -> str:
         """
@@ -2297,11 +3690,12 @@ class ServicerPortalClient:
             raise RuntimeError("Empty loan group provided.")
 
         g_up = g.upper()
+        by_token, by_label = self._group_section_index(sections)
 
         # 1) exact token match
-        for token, label, section_text in sections:
-            if token and token.upper() == g_up:
-                return section_text
+        hit = by_token.get(g_up)
+        if hit is not None:
+            return hit
 
         # 2) label prefix match (covers cases like "Group: 1-01 Direct Loan - Subsidized" with group="1-01")
         for token, label, section_text in sections:
@@ -2309,9 +3703,9 @@ class ServicerPortalClient:
                 return section_text
 
         # 3) raw label match (fallback)
-        for token, label, section_text in sections:
-            if (label or "").strip().upper() == g_up:
-                return section_text
+        hit = by_label.get(g_up)
+        if hit is not None:
+            return hit
 
         # Not found: build a helpful error with discovered groups.
         discovered_tokens = [t for (t, _, _) in sections if t]
@@ -2348,7 +3742,7 @@ class ServicerPortalClient:
         """
         # Case-insensitive: some portals may render labels with mixed case, while config/env
         # normalization may uppercase tokens.
-        start_match = re.search(rf"Group:\s*{re.escape(group)}\b", full_text, flags=re.I)
+        start_match = _group_section_start_pattern(group).search(full_text)
         if not start_match:
             raise RuntimeError(f"Could not locate group section header for group={group}")
 
@@ -2356,7 +3750,7 @@ class ServicerPortalClient:
         remainder = full_text[start_match.end() :]
 
         # Find the next group header. Do not assume a specific ID format; servicers vary.
-        next_match = re.search(r"\n\s*Group:\s*", remainder, flags=re.I)
+        next_match = _RE_NEXT_GROUP_HEADER.search(remainder)
         end = start_match.end() + next_match.start() if next_match else len(full_text)
 
         return full_text[start:end]
@@ -2390,63 +3784,251 @@ class ServicerPortalClient:
             logger.debug("Group header text not found after click (group=%s).", group)
 
     def _parse_loan_snapshot(self, *, group: str, body_text: str) -> LoanSnapshot:
-        # Money fields
-        principal = self._money_after(r"Principal Balance:\s*", body_text)
-        outstanding = self._money_after(r"Outstanding Balance:\s*", body_text)
-        daily_interest = self._money_after(r"Total Daily Interest Accrual:\s*", body_text, default=0)
+        # One finditer over the section with the combined field alternation, instead
+        # of a separate regex sweep per label. First occurrence of each field wins,
+        # matching the old per-label .search() behavior.
+        found: dict[str, str] = {}
+        for m in _RE_LOAN_FIELDS.finditer(body_text):
+            key = m.lastgroup
+            if key == "lp_date":
+                # The Last Payment alternative fills both lp_amount and lp_date;
+                # lastgroup only reports the final one.
+                if "lp_amount" not in found:
+                    found["lp_amount"] = m.group("lp_amount")
+                    found["lp_date"] = m.group("lp_date")
+            elif key is not None and key not in found:
+                found[key] = m.group(key)
+
+        def _money(key: str, *, default: Optional[int] = None) -> int:
+            raw = found.get(key)
+            if raw is None:
+                if default is None:
+                    raise RuntimeError(f"Could not find money for field: {key}")
+                return default
+            return money_to_cents(raw)
+
+        due_raw = found.get("due")
+        lp_amount_raw = found.get("lp_amount")
+        lp_date_raw = found.get("lp_date")
+        eff_rate = found.get("eff_rate")
+        reg_rate = found.get("reg_rate")
 
-        # Unpaid accrued interest line includes an \"as-of\" date embedded; ignore the date for now.
-        accrued_interest = self._money_after(r"Unpaid Accrued Interest.*?:\s*", body_text)
+        return LoanSnapshot(
+            group=group,
+            principal_balance_cents=_money("principal"),
+            accrued_interest_cents=_money("accrued"),
+            outstanding_balance_cents=_money("outstanding"),
+            daily_interest_accrual_cents=_money("daily", default=0),
+            due_date=parse_us_date(due_raw) if due_raw else None,
+            last_payment_date=parse_us_date(lp_date_raw) if lp_date_raw else None,
+            last_payment_amount_cents=money_to_cents(lp_amount_raw) if lp_amount_raw else None,
+            raw_effective_interest_rate=eff_rate.strip() if eff_rate else None,
+            raw_regulatory_interest_rate=reg_rate.strip() if reg_rate else None,
+        )
+
+    # Finds a Payment Activity table that already carries the allocation breakdown
+    # (a Group column plus Applied-to-Principal), and returns its header + body cells.
+    _PAYMENT_LIST_INLINE_JS = """
+    () => {
+      for (const table of document.querySelectorAll('table')) {
+        const headerCells = table.querySelectorAll('thead th, thead td, tr:first-child th');
+        const headers = Array.from(headerCells).map((c) => (c.innerText || '').trim().toLowerCase());
+        if (!headers.length) continue;
+        if (!headers.some((h) => h.includes('group')) || !headers.some((h) => h.includes('principal'))) continue;
+        const rows = [];
+        for (const tr of table.querySelectorAll('tbody tr')) {
+          const cells = Array.from(tr.querySelectorAll('td')).map((c) => (c.innerText || '').trim());
+          if (cells.length) rows.push(cells);
+        }
+        return { headers, rows };
+      }
+      return null;
+    }
+    """
+
+    def _inline_payment_list_allocations(
+        self, page: Page, *, expected_groups: Optional[set[str]] = None
+    ) -> dict[date, list[PaymentAllocation]]:
+        """
+        Best-effort parse of allocations straight off the Payment Activity list.
 
-        # Dates
-        due_date = self._date_after(r"Due Date:\s*", body_text, default=None)
+        Some portals render the full breakdown (group, applied principal/interest) as
+        list columns, making the open-detail/parse/close round-trip per row pure waste.
+        Returns {payment_date: allocations}; dates absent from the result (or the whole
+        result being empty) fall back to the click-through path.
+        """
+        if not self._scrape_payment_list_inline:
+            return {}
+        try:
+            data = page.evaluate(self._PAYMENT_LIST_INLINE_JS)
+        except Exception:
+            logger.debug("Inline payment-list scan failed; using click-through path.", exc_info=True)
+            return {}
+        if not isinstance(data, dict):
+            return {}
 
-        last_payment_amount, last_payment_date = self._last_payment(body_text)
+        headers = [str(h) for h in (data.get("headers") or [])]
 
-        eff_rate = self._text_after(r"Effective Interest Rate:\s*", body_text, default=None)
-        reg_rate = self._text_after(r"Regulatory Interest Rate:\s*", body_text, default=None)
+        def _col(*needles: str) -> Optional[int]:
+            for i, h in enumerate(headers):
+                if any(n in h for n in needles):
+                    return i
+            return None
 
-        return LoanSnapshot(
-            group=group,
-            principal_balance_cents=principal,
-            accrued_interest_cents=accrued_interest,
-            outstanding_balance_cents=outstanding,
-            daily_interest_accrual_cents=daily_interest,
-            due_date=due_date,
-            last_payment_date=last_payment_date,
-            last_payment_amount_cents=last_payment_amount,
-            raw_effective_interest_rate=eff_rate,
-            raw_regulatory_interest_rate=reg_rate,
-        )
+        i_date = _col("date")
+        i_group = _col("group")
+        i_principal = _col("principal")
+        i_interest = _col("interest")
+        i_total = _col("amount", "total")
+        # Without the full breakdown the detail view remains authoritative.
+        if i_date is None or i_group is None or i_principal is None or i_interest is None:
+            return {}
+
+        rows: list[tuple[date, str, int, int, int]] = []
+        for cells in data.get("rows") or []:
+            try:
+                needed = max(i for i in (i_date, i_group, i_principal, i_interest, i_total) if i is not None)
+                if len(cells) <= needed:
+                    continue
+                dm = _RE_ANY_DATE.search(cells[i_date])
+                if not dm:
+                    continue
+                dt = parse_us_date(dm.group(0))
+                tok = self._group_token_from_label(cells[i_group])
+                if not tok or tok == "TOTAL":
+                    continue
+                if expected_groups and tok not in expected_groups:
+                    continue
+                principal = money_to_cents(cells[i_principal])
+                interest = money_to_cents(cells[i_interest])
+                total = money_to_cents(cells[i_total]) if i_total is not None else principal + interest
+                rows.append((dt, tok, abs(total), abs(principal), abs(interest)))
+            except Exception:
+                continue
 
-    def _last_payment(self, body_text: str) -> tuple[Optional[int], Optional[date]]:
-        m = re.search(
-            r"Last Payment Received:\s*(\$?[\d,]+\.\d{2})\s+on\s+(\d{1,2}/\d{1,2}/\d{4})",
-            body_text,
-        )
-        if not m:
-            return None, None
-        return money_to_cents(m.group(1)), parse_us_date(m.group(2))
+        if not rows:
+            return {}
+
+        date_totals: dict[date, int] = {}
+        for dt, _, total, _, _ in rows:
+            date_totals[dt] = date_totals.get(dt, 0) + total
+
+        out: dict[date, list[PaymentAllocation]] = {}
+        for dt, tok, total, principal, interest in rows:
+            out.setdefault(dt, []).append(
+                PaymentAllocation(
+                    payment_date=dt,
+                    group=tok,
+                    total_applied_cents=total,
+                    principal_applied_cents=principal,
+                    interest_applied_cents=interest,
+                    payment_total_cents=date_totals[dt],
+                    payment_reference=None,
+                )
+            )
+        return out
 
-    def _money_after(self, label_pattern: str, text: str, *, default: Optional[int] = None) -> int:
-        m = re.search(label_pattern + r"(\$?[\d,]+\.\d{2})", text)
-        if not m:
-            if default is None:
-                raise RuntimeError(f"Could not find money for pattern: {label_pattern}")
-            return default
-        return money_to_cents(m.group(1))
+    # Structured read of the payment-detail allocation table: one evaluate returns
+    # header + body cells for the first table carrying group/principal/interest
+    # columns, so the common table layout skips the line-regex parse of the body text.
+    _PAYMENT_DETAIL_TABLE_JS = """
+    () => {
+      for (const table of document.querySelectorAll('table')) {
+        const headerCells = table.querySelectorAll('thead th, thead td, tr:first-child th');
+        const headers = Array.from(headerCells).map((c) => (c.innerText || '').trim().toLowerCase());
+        if (!headers.length) continue;
+        if (!headers.some((h) => h.includes('group'))) continue;
+        if (!headers.some((h) => h.includes('principal')) || !headers.some((h) => h.includes('interest'))) continue;
+        const rows = [];
+        for (const tr of table.querySelectorAll('tbody tr')) {
+          const cells = Array.from(tr.querySelectorAll('td')).map((c) => (c.innerText || '').trim());
+          if (cells.length) rows.push(cells);
+        }
+        return { headers, rows };
+      }
+      return null;
+    }
+    """
 
-    def _date_after(self, label_pattern: str, text: str, *, default: Optional[date]) -> Optional[date]:
-        m = re.search(label_pattern + r"(\d{1,2}/\d{1,2}/\d{4})", text)
-        if not m:
-            return default
-        return parse_us_date(m.group(1))
+    def _dom_payment_allocations(
+        self,
+        page: Page,
+        *,
+        payment_date: date,
+        expected_groups: Optional[set[str]] = None,
+        body_text: str = "",
+    ) -> list[PaymentAllocation]:
+        """
+        Structured extraction of the detail view's allocation table via one evaluate.
 
-    def _text_after(self, label_pattern: str, text: str, *, default: Optional[str]) -> Optional[str]:
-        m = re.search(label_pattern + r"([^\n\r]+)", text)
-        if not m:
-            return default
-        return m.group(1).strip()
+        Returns [] whenever no suitable table exists (responsive layouts render the
+        breakdown as stacked text, not <table>), in which case callers fall back to
+        the text parser.
+        """
+        try:
+            data = page.evaluate(self._PAYMENT_DETAIL_TABLE_JS)
+        except Exception:
+            logger.debug("Structured detail-table scan failed; using text parser.", exc_info=True)
+            return []
+        if not isinstance(data, dict):
+            return []
+
+        headers = [str(h) for h in (data.get("headers") or [])]
+
+        def _col(*needles: str) -> Optional[int]:
+            for i, h in enumerate(headers):
+                if any(n in h for n in needles):
+                    return i
+            return None
+
+        i_group = _col("group")
+        i_principal = _col("principal")
+        i_interest = _col("interest")
+        i_total = _col("total", "amount")
+        if i_group is None or i_principal is None or i_interest is None:
+            return []
+
+        ref = None
+        for pat in _RE_PAYMENT_REFS:
+            m = pat.search(body_text)
+            if m:
+                ref = m.group(1)
+                break
+
+        rows: list[tuple[str, int, int, int]] = []
+        for cells in data.get("rows") or []:
+            try:
+                needed = max(i for i in (i_group, i_principal, i_interest, i_total) if i is not None)
+                if len(cells) <= needed:
+                    continue
+                tok = self._group_token_from_label(cells[i_group])
+                if not tok or tok == "TOTAL":
+                    continue
+                if expected_groups and tok not in expected_groups:
+                    continue
+                principal = money_to_cents(cells[i_principal])
+                interest = money_to_cents(cells[i_interest])
+                total = money_to_cents(cells[i_total]) if i_total is not None else principal + interest
+                rows.append((tok, abs(total), abs(principal), abs(interest)))
+            except Exception:
+                continue
+
+        if not rows:
+            return []
+
+        payment_total = sum(total for (_, total, _, _) in rows)
+        return [
+            PaymentAllocation(
+                payment_date=payment_date,
+                group=tok,
+                total_applied_cents=total,
+                principal_applied_cents=principal,
+                interest_applied_cents=interest,
+                payment_total_cents=payment_total,
+                payment_reference=ref,
+            )
+            for (tok, total, principal, interest) in rows
+        ]
 
     def _extract_payment_allocations(
         self,
@@ -2476,17 +4058,43 @@ class ServicerPortalClient:
         self._try_select_payment_activity_show_all(page)
         non_posted_dates: dict[date, str] = {}
         try:
-            non_posted_dates = self._non_posted_payment_dates_from_payment_activity_text(page.inner_text("body"))
+            non_posted_dates = self._non_posted_payment_dates_from_payment_activity_text(self._body_text(page))
         except Exception:
             non_posted_dates = {}
         if non_posted_dates:
             logger.info("Detected %d non-posted payment entries; skipping them.", len(non_posted_dates))
 
+        # Pre-pass: when the list table already carries the per-group breakdown, rows can
+        # be parsed without the two navigations (open detail + return) each would cost.
+        inline_by_date = self._inline_payment_list_allocations(page, expected_groups=expected_groups or None)
+        if inline_by_date:
+            logger.info(
+                "Payment Activity list carries allocation columns; parsing %d date(s) inline.",
+                len(inline_by_date),
+            )
+
         # Primary strategy: click the Payment Date links in the history table (they are the most stable entry point).
         # These appear as links like "11/26/2025".
         # Payment date entries may be links, buttons, or plain clickable cells depending on UI changes.
-        date_re = re.compile(r"^\s*\d{1,2}/\d{1,2}/\d{4}\s*$")
+        date_re = _RE_DATE_ONLY
         def _collect_date_texts() -> list[str]:
+            # One in-page scan returns every date-shaped clickable text; the previous
+            # three-locator chain serialized all matches per strategy over CDP.
+            try:
+                texts = page.evaluate(
+                    """() => {
+                      const out = [];
+                      for (const el of document.querySelectorAll('a, button, td, [role="link"], [role="button"]')) {
+                        const t = (el.innerText || '').trim();
+                        if (/^\\d{1,2}\\/\\d{1,2}\\/\\d{4}$/.test(t)) out.push(t);
+                      }
+                      return out;
+                    }"""
+                )
+                if texts:
+                    return [str(t).strip() for t in texts if str(t).strip()]
+            except Exception:
+                logger.debug("In-browser date scan failed; falling back to locators.", exc_info=True)
             for loc in (
                 page.get_by_role("link", name=date_re),
                 page.get_by_role("button", name=date_re),
@@ -2502,12 +4110,12 @@ class ServicerPortalClient:
 
         date_texts = _collect_date_texts()
         if not date_texts:
-            body_text = page.inner_text("body")
+            body_text = self._body_text(page)
             if self._looks_like_no_recent_payments(body_text):
                 if self._click_payment_history_all(page):
                     date_texts = _collect_date_texts()
                     if not date_texts:
-                        body_text = page.inner_text("body")
+                        body_text = self._body_text(page)
 
             if not date_texts and self._looks_like_no_payment_history(body_text):
                 logger.warning("No payment history entries found; skipping payment allocation extraction.")
@@ -2547,6 +4155,12 @@ class ServicerPortalClient:
                     )
                     continue
 
+                inline_rows = inline_by_date.get(payment_dt)
+                if inline_rows:
+                    allocations.extend(inline_rows)
+                    parsed_rows += 1
+                    continue
+
                 if opened_rows >= max_payments_to_scan:
                     break
 
@@ -2589,8 +4203,16 @@ class ServicerPortalClient:
 
                     parsed_rows += 1
                     self._step(page, debug_dir=debug_dir, name=f"payments_after_open_{idx}_{dt_str}")
+                    # Prefer the structured table read; fall back to the text parser
+                    # for responsive layouts that render no allocation <table>.
                     allocations.extend(
-                        self._parse_payment_allocations(
+                        self._dom_payment_allocations(
+                            page,
+                            payment_date=payment_dt,
+                            expected_groups=expected_groups or None,
+                            body_text=body_text,
+                        )
+                        or self._parse_payment_allocations(
                             body_text,
                             payment_date=payment_dt,
                             expected_groups=expected_groups or None,
@@ -2603,8 +4225,12 @@ class ServicerPortalClient:
                         dt_str, idx, exc_info=True,
                     )
                 finally:
-                    # Return to Payment Activity list without relying on browser history.
-                    self._close_payment_detail(page)
+                    # Prefer browser back: on bfcache-friendly portals it restores the
+                    # list instantly, skipping the server round-trip of a renavigation.
+                    # Verified against the list's date cells; on failure it falls back
+                    # to the explicit close path and stays disabled for the session.
+                    if not self._back_to_payment_list(page, _collect_date_texts):
+                        self._close_payment_detail(page)
 
             if not allocations and parsed_rows > 0:
                 raise RuntimeError(
@@ -2711,7 +4337,9 @@ class ServicerPortalClient:
                 try:
                     sel = selects.nth(i)
                     sel.select_option(label="All")
-                    page.wait_for_timeout(500)
+                    # Event-driven settle instead of a blanket 500ms: the idle-callback
+                    # probe returns the moment the expanded list has rendered.
+                    self._wait_for_settle(page, timeout_ms=3_000)
                     return
                 except Exception:
                     continue
@@ -2719,22 +4347,22 @@ class ServicerPortalClient:
             pass
 
         # Fallback: try clicking an "All" control directly (some UIs render this as a segmented control).
-        for role in ("button", "option", "link"):
-            try:
-                loc = page.get_by_role(role, name=re.compile(r"^All$", re.I))
-                if loc.count() > 0:
-                    loc.first.click()
-                    page.wait_for_timeout(500)
-                    return
-            except Exception:
-                continue
+        try:
+            loc = page.locator(
+                'button:text-is("All"), [role="option"]:text-is("All"), a:text-is("All"), '
+                '[role="button"]:text-is("All")'
+            )
+            if loc.evaluate_all(self._CLICK_FIRST_VISIBLE_JS):
+                self._wait_for_settle(page, timeout_ms=3_000)
+                return
+        except Exception:
+            pass
 
         try:
             # Last resort: click by exact text. Avoid non-exact matches (e.g. "All Rights Reserved").
             loc = page.get_by_text("All", exact=True)
-            if loc.count() > 0:
-                loc.first.click()
-                page.wait_for_timeout(500)
+            if loc.evaluate_all(self._CLICK_FIRST_VISIBLE_JS):
+                self._wait_for_settle(page, timeout_ms=3_000)
         except Exception:
             pass
 
@@ -2752,9 +4380,9 @@ class ServicerPortalClient:
         Returns a dict mapping each non-posted date to the matched status keyword so callers
         can log which status caused the skip.
         """
-        lines = [ln.strip() for ln in (body_text or "").splitlines() if ln.strip()]
+        lines = _split_lines(body_text)
 
-        date_start_re = re.compile(r"^(\d{1,2}/\d{1,2}/\d{4})\b")
+        date_start_re = _RE_DATE_AT_LINE_START
 
         def _non_posted_status(block_lines: list[str]) -> Optional[str]:
             for ln in block_lines:
@@ -2805,42 +4433,43 @@ class ServicerPortalClient:
         if payment_date is None:
             payment_date = self._find_payment_date(body_text)
 
+        # Re-entered detail views (e.g. a close-path fallback that walks back through
+        # the list) hand the parser identical text; memo on a digest of the inputs so
+        # repeats skip the two-pass scan. Allocations are frozen, so sharing is safe.
+        memo_key = (
+            hashlib.blake2b(body_text.encode("utf-8", "replace"), digest_size=16).digest(),
+            payment_date,
+            None if expected_groups is None else tuple(sorted(expected_groups)),
+        )
+        cached = self._alloc_parse_memo.get(memo_key)
+        if cached is not None:
+            return list(cached)
+
         # Payment reference (optional)
         ref = None
-        for pat in (
-            r"Confirmation\s*Number:\s*([A-Z0-9-]+)",
-            r"Payment\s*ID:\s*([A-Z0-9-]+)",
-            r"Reference:\s*([A-Z0-9-]+)",
-        ):
-            m = re.search(pat, body_text, re.I)
+        for pat in _RE_PAYMENT_REFS:
+            m = pat.search(body_text)
             if m:
                 ref = m.group(1)
                 break
 
-        lines = [ln.strip() for ln in body_text.splitlines() if ln.strip()]
-        expected = {g.upper() for g in (expected_groups or set())}
+        lines = _split_lines(body_text)
+
+        # Normalize the expected set once; the inner helpers test candidate tokens
+        # against this frozenset per line, so they shouldn't re-uppercase anything.
+        expected_upper: Optional[frozenset[str]] = (
+            frozenset(g.strip().upper() for g in (expected_groups or ()) if (g or "").strip()) or None
+        )
 
         group_rows: list[tuple[str, int, int, int]] = []
         total_payment_cents: Optional[int] = None
-        seen_groups: set[str] = set()
 
-        money_re = re.compile(r"[-+]?\$?\s*[\d,]+\.\d{2}")
         expected_group_re: Optional[re.Pattern[str]] = None
-        if expected_groups:
+        if expected_upper:
             # Prefer longer tokens first (defensive; groups are usually 2 chars like "AA").
-            parts = sorted({g.strip().upper() for g in expected_groups if (g or "").strip()}, key=len, reverse=True)
-            if parts:
-                expected_group_re = re.compile(r"\b(" + "|".join(map(re.escape, parts)) + r")\b")
-
-        def _money_amounts(s: str) -> list[int]:
-            vals = money_re.findall(s or "")
-            out: list[int] = []
-            for v in vals:
-                try:
-                    out.append(money_to_cents(v))
-                except Exception:
-                    continue
-            return out
+            expected_group_re = _token_alternation_pattern(
+                tuple(sorted(expected_upper, key=len, reverse=True))
+            )
 
         def _infer_total_principal_interest(amounts: list[int]) -> Optional[tuple[int, int, int]]:
             """
@@ -2877,16 +4506,20 @@ class ServicerPortalClient:
                 return c, a, b
 
             # Fallback: pick the largest as the total, and the remaining as principal/interest.
-            trip = [a, b, c]
-            idx_total = max(range(3), key=lambda i: abs(trip[i]))
-            total = trip[idx_total]
-            rest = [trip[i] for i in range(3) if i != idx_total]
-            principal, interest = rest[0], rest[1]
+            # Straight branching — a three-way max via list/lambda costs more than the
+            # comparison itself.
+            aa, ab, ac = abs(a), abs(b), abs(c)
+            if aa >= ab and aa >= ac:
+                total, principal, interest = a, b, c
+            elif ab >= ac:
+                total, principal, interest = b, a, c
+            else:
+                total, principal, interest = c, a, b
             if abs(interest) > abs(principal):
                 principal, interest = interest, principal
             return total, principal, interest
 
-        def _extract_group_inline_row(ln: str) -> Optional[tuple[str, int, int, int]]:
+        def _extract_group_inline_row(ln: str, amts: list[int]) -> Optional[tuple[str, int, int, int]]:
             """
             Parse a single-line allocation row.
             Accepts formats like:
@@ -2898,10 +4531,6 @@ class ServicerPortalClient:
             if not raw:
                 return None
 
-            # Group IDs are usually 2-char tokens like "AA", but some servicers render hyphenated IDs
-            # like "1-01". Accept hyphens as long as the token starts with an alphanumeric.
-            group_token_re = r"[A-Z0-9](?:[A-Z0-9-]{1,15})"
-
             # Extract group
             group: Optional[str] = None
             if expected_group_re is not None:
@@ -2910,20 +4539,22 @@ class ServicerPortalClient:
                 mg = expected_group_re.search(raw)
                 if mg:
                     group = mg.group(1).upper()
-            m = re.match(rf"^(?:Loan\s+Group|Group)\s*:?\s*({group_token_re})\b", raw, re.I)
-            if m:
-                group = m.group(1).upper()
-            else:
-                first = raw.split()[0] if raw.split() else ""
-                if re.fullmatch(group_token_re, first):
-                    group = first.upper()
+            if group is None:
+                # Expected-token hit is authoritative; only fall back to the prefix and
+                # first-word forms when it found nothing.
+                m = _RE_GROUP_PREFIXED.match(raw)
+                if m:
+                    group = m.group(1).upper()
+                else:
+                    first = raw.split(None, 1)[0]
+                    if _RE_GROUP_TOKEN_ONLY.fullmatch(first):
+                        group = first.upper()
 
             if not group or group == "TOTAL":
                 return None
-            if expected_groups is not None and group not in expected_groups:
+            if expected_upper is not None and group not in expected_upper:
                 return None
 
-            amts = _money_amounts(raw)
             inferred = _infer_total_principal_interest(amts)
             if not inferred:
                 return None
@@ -2935,47 +4566,57 @@ class ServicerPortalClient:
             if not raw:
                 return None
 
-            group_token_re = r"[A-Z0-9](?:[A-Z0-9-]{1,15})"
-
             # "Loan Group: AA" or "Group AA"
-            m = re.match(rf"^(?:Loan\s+Group|Group)\s*:?\s*({group_token_re})\s*$", raw, re.I)
+            m = _RE_GROUP_PREFIXED_ONLY.match(raw)
             if m:
                 g = m.group(1).upper()
-                if g != "TOTAL" and (expected_groups is None or g in expected_groups):
+                if g != "TOTAL" and (expected_upper is None or g in expected_upper):
                     return g
                 return None
 
             # Pure group code line (common when the portal renders tables responsively)
-            if re.fullmatch(group_token_re, raw):
+            if _RE_GROUP_TOKEN_ONLY.fullmatch(raw):
                 g = raw.upper()
-                if g != "TOTAL" and (expected_groups is None or g in expected_groups):
+                if g != "TOTAL" and (expected_upper is None or g in expected_upper):
                     return g
             return None
 
+        # Single linear pre-pass: classify each line once (group-code, Total line,
+        # money amounts) so both passes below index into arrays instead of re-running
+        # the same regexes from their lookahead loops.
+        n = len(lines)
+        group_of: list[Optional[str]] = [None] * n
+        is_total: list[bool] = [False] * n
+        amounts: list[list[int]] = [[] for _ in range(n)]
+        for k, ln in enumerate(lines):
+            group_of[k] = _is_group_code_only(ln)
+            is_total[k] = _RE_TOTAL_LINE.match(ln) is not None
+            amounts[k] = _money_amounts(ln)
+
         # Pass 1: parse any obvious inline rows + total row (single line or label+values split across lines).
+        # Most lines are neither, so each branch is screened with a C-level check
+        # before its regexes run: total forms must start with "Total", and an inline
+        # allocation row needs at least two money values.
         for idx, ln in enumerate(lines):
-            # Total row: "Total $278.52 $184.12 $94.40"
-            m2 = re.match(
-                r"^Total\s+\$?([\d,]+\.\d{2})\s+\$?([\d,]+\.\d{2})\s+\$?([\d,]+\.\d{2})\s*$",
-                ln,
-                re.I,
-            )
-            if m2 and total_payment_cents is None:
-                total_payment_cents = money_to_cents(m2.group(1))
-                continue
+            ch = ln[0]
+            if (ch == "T" or ch == "t") and ln[:5].lower() == "total":
+                # Total row: "Total $278.52 $184.12 $94.40"
+                m2 = _RE_TOTAL_ROW.match(ln)
+                if m2 and total_payment_cents is None:
+                    total_payment_cents = money_to_cents(m2.group(1))
+                    continue
 
-            # Total label on its own, followed by values on subsequent lines:
-            if total_payment_cents is None and re.fullmatch(r"Total", ln, re.I):
-                for j in range(idx + 1, min(idx + 6, len(lines))):
-                    nxt = lines[j]
-                    amts = _money_amounts(nxt)
-                    if amts:
-                        total_payment_cents = amts[0]
-                        break
+                # Total label on its own, followed by values on subsequent lines:
+                if total_payment_cents is None and _RE_TOTAL_EXACT.fullmatch(ln):
+                    for j in range(idx + 1, min(idx + 6, n)):
+                        if amounts[j]:
+                            total_payment_cents = amounts[j][0]
+                            break
 
-            row = _extract_group_inline_row(ln)
-            if row:
-                group_rows.append(row)
+            if len(amounts[idx]) >= 2:
+                row = _extract_group_inline_row(ln, amounts[idx])
+                if row:
+                    group_rows.append(row)
 
         # Pass 2: handle responsive layouts where each cell renders on its own line (group code, then amounts/labels).
         #
@@ -2995,23 +4636,17 @@ class ServicerPortalClient:
         #   $10.98
         seen_groups: set[str] = {g for (g, _, _, _) in group_rows}
         i = 0
-        while i < len(lines):
-            g = _is_group_code_only(lines[i])
+        while i < n:
+            g = group_of[i]
             if not g or g in seen_groups:
                 i += 1
                 continue
 
-            # Gather a small block after the group label, stopping if we hit the next group or a Total row.
-            block = []
+            # Find the block after the group label, stopping at the next group or a
+            # Total row — array lookups only; all regex work happened in the pre-pass.
             j = i + 1
-            max_lookahead = min(len(lines), i + 18)
-            while j < max_lookahead:
-                ln = lines[j]
-                if _is_group_code_only(ln):
-                    break
-                if re.match(r"^Total\b", ln, re.I):
-                    break
-                block.append(ln)
+            max_lookahead = min(n, i + 18)
+            while j < max_lookahead and not group_of[j] and not is_total[j]:
                 j += 1
 
             pending_label: Optional[str] = None
@@ -3020,21 +4655,9 @@ class ServicerPortalClient:
             interest: Optional[int] = None
             loose_amounts: list[int] = []
 
-            def _label_from_line(s: str) -> Optional[str]:
-                low = (s or "").lower()
-                if "principal" in low:
-                    return "principal"
-                if "interest" in low:
-                    return "interest"
-                if "total" in low and ("applied" in low or "amount" in low or "payment" in low):
-                    return "total"
-                if "total applied" in low:
-                    return "total"
-                return None
-
-            for ln in block:
-                label = _label_from_line(ln)
-                amts = _money_amounts(ln)
+            for k in range(i + 1, j):
+                label = _classify_alloc_label(lines[k])
+                amts = amounts[k]
 
                 if not amts:
                     if label:
@@ -3078,7 +4701,7 @@ class ServicerPortalClient:
             # Fallback: sum the group totals (should equal payment total)
             total_payment_cents = sum(r[1] for r in group_rows)
 
-        return [
+        result = [
             PaymentAllocation(
                 payment_date=payment_date,
                 group=group,
@@ -3090,53 +4713,90 @@ class ServicerPortalClient:
             )
             for (group, total_applied, principal, interest) in group_rows
         ]
+        if len(self._alloc_parse_memo) >= 64:
+            self._alloc_parse_memo.clear()
+        self._alloc_parse_memo[memo_key] = result
+        return list(result)
 
     def _find_payment_date(self, body_text: str) -> date:
-        m = re.search(r"(Payment\s*Date|Date)\s*:\s*(\d{1,2}/\d{1,2}/\d{4})", body_text, re.I)
+        m = _RE_PAYMENT_DATE_LABELED.search(body_text)
         if m:
             return parse_us_date(m.group(2))
-        # Fallback: if there is exactly one date in the details view, use it.
-        dates = re.findall(r"\b\d{1,2}/\d{1,2}/\d{4}\b", body_text)
-        uniq = list(dict.fromkeys(dates))
-        if len(uniq) == 1:
-            return parse_us_date(uniq[0])
-        raise RuntimeError(f"Could not reliably determine payment date from detail page (found {len(uniq)} dates)")
+        # Fallback: if there is exactly one date in the details view, use it. The scan
+        # stops at the second distinct date — that's already ambiguous, so there is no
+        # point materializing every date on a long page just to count them.
+        seen: dict[str, None] = {}
+        for dm in _RE_ANY_DATE.finditer(body_text):
+            seen.setdefault(dm.group(0))
+            if len(seen) > 1:
+                break
+        if len(seen) == 1:
+            return parse_us_date(next(iter(seen)))
+        raise RuntimeError(
+            f"Could not reliably determine payment date from detail page (found {len(seen)} distinct dates)"
+        )
+
+    def _back_to_payment_list(self, page: Page, has_list_rows: Callable[[], list]) -> bool:
+        """
+        Try browser back to return from a payment detail to the Payment Activity list.
+
+        Returns True only when the list is verifiably back (date rows present). Some
+        portals render the detail as a modal with no history entry — there go_back
+        lands on an unrelated page, so the first failed attempt disables this path
+        for the session and callers use _close_payment_detail instead.
+        """
+        if not self._history_back_ok:
+            return False
+        try:
+            page.go_back(wait_until="domcontentloaded", timeout=3_000)
+        except Exception:
+            logger.debug("Browser back failed; disabling history-back shortcut.", exc_info=True)
+            self._history_back_ok = False
+            return False
+        try:
+            self._wait_for_settle(page)
+        except Exception:
+            pass
+        try:
+            if has_list_rows():
+                return True
+        except Exception:
+            logger.debug("Could not verify payment list after browser back.", exc_info=True)
+        logger.debug("Browser back did not restore the payment list; disabling shortcut.")
+        self._history_back_ok = False
+        return False
 
     def _close_payment_detail(self, page: Page) -> None:
         # Best-effort: close modal/detail view without relying on browser history (SPA).
+        # Each exit path settles via the idle-callback probe instead of a fixed 500ms
+        # sleep, so a quick close returns in milliseconds.
+        # One union locator per close text covers the button/link roles in a single
+        # evaluate_all click, instead of count+click probes per role (3+ round-trips
+        # each). Text order still encodes preference, so the loop stays per text.
         for t in self.selectors.payment_detail_close_texts:
+            sel = (
+                f'button:has-text("{t}"), [role="button"]:has-text("{t}"), '
+                f'a:has-text("{t}"), [role="link"]:has-text("{t}")'
+            )
             try:
-                btn = page.get_by_role("button", name=t)
-                if btn.count() > 0:
-                    btn.first.click()
-                    page.wait_for_timeout(500)
-                    return
-            except Exception:
-                pass
-
-            try:
-                link = page.get_by_role("link", name=t)
-                if link.count() > 0:
-                    link.first.click()
-                    page.wait_for_timeout(500)
+                if page.locator(sel).evaluate_all(self._CLICK_FIRST_VISIBLE_JS):
+                    self._wait_for_settle(page, timeout_ms=3_000)
                     return
             except Exception:
                 pass
 
             if len(t) >= 7 or " " in t:
                 try:
-                    txt = page.get_by_text(t, exact=False)
-                    if txt.count() > 0:
-                        txt.first.click()
-                        page.wait_for_timeout(500)
+                    if page.get_by_text(t, exact=False).evaluate_all(self._CLICK_FIRST_VISIBLE_JS):
+                        self._wait_for_settle(page, timeout_ms=3_000)
                         return
                 except Exception:
                     pass
 
-        # Try navigating back to Payment Activity explicitly.
+        # Try navigating back to Payment Activity explicitly (_goto_section settles
+        # after its own clicks, so no extra wait is needed here).
         try:
             self._goto_section(page, self.selectors.nav_payment_activity_text, debug_dir="data/debug")
-            page.wait_for_timeout(500)
             return
         except Exception:
             pass
@@ -3144,7 +4804,7 @@ class ServicerPortalClient:
         # Fallback: browser back.
         try:
             page.go_back()
-            page.wait_for_timeout(500)
+            self._wait_for_settle(page, timeout_ms=3_000)
             return
         except Exception:
             pass
@@ -3152,7 +4812,7 @@ class ServicerPortalClient:
         # Last resort: ESC
         try:
             page.keyboard.press("Escape")
-            page.wait_for_timeout(500)
+            self._wait_for_settle(page, timeout_ms=3_000)
         except Exception:
             pass
 
@@ -3172,7 +4832,7 @@ class ServicerPortalClient:
 
         def _label_words(label: str) -> list[str]:
             # Keep alphanumerics, split on spaces/punct. Drop very short/common words.
-            raw = re.findall(r"[a-z0-9]+", (label or "").casefold())
+            raw = _RE_ALNUM_RUNS.findall((label or "").casefold())
             stop = {"the", "and", "or", "my", "a", "an", "to", "of"}
             return [w for w in raw if len(w) >= 3 and w not in stop]
 
@@ -3200,38 +4860,32 @@ class ServicerPortalClient:
             - navigated=True if we successfully clicked a candidate with href/routerlink
             - clicked_non_nav=True if we clicked something without href/routerlink (likely a menu toggle)
             """
+            # One evaluate_all gathers visibility + nav attributes for every candidate
+            # in a single CDP round-trip; per-element is_visible/get_attribute probes
+            # cost 3-4 round-trips each. The cap guards against pathological matches
+            # when a label is too generic.
             try:
-                n = loc.count()
+                meta = loc.evaluate_all(
+                    """
+                    els => els.slice(0, 25).map((e) => ({
+                      href: (e.getAttribute('href') || '').trim(),
+                      routerlink: (e.getAttribute('routerlink') || e.getAttribute('routerLink') || '').trim(),
+                      visible: !!(e.offsetParent || e.getClientRects().length),
+                    }))
+                    """
+                )
             except Exception:
                 return False, False
-
-            # Cap to avoid pathological matches in case a label is too generic.
-            n = min(int(n), 25)
-            if n <= 0:
+            if not meta:
                 return False, False
 
             candidates: list[tuple[int, object, str, str]] = []
-            for i in range(n):
-                el = loc.nth(i)
-                href = ""
-                routerlink = ""
-                visible = False
-                try:
-                    visible = bool(el.is_visible())
-                except Exception:
-                    visible = False
-                try:
-                    href = (el.get_attribute("href") or "").strip()
-                except Exception:
-                    href = ""
-                try:
-                    # Angular uses `routerlink` (lowercase in HTML), but keep this defensive.
-                    routerlink = (el.get_attribute("routerlink") or el.get_attribute("routerLink") or "").strip()
-                except Exception:
-                    routerlink = ""
-
+            for i, m in enumerate(meta):
+                href = m.get("href") or ""
+                routerlink = m.get("routerlink") or ""
+                visible = bool(m.get("visible"))
                 score = _candidate_score(label=label, href=href, routerlink=routerlink, visible=visible)
-                candidates.append((score, el, href, routerlink))
+                candidates.append((score, loc.nth(i), href, routerlink))
 
             # Highest score first.
             candidates.sort(key=lambda x: x[0], reverse=True)
@@ -3266,11 +4920,15 @@ class ServicerPortalClient:
 
             return False, clicked_non_nav
 
-        # Do a few rounds to allow "toggle then click submenu" patterns.
-        for _round in range(3):
+        # Do a few rounds to allow "toggle then click submenu" patterns. Rounds after a
+        # toggle click back off exponentially — the submenu usually renders within tens
+        # of milliseconds, so only a genuinely slow SPA pays the longer waits — with an
+        # overall budget so a broken menu can't hold navigation for long.
+        deadline = time.monotonic() + 3.5
+        for delay_ms in (50, 100, 200, 400, 800):
             expanded_menu = False
             for t in nav_texts:
-                pat = re.compile(re.escape(t), re.I)
+                pat = _escaped_ci_pattern(t)
 
                 navigated, clicked_non_nav = _try_locator_group(t, page.get_by_role("link", name=pat))
                 if navigated:
@@ -3290,8 +4948,9 @@ class ServicerPortalClient:
                         return
                     expanded_menu = expanded_menu or clicked_non_nav
 
-            if not expanded_menu:
+            if not expanded_menu or time.monotonic() >= deadline:
                 break
+            page.wait_for_timeout(delay_ms)
 
         # If we cannot navigate, dump debug and keep going (caller may still be on correct page).
         logger.warning("Could not navigate using texts=%s; continuing.", nav_texts)
@@ -3301,11 +4960,11 @@ class ServicerPortalClient:
         try:
             out_dir = Path(debug_dir)
             out_dir.mkdir(parents=True, exist_ok=True)
-            page.screenshot(path=str(out_dir / f"{name_prefix}.png"), full_page=True)
+            page.screenshot(path=str(out_dir / f"{name_prefix}.png"), full_page=self._debug_full_page)
             (out_dir / f"{name_prefix}.html").write_text(page.content(), encoding="utf-8")
             # Also save the rendered body text so parsing can be debugged offline without DOM tooling.
             try:
-                (out_dir / f"{name_prefix}.txt").write_text(page.inner_text("body"), encoding="utf-8")
+                (out_dir / f"{name_prefix}.txt").write_text(self._body_text_snapshot(page), encoding="utf-8")
             except Exception:
                 pass
         except Exception:
@@ -3319,21 +4978,43 @@ class ServicerPortalClient:
             return
 
         self._step_counter += 1
-        safe = re.sub(r"[^a-zA-Z0-9_-]+", "_", name).strip("_")[:60] or "step"
+        safe = _RE_UNSAFE_NAME.sub("_", name).strip("_")[:60] or "step"
         prefix = f"step_{self._step_counter:02d}_{safe}"
 
+        # `Page.url` is a plain property on a live Page; go straight at it instead of paying
+        # the generic getattr-with-default protocol on every step. Only format the log line
+        # when INFO is actually enabled.
         try:
-            logger.info("Step %02d %s (url=%s)", self._step_counter, name, getattr(page, "url", ""))
-        except Exception:
-            pass
+            url = page.url or ""
+        except AttributeError:
+            url = ""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Step %02d %s (url=%s)", self._step_counter, name, url)
 
         if not self._step_debug_enabled:
             return
 
+        # Skip the screenshot (but keep the log line above) when the page URL is unchanged
+        # and the previous shot is fresher than the configured minimum interval.
+        now_ns = time.monotonic_ns()
+        if (
+            url
+            and url == self._last_step_url
+            and (now_ns - self._last_step_ns) < self._step_min_interval_ms * 1_000_000
+        ):
+            return
+        self._last_step_url = url
+        self._last_step_ns = now_ns
+
         try:
             out_dir = Path(debug_dir)
             out_dir.mkdir(parents=True, exist_ok=True)
-            page.screenshot(path=str(out_dir / f"{prefix}.png"), full_page=True)
+            # Viewport JPEG instead of full-page PNG: much cheaper to capture and ~5x
+            # smaller, which is plenty for breadcrumb shots. The disk write itself goes
+            # to the background writer. Failure dumps (_save_debug) stay full-page PNG
+            # and synchronous — those must be durable before an exception propagates.
+            data = page.screenshot(full_page=False, type="jpeg", quality=60)
+            self._queue_debug_write(out_dir / f"{prefix}.jpg", data)
         except Exception:
             logger.debug("Failed to save step screenshot (name=%s).", name, exc_info=True)
 
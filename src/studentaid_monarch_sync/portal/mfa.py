@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import atexit
 import imaplib
 import logging
+import random
 import re
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from email import message_from_bytes
 from email.message import Message
+from email.parser import BytesHeaderParser
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 import html as _html
 from typing import Optional
 
@@ -39,6 +44,93 @@ def _imap_connect_and_select(cfg: GmailImapConfig) -> imaplib.IMAP4_SSL:
     return mail
 
 
+# Open connections survive between poll_gmail_imap_for_code calls so repeated MFA
+# logins in one sync skip the ~400ms TLS handshake + LOGIN. Keyed per account/folder;
+# reuse is validated with NOOP and anything stale is dropped and redialed.
+_IMAP_POOL: dict[tuple[str, str], imaplib.IMAP4_SSL] = {}
+_IMAP_POOL_LOCK = threading.Lock()
+
+
+def _imap_pool_get(cfg: GmailImapConfig) -> Optional[imaplib.IMAP4_SSL]:
+    with _IMAP_POOL_LOCK:
+        mail = _IMAP_POOL.pop((cfg.user, cfg.folder), None)
+    if mail is None:
+        return None
+    try:
+        mail.noop()
+        return mail
+    except Exception:
+        _safe_imap_logout(mail)
+        return None
+
+
+def _imap_pool_put(cfg: GmailImapConfig, mail: Optional[imaplib.IMAP4_SSL]) -> None:
+    if mail is None:
+        return
+    with _IMAP_POOL_LOCK:
+        prev = _IMAP_POOL.get((cfg.user, cfg.folder))
+        _IMAP_POOL[(cfg.user, cfg.folder)] = mail
+    if prev is not None and prev is not mail:
+        _safe_imap_logout(prev)
+
+
+def _imap_pool_close_all() -> None:
+    with _IMAP_POOL_LOCK:
+        conns = list(_IMAP_POOL.values())
+        _IMAP_POOL.clear()
+    for mail in conns:
+        _safe_imap_logout(mail)
+
+
+atexit.register(_imap_pool_close_all)
+
+
+def _imap_idle_wait(mail: imaplib.IMAP4_SSL, timeout_seconds: float) -> bool:
+    """
+    Block on IMAP IDLE until the server pushes a mailbox change or the timeout elapses.
+
+    Returns True when an EXISTS/RECENT notification arrived (new mail is likely),
+    False on timeout or if the server refused IDLE. imaplib has no public IDLE
+    support, so this speaks the protocol directly; any hiccup surfaces as an
+    exception the caller treats as "fall back to sleep-polling".
+    """
+    # Gmail drops IDLE connections around the 29-minute mark; stay well under it.
+    timeout_seconds = max(1.0, min(timeout_seconds, 25 * 60))
+    tag = mail._new_tag()
+    mail.send(tag + b" IDLE\r\n")
+    mail.sock.settimeout(10)
+    resp = mail.readline()
+    try:
+        if not resp.startswith(b"+"):
+            return False
+        saw_change = False
+        deadline = time.time() + timeout_seconds
+        while time.time() < deadline:
+            mail.sock.settimeout(max(1.0, deadline - time.time()))
+            try:
+                line = mail.readline()
+            except (TimeoutError, OSError):
+                break
+            if not line:
+                break
+            upper = line.upper()
+            if b"EXISTS" in upper or b"RECENT" in upper:
+                saw_change = True
+                break
+        return saw_change
+    finally:
+        try:
+            mail.send(b"DONE\r\n")
+            mail.sock.settimeout(10)
+            # Drain untagged responses until our IDLE's tagged completion.
+            while True:
+                line = mail.readline()
+                if not line or line.startswith(tag):
+                    break
+        finally:
+            mail.sock.settimeout(None)
+
+
 def poll_gmail_imap_for_code(
     cfg: GmailImapConfig,
     *,
@@ -55,7 +147,7 @@ def poll_gmail_imap_for_code(
     - IMAP access is enabled on the account
     """
     deadline = time.time() + timeout_seconds
-    code_re = re.compile(cfg.code_regex)
+    code_re = _compiled_code_regex(cfg.code_regex)
 
     # Only accept MFA emails received after we started polling (with a small tolerance),
     # so we don't accidentally reuse a stale/older code email still sitting in the label.
@@ -66,18 +158,8 @@ def poll_gmail_imap_for_code(
     # This avoids refetching/parsing the same emails every few seconds.
     checked_msg_ids: set[bytes] = set()
 
-    preferred_res = [
-        # In StudentAid-servicer HTML emails, the actual OTP is commonly inside a callout:
-        #   <p class="h2 ...">437311</p>
-        re.compile(r'<p[^>]*class="[^"]*\\bh2\\b[^"]*"[^>]*>\\s*(\\d{6})\\s*</p>', re.I),
-        # Prefer codes near common phrases (email is usually "Authorization Code: 123456")
-        re.compile(r"authorization\s+code[^0-9]{0,30}(\d{6})", re.I),
-        re.compile(r"authentication\s+code[^0-9]{0,30}(\d{6})", re.I),
-        re.compile(r"one[-\s]?time[^0-9]{0,30}(\d{6})", re.I),
-        re.compile(r"six[-\s]?digit[^0-9]{0,50}(\d{6})", re.I),
-    ]
-
-    mail: Optional[imaplib.IMAP4_SSL] = None
+    mail: Optional[imaplib.IMAP4_SSL] = _imap_pool_get(cfg)
+    attempt = 0
     try:
         while time.time() < deadline:
             try:
@@ -96,7 +178,6 @@ def poll_gmail_imap_for_code(
                     cfg,
                     mail=mail,
                     code_re=code_re,
-                    preferred_res=preferred_res,
                     min_received_at=min_received_at,
                     print_code=print_code,
                     checked_msg_ids=checked_msg_ids,
@@ -109,19 +190,100 @@ def poll_gmail_imap_for_code(
                 _safe_imap_logout(mail)
                 mail = None
 
-            time.sleep(poll_interval_seconds)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            # Prefer IMAP IDLE: the server pushes an EXISTS the moment the MFA email
+            # lands, instead of the code sitting unread for up to a full poll interval.
+            # Each IDLE cycle is capped so the search still re-runs periodically, and
+            # any IDLE failure downgrades this connection to plain sleep-polling.
+            if mail is not None:
+                try:
+                    _imap_idle_wait(mail, min(remaining, 60.0))
+                    continue
+                except Exception:
+                    logger.debug("IMAP IDLE failed; falling back to sleep poll.", exc_info=True)
+                    _safe_imap_logout(mail)
+                    mail = None
+            # Adaptive schedule instead of a fixed interval: MFA emails usually land
+            # within a few seconds of the trigger, so poll fast early and back off
+            # toward poll_interval_seconds (capped at 10s) to stay friendly with
+            # Gmail throttling. Jitter avoids lockstep across parallel sync runs.
+            attempt += 1
+            sleep_for = min(10.0, float(poll_interval_seconds), 1.0 + 0.5 * (attempt - 1))
+            time.sleep(min(sleep_for + random.uniform(0.0, 0.3), max(remaining, 0.1)))
     finally:
-        _safe_imap_logout(mail)
+        # Healthy connections go back to the pool for the next MFA round-trip;
+        # broken ones were already dropped (mail is None on those paths).
+        _imap_pool_put(cfg, mail)
 
     raise TimeoutError(f"Timed out waiting for MFA code email after {timeout_seconds}s")
 
 
+_RE_FETCH_UID = re.compile(rb"\bUID (\d+)")
+_HEADER_PARSER = BytesHeaderParser()
+
+
+def _uid_sort_or_search(mail: imaplib.IMAP4_SSL, search_parts: list[str]) -> list[bytes]:
+    """
+    Return candidate UIDs newest-first, preferring the server's SORT extension
+    (Gmail supports it) so ordering happens server-side; fall back to plain UID
+    SEARCH (ascending) reversed locally when SORT is unavailable.
+    """
+    try:
+        status, data = mail.uid("SORT", "(REVERSE ARRIVAL)", "UTF-8", *search_parts)
+        if status == "OK" and data and data[0] is not None:
+            return data[0].split()
+    except Exception:
+        logger.debug("UID SORT failed/unsupported; falling back to SEARCH.", exc_info=True)
+    status, data = mail.uid("search", None, *search_parts)
+    if status != "OK":
+        raise RuntimeError(f"IMAP search failed: {status} {data}")
+    return list(reversed(data[0].split()))
+
+
+def _assemble_uid_fetch(msg_data: list) -> list[tuple[bytes, bytes]]:
+    """
+    Group imaplib's flat UID-fetch response into (uid, header+body) messages.
+
+    A batched `UID FETCH a,b,c (... BODY.PEEK[HEADER] BODY.PEEK[TEXT])` comes back as
+    interleaved (meta, payload) tuples plus stray b')' markers; each message's first
+    tuple carries its UID.
+    """
+    out: list[tuple[bytes, bytes]] = []
+    uid = b""
+    header = b""
+    text = b""
+
+    def _flush() -> None:
+        nonlocal uid, header, text
+        if uid:
+            out.append((uid, header + text))
+        uid, header, text = b"", b"", b""
+
+    for part in msg_data:
+        if not (isinstance(part, tuple) and len(part) >= 2):
+            continue
+        meta = part[0] or b""
+        m = _RE_FETCH_UID.search(meta)
+        if m:
+            if uid and m.group(1) != uid:
+                _flush()
+            uid = m.group(1)
+        upper = meta.upper()
+        if b"TEXT" in upper:
+            text = part[1] or b""
+        elif b"HEADER" in upper:
+            header = part[1] or b""
+    _flush()
+    return out
+
+
 def _try_fetch_code_once(
     cfg: GmailImapConfig,
     *,
     mail: imaplib.IMAP4_SSL,
     code_re: re.Pattern[str],
-    preferred_res: list[re.Pattern[str]],
     min_received_at: datetime,
     print_code: bool,
     checked_msg_ids: set[bytes],
@@ -139,45 +301,55 @@ def _try_fetch_code_once(
         # If the user didn't configure a hint, default to the common subject shown on the MFA page.
         subject = (cfg.subject_hint or "").strip() or "Authorization Code"
         search_parts += ["SUBJECT", f"\"{subject}\""]
-
-        status, data = mail.search(None, *search_parts)
-        if status != "OK":
-            raise RuntimeError(f"IMAP search failed: {status} {data}")
-
-        ids = data[0].split()
-        if not ids:
+        # Prune server-side: SINCE is day-granular, but it stops months of old MFA
+        # emails in the label from coming back on every poll (the exact cutoff is
+        # still enforced below against min_received_at).
+        search_parts += ["SINCE", min_received_at.strftime("%d-%b-%Y")]
+
+        # UID search/fetch so the checked-set stays valid across re-selects, and one
+        # batched PEEK fetch for all unchecked candidates instead of a round-trip per
+        # message. PEEK leaves \Seen untouched, so the explicit flag below still means
+        # "this code was used".
+        ids = _uid_sort_or_search(mail, search_parts)
+        candidates = [u for u in ids if u not in checked_msg_ids]
+        if not candidates:
             return None
+        status, msg_data = mail.uid(
+            "fetch",
+            b",".join(candidates).decode("ascii"),
+            "(UID BODY.PEEK[HEADER] BODY.PEEK[TEXT])",
+        )
+        if status != "OK" or not msg_data:
+            raise RuntimeError(f"IMAP fetch failed: {status}")
     except Exception:
         # Treat transient IMAP parsing/search issues as "no code yet"; caller will retry.
         logger.debug("IMAP fetch attempt failed; treating as no-code.", exc_info=True)
         return None
 
     # Newest first
-    for msg_id in reversed(ids[-25:]):
-        if msg_id in checked_msg_ids:
-            continue
-        status, msg_data = mail.fetch(msg_id, "(RFC822)")
-        if status != "OK" or not msg_data or not msg_data[0]:
-            continue
+    for msg_id, raw in sorted(_assemble_uid_fetch(msg_data), key=lambda t: int(t[0]), reverse=True):
         checked_msg_ids.add(msg_id)
-
-        raw = msg_data[0][1]
-        msg = message_from_bytes(raw)
-        received_at = _best_effort_msg_datetime_utc(msg)
+        # Headers-only parse first: the age filter needs just Date/Received, so stale
+        # candidates never pay for a full MIME-tree parse of their (often HTML) body.
+        head = _HEADER_PARSER.parsebytes(raw)
+        received_at = _best_effort_msg_datetime_utc(head)
         if not received_at:
             continue
         if received_at < min_received_at:
             # Too old; keep looking for a fresh code generated for *this* login.
             continue
 
-        body = _extract_best_effort_body(msg)
-
-        code = _extract_code(body, preferred_res=preferred_res, fallback_re=code_re)
+        msg = message_from_bytes(raw)
+        code = None
+        for body in _iter_best_effort_bodies(msg):
+            code = _extract_code(body, fallback_re=code_re)
+            if code:
+                break
         if not code:
             continue
         # Mark as seen so we don't reuse the same email.
         try:
-            mail.store(msg_id, "+FLAGS", "\\Seen")
+            mail.uid("store", msg_id, "+FLAGS", "\\Seen")
         except Exception:
             logger.debug("Failed to mark message as seen (msg_id=%s).", msg_id, exc_info=True)
 
@@ -203,31 +375,35 @@ def _try_fetch_code_once(
     return None
 
 
-def _extract_best_effort_body(msg: Message) -> str:
-    if msg.is_multipart():
-        parts = []
-        for part in msg.walk():
-            ctype = part.get_content_type()
-            disp = (part.get("Content-Disposition") or "").lower()
-            if "attachment" in disp:
-                continue
-            if ctype in ("text/plain", "text/html"):
-                payload = part.get_payload(decode=True) or b""
-                charset = part.get_content_charset() or "utf-8"
-                try:
-                    parts.append(payload.decode(charset, errors="replace"))
-                except Exception:
-                    parts.append(payload.decode("utf-8", errors="replace"))
-        return "\n".join(parts)
-
-    payload = msg.get_payload(decode=True) or b""
-    charset = msg.get_content_charset() or "utf-8"
+def _decode_part(part: Message) -> str:
+    payload = part.get_payload(decode=True) or b""
+    charset = part.get_content_charset() or "utf-8"
     try:
         return payload.decode(charset, errors="replace")
     except Exception:
         return payload.decode("utf-8", errors="replace")
 
 
+def _iter_best_effort_bodies(msg: Message):
+    """
+    Lazily yield decoded text bodies (text/plain, then whatever order the tree
+    walks). The caller short-circuits on the first body that yields a code, so
+    later alternatives/attachments are never base64-decoded at all.
+    """
+    if not msg.is_multipart():
+        yield _decode_part(msg)
+        return
+    for part in msg.walk():
+        if part.get_content_maintype() == "multipart":
+            # Container nodes carry no payload of their own.
+            continue
+        disp = (part.get("Content-Disposition") or "").lower()
+        if "attachment" in disp:
+            continue
+        if part.get_content_type() in ("text/plain", "text/html"):
+            yield _decode_part(part)
+
+
 def _best_effort_msg_datetime_utc(msg: Message) -> Optional[datetime]:
     raw_date = (msg.get("Date") or "").strip()
     if not raw_date:
@@ -243,21 +419,41 @@ def _best_effort_msg_datetime_utc(msg: Message) -> Optional[datetime]:
     return dt.astimezone(timezone.utc)
 
 
-def _extract_code(body: str, *, preferred_res: list[re.Pattern[str]], fallback_re: re.Pattern[str]) -> Optional[str]:
+# Preferred OTP patterns, compiled once at import. Combined into a single alternation
+# so each email body takes one linear scan instead of one scan per pattern; all
+# alternatives target the same 6-digit code, so leftmost-match-wins is fine.
+_PREFERRED_RAW = (
+    # In StudentAid-servicer HTML emails, the actual OTP is commonly inside a callout:
+    #   <p class="h2 ...">437311</p>
+    r'<p[^>]*class="[^"]*\bh2\b[^"]*"[^>]*>\s*(\d{6})\s*</p>',
+    # Prefer codes near common phrases (email is usually "Authorization Code: 123456")
+    r"authorization\s+code[^0-9]{0,30}(\d{6})",
+    r"authentication\s+code[^0-9]{0,30}(\d{6})",
+    r"one[-\s]?time[^0-9]{0,30}(\d{6})",
+    r"six[-\s]?digit[^0-9]{0,50}(\d{6})",
+)
+_PREFERRED_COMBINED = re.compile("|".join(f"(?:{p})" for p in _PREFERRED_RAW), re.I)
+
+
+@lru_cache(maxsize=8)
+def _compiled_code_regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+def _extract_code(body: str, *, fallback_re: re.Pattern[str]) -> Optional[str]:
     # 1) Try preferred patterns on the raw body (works for HTML-specific patterns)
-    for r in preferred_res:
-        m = r.search(body)
-        if m:
-            return m.group(1)
+    m = _PREFERRED_COMBINED.search(body)
 
-    # 2) Strip HTML/CSS to avoid false matches like the CSS hex color "#265179"
+    # 2) Strip HTML/CSS to avoid false matches like the CSS hex color "#265179",
+    #    and retry there (for phrase-based patterns split by tags in the raw HTML).
     text = _strip_html_to_text(body)
-
-    # Re-run preferred patterns against text (for phrase-based patterns)
-    for r in preferred_res:
-        m = r.search(text)
-        if m:
-            return m.group(1)
+    if not m:
+        m = _PREFERRED_COMBINED.search(text)
+    if m:
+        # Exactly one alternative fired; its (\d{6}) capture is the non-None group.
+        for g in m.groups():
+            if g:
+                return g
 
     # 3) Fallback: find any 6-digit match, but explicitly ignore hex colors or embedded numbers.
     for m in fallback_re.finditer(text):
@@ -271,15 +467,19 @@ def _extract_code(body: str, *, preferred_res: list[re.Pattern[str]], fallback_r
     return None
 
 
+# Style/script blocks and comments must come before the bare-tag alternative so their
+# contents are swallowed whole rather than left behind with only the tags removed.
+_HTML_STRIP_RE = re.compile(
+    r"(?is)<style\b[^>]*>.*?</style>|<script\b[^>]*>.*?</script>|<!--.*?-->|<[^>]+>"
+)
+_WS_RE = re.compile(r"\s+")
+
+
 def _strip_html_to_text(s: str) -> str:
-    # Remove style/script blocks and comments
-    s = re.sub(r"(?is)<style[^>]*>.*?</style>", " ", s)
-    s = re.sub(r"(?is)<script[^>]*>.*?</script>", " ", s)
-    s = re.sub(r"(?is)<!--.*?-->", " ", s)
-    # Remove tags
-    s = re.sub(r"(?is)<[^>]+>", " ", s)
+    # One fused pass over the body instead of four sequential re.sub calls, each of
+    # which allocated a full intermediate copy of the (often large) HTML email.
+    s = _HTML_STRIP_RE.sub(" ", s)
     s = _html.unescape(s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    return _WS_RE.sub(" ", s).strip()
 
 
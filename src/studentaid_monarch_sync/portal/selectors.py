@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PortalSelectors:
     """
     StudentAid servicer portals are web portals; selectors may change over time.
     Keep all UI selectors/text hooks here for easy maintenance.
+
+    slots=True: these fields are read constantly from the login/extraction polling
+    loops, and slot descriptors are cheaper than instance-dict lookups.
     """
 
     # Login
@@ -79,3 +83,13 @@ class PortalSelectors:
 
 # Backward-compatible alias (older code referenced `CriSelectors`).
 CriSelectors = PortalSelectors
+
+
+@lru_cache(maxsize=1)
+def default_selectors() -> PortalSelectors:
+    """
+    Shared default instance. The dataclass is frozen, so one instance can safely
+    back every client instead of re-materializing all the selector strings per
+    PortalClient construction.
+    """
+    return PortalSelectors()
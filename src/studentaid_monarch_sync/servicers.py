@@ -22,7 +22,12 @@ KNOWN_SERVICERS: Mapping[str, ServicerInfo] = {
 }
 
 
+# Key-only view for membership tests: is_known_provider doesn't need the
+# ServicerInfo values, just the normalized names.
+_KNOWN_SERVICER_KEYS: frozenset[str] = frozenset(KNOWN_SERVICERS)
+
+
 def is_known_provider(provider: str) -> bool:
-    return provider.strip().lower() in KNOWN_SERVICERS
+    return provider.strip().lower() in _KNOWN_SERVICER_KEYS
 
 
@@ -1,23 +1,41 @@
 from __future__ import annotations
 
-from datetime import date
-
-from dateutil import parser as date_parser
+from datetime import date, datetime
+from functools import lru_cache
 
 
+@lru_cache(maxsize=4096)
 def parse_us_date(value: str) -> date:
     """
     Parse dates like:
     - "12/26/2025"
     - "11/26/2025"
     - "12/18/2025"
+
+    Cached: payment-history sync parses the same handful of due/payment dates
+    hundreds of times. The canonical MM/DD/YYYY shape is parsed with plain int
+    math; dateutil is imported lazily and only sees the odd formats, keeping
+    its sizeable import cost off the startup path.
     """
     if value is None:
         raise ValueError("parse_us_date: value is None")
     s = value.strip()
     if not s:
         raise ValueError("parse_us_date: empty string")
+    parts = s.split("/")
+    if len(parts) == 3 and all(p.isdigit() for p in parts):
+        m, d, y = parts
+        if len(y) == 2:
+            y = "20" + y
+        try:
+            return date(int(y), int(m), int(d))
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(s, "%b %d, %Y").date()
+    except ValueError:
+        pass
+    from dateutil import parser as date_parser
+
     dt = date_parser.parse(s, dayfirst=False, yearfirst=False)
     return dt.date()
-
-
@@ -2,11 +2,37 @@ from __future__ import annotations
 
 import re
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Optional
 
 
 _MONEY_RE = re.compile(r"[-+]?\$?\s*[\d,]+(?:\.\d{1,2})?")
 
+# Strip currency symbols, thousands separators, and inner whitespace in one
+# C-level pass rather than chained .replace() copies.
+_MONEY_TRANS = str.maketrans("", "", "$, \t")
+
+
+@lru_cache(maxsize=4096)
+def _money_to_cents_cached(s: str) -> int:
+    # Handle parentheses as negative
+    if s and s[0] == "(" and s[-1] == ")":
+        s = "-" + s[1:-1].strip()
+
+    # Pure-int fast path: portal amounts are plain "[sign]dollars[.cc]" here, so
+    # cents are just int(dollars)*100 + int(frac) with no Decimal allocations.
+    neg = s.startswith("-")
+    t = s.lstrip("+-")
+    whole, _, frac = t.partition(".")
+    if (whole.isdigit() or not whole) and len(frac) <= 2 and (frac.isdigit() or not frac):
+        cents = int(whole or "0") * 100 + int((frac + "00")[:2])
+        return -cents if neg else cents
+
+    # Pathological shapes (3+ fractional digits, exponents, ...) keep the exact
+    # ROUND_HALF_UP semantics via Decimal.
+    dec = Decimal(s).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return int(dec * 100)
+
 
 def money_to_cents(value: str) -> int:
     """
@@ -15,6 +41,9 @@ def money_to_cents(value: str) -> int:
     - "3040.16"
     - "$0.37"
     - "-$12.34"
+
+    Parsing is cached on the normalized string: payment tables repeat the same
+    handful of amounts across rows and across runs.
     """
     if value is None:
         raise ValueError("money_to_cents: value is None")
@@ -24,14 +53,9 @@ def money_to_cents(value: str) -> int:
         raise ValueError("money_to_cents: empty string")
 
     # Remove currency symbols/spaces/commas
-    s = s.replace("$", "").replace(",", "").strip()
+    s = s.translate(_MONEY_TRANS)
 
-    # Handle parentheses as negative
-    if s.startswith("(") and s.endswith(")"):
-        s = "-" + s[1:-1].strip()
-
-    dec = Decimal(s).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    return int(dec * 100)
+    return _money_to_cents_cached(s)
 
 
 def find_first_money(text: str) -> Optional[str]:
@@ -40,7 +64,8 @@ def find_first_money(text: str) -> Optional[str]:
 
 
 def cents_to_money_str(cents: int) -> str:
-    dec = (Decimal(cents) / 100).quantize(Decimal("0.01"))
-    return f"${dec:,.2f}"
+    sign, n = ("-", -cents) if cents < 0 else ("", cents)
+    dollars, frac = divmod(n, 100)
+    return f"{sign}${dollars:,}.{frac:02d}"
 
 
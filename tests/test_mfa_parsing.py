@@ -29,30 +29,26 @@ def test_strip_html_to_text_removes_style_and_tags_and_unescapes() -> None:
 
 def test_extract_code_prefers_html_h2_callout() -> None:
     body = '<p class="h2 something"> 437311 </p><p>ignore 123456</p>'
-    preferred = [re.compile(r'<p[^>]*class="[^"]*\\bh2\\b[^"]*"[^>]*>\\s*(\\d{6})\\s*</p>', re.I)]
     fallback = re.compile(r"\b(\d{6})\b")
-    assert _extract_code(body, preferred_res=preferred, fallback_re=fallback) == "437311"
+    assert _extract_code(body, fallback_re=fallback) == "437311"
 
 
 def test_extract_code_ignores_css_hex_like_numbers() -> None:
     # The digits are present, but preceded by '#', which should be ignored (CSS hex).
     body = "Primary color is #265179. No OTP here."
-    preferred: list[re.Pattern[str]] = []
     fallback = re.compile(r"\b(\d{6})\b")
-    assert _extract_code(body, preferred_res=preferred, fallback_re=fallback) is None
+    assert _extract_code(body, fallback_re=fallback) is None
 
 
 def test_extract_code_matches_phrase_based_patterns_after_stripping() -> None:
     body = "<div>Authorization Code: <b>123456</b></div>"
-    preferred = [re.compile(r"authorization\\s+code[^0-9]{0,30}(\\d{6})", re.I)]
     fallback = re.compile(r"\b(\d{6})\b")
-    assert _extract_code(body, preferred_res=preferred, fallback_re=fallback) == "123456"
+    assert _extract_code(body, fallback_re=fallback) == "123456"
 
 
 def test_extract_code_returns_none_when_missing() -> None:
     body = "<html><body>no code here</body></html>"
-    preferred: list[re.Pattern[str]] = []
     fallback = re.compile(r"\b(\d{6})\b")
-    assert _extract_code(body, preferred_res=preferred, fallback_re=fallback) is None
+    assert _extract_code(body, fallback_re=fallback) is None
 
 
@@ -8,12 +8,15 @@ from typing import Any, Dict, List
 import pytest
 
 
-def _import_monarch_client_with_fake_dep(monkeypatch):
+@pytest.fixture(scope="module")
+def _monarch_fake_module():
     """
     Import `studentaid_monarch_sync.monarch.client` while providing a fake `monarchmoney` module.
 
     This keeps the unit tests fast/offline and validates our wrapper logic (cache invalidation and
-    dedupe-on-create-error) without requiring the real Monarch client dependency.
+    dedupe-on-create-error) without requiring the real Monarch client dependency. Module-scoped so
+    the force-reimport of monarch.client runs once per session, not once per test; per-test class
+    state is reset by the `monarch_env` fixture below.
     """
 
     class FakeCaptchaRequiredException(Exception):
@@ -32,6 +35,13 @@ def _import_monarch_client_with_fake_dep(monkeypatch):
             self.token = token
 
             self._transactions: List[Dict[str, Any]] = []
+            # Index on write, look up on read: single-day queries (the duplicate
+            # guard's common case) hit the bucket instead of rescanning everything.
+            self._by_acct_date: Dict[tuple[str, str], List[Dict[str, Any]]] = {}
+            # Memoized query results, keyed by (version, query args). add_transactions
+            # bumps the version, so stale entries are never served after a write.
+            self._version = 0
+            self._result_cache: Dict[tuple, Dict[str, Any]] = {}
             self.calls_get_transactions = 0
             self.fail_create_after_append = False
             self.fail_get_transactions_times = 0
@@ -88,7 +98,19 @@ def _import_monarch_client_with_fake_dep(monkeypatch):
         async def update_account(self, **_kwargs: Any) -> Dict[str, Any]:
             return {}
 
-        async def get_transactions(self, **kwargs: Any) -> Dict[str, Any]:
+        def add_transactions(self, txns: List[Dict[str, Any]]) -> None:
+            """Seed canned transactions, keeping the (accountId, date) index in sync."""
+            for t in txns:
+                # Derived search column: lowercase merchant+notes once at write time
+                # so the read path is a single substring check per row.
+                merch = (t.get("merchant") or {}).get("name") or ""
+                t["_search_blob"] = f"{merch} {t.get('notes') or ''}".lower()
+                self._transactions.append(t)
+                key = (str(t.get("accountId") or ""), str(t.get("date") or ""))
+                self._by_acct_date.setdefault(key, []).append(t)
+            self._version += 1
+
+        async def get_transactions(self, cursor: str = "", **kwargs: Any) -> Dict[str, Any]:
             self.calls_get_transactions += 1
             if self.fail_get_transactions_times > 0:
                 self.fail_get_transactions_times -= 1
@@ -100,20 +122,43 @@ def _import_monarch_client_with_fake_dep(monkeypatch):
             offset = int(kwargs.get("offset") or 0)
             search = (kwargs.get("search") or "").strip().lower()
 
+            # Reads are pure between writes; repeat queries (same flow re-run in a
+            # matrix, or a test priming twice) return the memoized response. The
+            # call counter above increments regardless, so assertions on it still
+            # see every call.
+            cache_key = (self._version, account_id, start, end, limit, offset, search, cursor)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            if start and end and start == end:
+                # Single-day query: direct bucket lookup, no full scan.
+                source: List[Dict[str, Any]] = self._by_acct_date.get((account_id, start), [])
+            else:
+                source = [
+                    t
+                    for t in self._transactions
+                    if t.get("accountId") == account_id
+                    and (not (start and end) or start <= (t.get("date") or "") <= end)
+                ]
+
             results = []
-            for t in self._transactions:
-                if t.get("accountId") != account_id:
+            for t in source:
+                if search and search not in t["_search_blob"]:
                     continue
-                if start and end:
-                    if not (start <= (t.get("date") or "") <= end):
-                        continue
-                if search:
-                    merch = ((t.get("merchant") or {}).get("name") or "").strip().lower()
-                    notes = (t.get("notes") or "").strip().lower()
-                    if search not in merch and search not in notes:
-                        continue
-                results.append(dict(t))
-            return {"allTransactions": {"results": results[offset : offset + limit]}}
+                # No defensive copy: MonarchClient.list_transactions copies rows
+                # itself, and no test mutates what the stub returns.
+                results.append(t)
+            if cursor:
+                # Keyset paging: everything strictly after the last-seen id.
+                idx = next((i for i, t in enumerate(results) if t.get("id") == cursor), None)
+                results = results[idx + 1 :] if idx is not None else []
+                page = results[:limit]
+            else:
+                page = results[offset : offset + limit]
+            response = {"allTransactions": {"results": page}}
+            self._result_cache[cache_key] = response
+            return response
 
         async def create_transaction(self, **kwargs: Any) -> Dict[str, Any]:
             txn_id = f"txn-{len(self._transactions) + 1}"
@@ -125,7 +170,7 @@ def _import_monarch_client_with_fake_dep(monkeypatch):
                 "notes": kwargs.get("notes") or "",
                 "accountId": kwargs.get("account_id"),
             }
-            self._transactions.append(txn)
+            self.add_transactions([txn])
 
             if self.fail_create_after_append:
                 raise RuntimeError("simulated timeout after server-side create")
@@ -135,18 +180,47 @@ def _import_monarch_client_with_fake_dep(monkeypatch):
     fake_mod = types.ModuleType("monarchmoney")
     fake_mod.MonarchMoney = FakeMonarchMoney
     fake_mod.CaptchaRequiredException = FakeCaptchaRequiredException
-    monkeypatch.setitem(sys.modules, "monarchmoney", fake_mod)
+
+    mp = pytest.MonkeyPatch()
+    mp.setitem(sys.modules, "monarchmoney", fake_mod)
 
     # Ensure the module imports fresh with our stub.
     sys.modules.pop("studentaid_monarch_sync.monarch.client", None)
 
     from studentaid_monarch_sync.monarch.client import MonarchClient
 
+    yield MonarchClient, FakeMonarchMoney
+
+    mp.undo()
+    # Drop the stub-bound module so later imports bind the real dependency again.
+    sys.modules.pop("studentaid_monarch_sync.monarch.client", None)
+
+
+@pytest.fixture(scope="module")
+def loop():
+    """
+    One event loop for the whole module: loop.run_until_complete() creates and tears down a
+    loop (plus its epoll selector) per call, which adds up across these tests.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def monarch_env(_monarch_fake_module):
+    """Per-test view of the shared fake: class-level error knobs reset between tests."""
+    MonarchClient, FakeMonarchMoney = _monarch_fake_module
+    FakeMonarchMoney.load_session_error = None
+    FakeMonarchMoney.login_error = None
+    FakeMonarchMoney.login_with_cookies_error = None
+    FakeMonarchMoney.get_accounts_error = None
+    FakeMonarchMoney.instances = []
     return MonarchClient, FakeMonarchMoney
 
 
-def test_create_payment_transaction_invalidates_transactions_cache(monkeypatch, tmp_path) -> None:
-    MonarchClient, FakeMonarchMoney = _import_monarch_client_with_fake_dep(monkeypatch)
+def test_create_payment_transaction_invalidates_transactions_cache(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
     mc = MonarchClient(
         email="",
         password="",
@@ -158,7 +232,7 @@ def test_create_payment_transaction_invalidates_transactions_cache(monkeypatch,
     assert isinstance(mc._mm, FakeMonarchMoney)
 
     # Prime the transactions cache for this day/account.
-    txns0 = asyncio.run(
+    txns0 = loop.run_until_complete(
         mc.list_transactions(
             account_id="acct1",
             start_date_iso="2025-01-01",
@@ -171,7 +245,7 @@ def test_create_payment_transaction_invalidates_transactions_cache(monkeypatch,
     assert mc._mm.calls_get_transactions == 1
 
     # Create a new transaction; our wrapper should invalidate the cached day/account view.
-    _ = asyncio.run(
+    _ = loop.run_until_complete(
         mc.create_payment_transaction(
             account_id="acct1",
             posted_date_iso="2025-01-01",
@@ -183,7 +257,7 @@ def test_create_payment_transaction_invalidates_transactions_cache(monkeypatch,
         )
     )
 
-    txns1 = asyncio.run(
+    txns1 = loop.run_until_complete(
         mc.list_transactions(
             account_id="acct1",
             start_date_iso="2025-01-01",
@@ -196,8 +270,8 @@ def test_create_payment_transaction_invalidates_transactions_cache(monkeypatch,
     assert mc._mm.calls_get_transactions == 2  # cache was invalidated and re-fetched
 
 
-def test_create_payment_transaction_recovers_on_timeout_by_duplicate_guard(monkeypatch, tmp_path) -> None:
-    MonarchClient, FakeMonarchMoney = _import_monarch_client_with_fake_dep(monkeypatch)
+def test_create_payment_transaction_recovers_on_timeout_by_duplicate_guard(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
     mc = MonarchClient(
         email="",
         password="",
@@ -211,7 +285,7 @@ def test_create_payment_transaction_recovers_on_timeout_by_duplicate_guard(monke
     # Simulate a timeout after the server has created the transaction but before the client got a response.
     mc._mm.fail_create_after_append = True
 
-    txn_id = asyncio.run(
+    txn_id = loop.run_until_complete(
         mc.create_payment_transaction(
             account_id="acct1",
             posted_date_iso="2025-01-01",
@@ -225,8 +299,8 @@ def test_create_payment_transaction_recovers_on_timeout_by_duplicate_guard(monke
     assert txn_id == "txn-1"
 
 
-def test_find_duplicate_transaction_paginates(monkeypatch, tmp_path) -> None:
-    MonarchClient, FakeMonarchMoney = _import_monarch_client_with_fake_dep(monkeypatch)
+def test_find_duplicate_transaction_paginates(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
     mc = MonarchClient(
         email="",
         password="",
@@ -237,30 +311,36 @@ def test_find_duplicate_transaction_paginates(monkeypatch, tmp_path) -> None:
     )
     assert isinstance(mc._mm, FakeMonarchMoney)
 
-    # Fill the first page (200 txns) with non-matching items.
-    for i in range(200):
-        mc._mm._transactions.append(
+    # Fill the first page (200 txns) with non-matching items (one shared merchant
+    # dict; nothing mutates the seeded rows).
+    merchant = {"name": "Other Merchant"}
+    mc._mm.add_transactions(
+        [
             {
                 "id": f"noise-{i}",
                 "date": "2025-01-01",
                 "amount": 0.01,
-                "merchant": {"name": "Other Merchant"},
+                "merchant": merchant,
                 "accountId": "acct1",
             }
-        )
+            for i in range(200)
+        ]
+    )
 
     # Place the target duplicate on the second page (offset 200).
-    mc._mm._transactions.append(
-        {
-            "id": "target",
-            "date": "2025-01-01",
-            "amount": 1.23,  # 123 cents
-            "merchant": {"name": "US Department of Education"},
-            "accountId": "acct1",
-        }
+    mc._mm.add_transactions(
+        [
+            {
+                "id": "target",
+                "date": "2025-01-01",
+                "amount": 1.23,  # 123 cents
+                "merchant": {"name": "US Department of Education"},
+                "accountId": "acct1",
+            }
+        ]
     )
 
-    dup = asyncio.run(
+    dup = loop.run_until_complete(
         mc.find_duplicate_transaction(
             account_id="acct1",
             posted_date_iso="2025-01-01",
@@ -270,11 +350,12 @@ def test_find_duplicate_transaction_paginates(monkeypatch, tmp_path) -> None:
     )
     assert dup is not None
     assert dup.get("id") == "target"
-    assert mc._mm.calls_get_transactions >= 2
+    # 201 matching txns at page_size=200 -> exactly ceil(201/200) keyset fetches.
+    assert mc._mm.calls_get_transactions == 2
 
 
-def test_list_transactions_retries_transient_failure(monkeypatch, tmp_path) -> None:
-    MonarchClient, FakeMonarchMoney = _import_monarch_client_with_fake_dep(monkeypatch)
+def test_list_transactions_retries_transient_failure(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
     mc = MonarchClient(
         email="",
         password="",
@@ -287,7 +368,7 @@ def test_list_transactions_retries_transient_failure(monkeypatch, tmp_path) -> N
 
     # Fail once; the wrapper should retry and succeed.
     mc._mm.fail_get_transactions_times = 1
-    txns = asyncio.run(
+    txns = loop.run_until_complete(
         mc.list_transactions(
             account_id="acct1",
             start_date_iso="2025-01-01",
@@ -300,8 +381,8 @@ def test_list_transactions_retries_transient_failure(monkeypatch, tmp_path) -> N
     assert mc._mm.calls_get_transactions == 2
 
 
-def test_find_duplicate_transaction_respects_search(monkeypatch, tmp_path) -> None:
-    MonarchClient, FakeMonarchMoney = _import_monarch_client_with_fake_dep(monkeypatch)
+def test_find_duplicate_transaction_respects_search(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
     mc = MonarchClient(
         email="",
         password="",
@@ -313,28 +394,28 @@ def test_find_duplicate_transaction_respects_search(monkeypatch, tmp_path) -> No
     assert isinstance(mc._mm, FakeMonarchMoney)
 
     # Two txns with identical date+amount+merchant but different notes.
-    mc._mm._transactions.append(
-        {
-            "id": "t1",
-            "date": "2025-01-01",
-            "amount": 1.23,
-            "merchant": {"name": "US Department of Education"},
-            "notes": "Ref=REF1",
-            "accountId": "acct1",
-        }
-    )
-    mc._mm._transactions.append(
-        {
-            "id": "t2",
-            "date": "2025-01-01",
-            "amount": 1.23,
-            "merchant": {"name": "US Department of Education"},
-            "notes": "Ref=REF2",
-            "accountId": "acct1",
-        }
+    mc._mm.add_transactions(
+        [
+            {
+                "id": "t1",
+                "date": "2025-01-01",
+                "amount": 1.23,
+                "merchant": {"name": "US Department of Education"},
+                "notes": "Ref=REF1",
+                "accountId": "acct1",
+            },
+            {
+                "id": "t2",
+                "date": "2025-01-01",
+                "amount": 1.23,
+                "merchant": {"name": "US Department of Education"},
+                "notes": "Ref=REF2",
+                "accountId": "acct1",
+            },
+        ]
     )
 
-    dup = asyncio.run(
+    dup = loop.run_until_complete(
         mc.find_duplicate_transaction(
             account_id="acct1",
             posted_date_iso="2025-01-01",
@@ -347,8 +428,8 @@ def test_find_duplicate_transaction_respects_search(monkeypatch, tmp_path) -> No
     assert dup.get("id") == "t2"
 
 
-def test_login_prefers_saved_session_over_cookie_bootstrap(monkeypatch, tmp_path) -> None:
-    MonarchClient, FakeMonarchMoney = _import_monarch_client_with_fake_dep(monkeypatch)
+def test_login_prefers_saved_session_over_cookie_bootstrap(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
     session_file = tmp_path / "monarch_session.pickle"
     session_file.write_text("placeholder", encoding="utf-8")
 
@@ -361,7 +442,7 @@ def test_login_prefers_saved_session_over_cookie_bootstrap(monkeypatch, tmp_path
         session_file=str(session_file),
     )
 
-    asyncio.run(mc.login())
+    loop.run_until_complete(mc.login())
 
     assert mc._mm.loaded_session_paths == [str(session_file)]
     assert mc._mm.login_with_cookies_calls == []
@@ -369,8 +450,8 @@ def test_login_prefers_saved_session_over_cookie_bootstrap(monkeypatch, tmp_path
     assert mc._mm.calls_get_accounts == 1
 
 
-def test_login_bootstraps_from_cookie_string(monkeypatch, tmp_path) -> None:
-    MonarchClient, FakeMonarchMoney = _import_monarch_client_with_fake_dep(monkeypatch)
+def test_login_bootstraps_from_cookie_string(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
     session_file = tmp_path / "monarch_session.pickle"
 
     mc = MonarchClient(
@@ -382,7 +463,7 @@ def test_login_bootstraps_from_cookie_string(monkeypatch, tmp_path) -> None:
         session_file=str(session_file),
     )
 
-    asyncio.run(mc.login())
+    loop.run_until_complete(mc.login())
 
     assert mc._mm.loaded_session_paths == []
     assert mc._mm.login_with_cookies_calls == [
@@ -397,8 +478,8 @@ def test_login_bootstraps_from_cookie_string(monkeypatch, tmp_path) -> None:
     assert mc._mm.saved_session_paths == [str(session_file)]
 
 
-def test_login_falls_back_from_stale_session_to_cookie_string(monkeypatch, tmp_path) -> None:
-    MonarchClient, FakeMonarchMoney = _import_monarch_client_with_fake_dep(monkeypatch)
+def test_login_falls_back_from_stale_session_to_cookie_string(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
     FakeMonarchMoney.load_session_error = RuntimeError("stale session")
     session_file = tmp_path / "monarch_session.pickle"
     session_file.write_text("bad pickle", encoding="utf-8")
@@ -412,7 +493,7 @@ def test_login_falls_back_from_stale_session_to_cookie_string(monkeypatch, tmp_p
         session_file=str(session_file),
     )
 
-    asyncio.run(mc.login())
+    loop.run_until_complete(mc.login())
 
     assert FakeMonarchMoney.instances[1].loaded_session_paths == [str(session_file)]
     assert mc._mm.login_with_cookies_calls == [
@@ -427,8 +508,8 @@ def test_login_falls_back_from_stale_session_to_cookie_string(monkeypatch, tmp_p
     assert not session_file.exists()
 
 
-def test_login_uses_token_compatibility_path(monkeypatch, tmp_path) -> None:
-    MonarchClient, FakeMonarchMoney = _import_monarch_client_with_fake_dep(monkeypatch)
+def test_login_uses_token_compatibility_path(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
     session_file = tmp_path / "monarch_session.pickle"
 
     mc = MonarchClient(
@@ -440,7 +521,7 @@ def test_login_uses_token_compatibility_path(monkeypatch, tmp_path) -> None:
         session_file=str(session_file),
     )
 
-    asyncio.run(mc.login())
+    loop.run_until_complete(mc.login())
 
     assert mc._mm.loaded_session_paths == []
     assert mc._mm.login_with_cookies_calls == []
@@ -449,8 +530,8 @@ def test_login_uses_token_compatibility_path(monkeypatch, tmp_path) -> None:
     assert mc._mm.saved_session_paths == [str(session_file)]
 
 
-def test_login_password_captcha_guides_cookie_bootstrap(monkeypatch, tmp_path) -> None:
-    MonarchClient, FakeMonarchMoney = _import_monarch_client_with_fake_dep(monkeypatch)
+def test_login_password_captcha_guides_cookie_bootstrap(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
     FakeMonarchMoney.login_error = FakeMonarchMoney.CaptchaRequiredException("CAPTCHA_REQUIRED")
     session_file = tmp_path / "monarch_session.pickle"
 
@@ -464,6 +545,45 @@ def test_login_password_captcha_guides_cookie_bootstrap(monkeypatch, tmp_path) -
     )
 
     with pytest.raises(RuntimeError, match="MONARCH_COOKIE_STRING"):
-        asyncio.run(mc.login())
+        loop.run_until_complete(mc.login())
+
 
 
+def test_list_transactions_multi_fetches_each_account_once(monarch_env, loop, tmp_path) -> None:
+    MonarchClient, FakeMonarchMoney = monarch_env
+    mc = MonarchClient(
+        email="",
+        password="",
+        cookie_string="",
+        token="token",
+        mfa_secret="",
+        session_file=str(tmp_path / "monarch_session.pickle"),
+    )
+    assert isinstance(mc._mm, FakeMonarchMoney)
+
+    account_ids = [f"acct{i}" for i in range(1, 6)]
+    mc._mm.add_transactions(
+        [
+            {
+                "id": f"t-{a}",
+                "date": "2025-01-01",
+                "amount": 1.0,
+                "merchant": {"name": "US Department of Education"},
+                "accountId": a,
+            }
+            for a in account_ids
+        ]
+    )
+
+    out = loop.run_until_complete(
+        mc.list_transactions_multi(
+            account_ids,
+            start_date_iso="2025-01-01",
+            end_date_iso="2025-01-01",
+            limit=200,
+        )
+    )
+
+    assert list(out.keys()) == account_ids
+    assert all(out[a][0]["id"] == f"t-{a}" for a in account_ids)
+    assert mc._mm.calls_get_transactions == 5
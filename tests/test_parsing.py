@@ -8,7 +8,10 @@ from studentaid_monarch_sync.portal.client import PortalCredentials, ServicerPor
 from studentaid_monarch_sync.util.dates import parse_us_date
 
 
-def _client() -> ServicerPortalClient:
+@pytest.fixture(scope="module")
+def client() -> ServicerPortalClient:
+    # Shared across the module: the parsing helpers under test are pure on body
+    # text, so one client instance amortizes construction for every test here.
     return ServicerPortalClient(
         base_url="https://example.studentaid.gov",
         creds=PortalCredentials(username="u", password="p"),
@@ -28,8 +31,8 @@ def test_parse_us_date_basic() -> None:
     assert parse_us_date("12/26/2025") == date(2025, 12, 26)
 
 
-def test_find_payment_date_prefers_labeled_date() -> None:
-    c = _client()
+def test_find_payment_date_prefers_labeled_date(client) -> None:
+    c = client
     body = """
     Payment Date: 12/26/2025
     Statement Date: 12/30/2025
@@ -37,21 +40,21 @@ def test_find_payment_date_prefers_labeled_date() -> None:
     assert c._find_payment_date(body) == date(2025, 12, 26)
 
 
-def test_find_payment_date_single_date_fallback() -> None:
-    c = _client()
+def test_find_payment_date_single_date_fallback(client) -> None:
+    c = client
     body = "Some header\n12/26/2025\nSome footer\n"
     assert c._find_payment_date(body) == date(2025, 12, 26)
 
 
-def test_find_payment_date_multiple_dates_raises() -> None:
-    c = _client()
+def test_find_payment_date_multiple_dates_raises(client) -> None:
+    c = client
     body = "12/26/2025\n12/30/2025\n"
     with pytest.raises(RuntimeError):
         _ = c._find_payment_date(body)
 
 
-def test_parse_payment_allocations_parses_groups_and_total_and_reference() -> None:
-    c = _client()
+def test_parse_payment_allocations_parses_groups_and_total_and_reference(client) -> None:
+    c = client
     body = """
     Payment Date: 12/26/2025
     Confirmation Number: ABCD-1234
@@ -74,8 +77,8 @@ def test_parse_payment_allocations_parses_groups_and_total_and_reference() -> No
     assert aa.interest_applied_cents == 1098
 
 
-def test_parse_payment_allocations_supports_hyphenated_group_ids() -> None:
-    c = _client()
+def test_parse_payment_allocations_supports_hyphenated_group_ids(client) -> None:
+    c = client
     body = """
     Payment Date: 12/26/2025
 
@@ -90,8 +93,8 @@ def test_parse_payment_allocations_supports_hyphenated_group_ids() -> None:
     assert all(a.payment_total_cents == 4819 for a in allocs)
 
 
-def test_parse_payment_allocations_falls_back_to_sum_when_total_missing() -> None:
-    c = _client()
+def test_parse_payment_allocations_falls_back_to_sum_when_total_missing(client) -> None:
+    c = client
     body = """
     Date: 12/26/2025
     AA  31.20  20.22  10.98
@@ -103,11 +106,11 @@ def test_parse_payment_allocations_falls_back_to_sum_when_total_missing() -> Non
     assert all(a.payment_total_cents == (3120 + 1699) for a in allocs)
 
 
-def test_parse_payment_allocations_parses_multiline_table_cells() -> None:
+def test_parse_payment_allocations_parses_multiline_table_cells(client) -> None:
     """
     Some servicer portals render allocation tables responsively, so each cell becomes its own line.
     """
-    c = _client()
+    c = client
     body = """
     Payment Date: 12/26/2025
     Confirmation Number: ABCD-1234
@@ -136,12 +139,12 @@ def test_parse_payment_allocations_parses_multiline_table_cells() -> None:
     assert all(a.payment_total_cents == 27852 for a in allocs)
 
 
-def test_parse_payment_allocations_parses_row_with_prefix_text_when_expected_groups_given() -> None:
+def test_parse_payment_allocations_parses_row_with_prefix_text_when_expected_groups_given(client) -> None:
     """
     Some table rows include non-group text before the group (e.g. a details-toggle cell).
     When expected_groups is provided (runtime), we should still extract the correct group + amounts.
     """
-    c = _client()
+    c = client
     body = """
     Payment Date: 12/26/2024
 
@@ -156,8 +159,8 @@ def test_parse_payment_allocations_parses_row_with_prefix_text_when_expected_gro
     assert all(a.payment_total_cents == (2571 + 1699) for a in allocs)
 
 
-def test_non_posted_detection_finds_cancelled_dates() -> None:
-    c = _client()
+def test_non_posted_detection_finds_cancelled_dates(client) -> None:
+    c = client
     body = """
     Payment History
     Payment Date Payment Amount Applied to Principal Applied to Interest Payment Type
@@ -173,8 +176,8 @@ def test_non_posted_detection_finds_cancelled_dates() -> None:
     assert all("cancel" in v for v in got.values())
 
 
-def test_non_posted_detection_finds_pending_dates() -> None:
-    c = _client()
+def test_non_posted_detection_finds_pending_dates(client) -> None:
+    c = client
     body = """
     Payment Date Payment Amount Applied to Principal Applied to Interest Payment Type
 
@@ -188,8 +191,8 @@ def test_non_posted_detection_finds_pending_dates() -> None:
     assert date(2026, 1, 10) not in got
 
 
-def test_non_posted_detection_finds_scheduled_dates() -> None:
-    c = _client()
+def test_non_posted_detection_finds_scheduled_dates(client) -> None:
+    c = client
     body = """
     02/01/2026 $250.00 $0.00 $0.00 Scheduled
     01/15/2026 $278.52 $184.12 $94.40 Electronic
@@ -201,8 +204,8 @@ def test_non_posted_detection_finds_scheduled_dates() -> None:
     assert date(2026, 1, 15) not in got
 
 
-def test_non_posted_detection_finds_processing_dates() -> None:
-    c = _client()
+def test_non_posted_detection_finds_processing_dates(client) -> None:
+    c = client
     body = """
     02/15/2026 $300.00 $0.00 $0.00 Processing
     02/01/2026 $278.52 $184.12 $94.40 Electronic
@@ -214,9 +217,9 @@ def test_non_posted_detection_finds_processing_dates() -> None:
     assert date(2026, 2, 1) not in got
 
 
-def test_non_posted_detection_mixed_statuses() -> None:
+def test_non_posted_detection_mixed_statuses(client) -> None:
     """Multiple non-posted statuses in one body text are all detected."""
-    c = _client()
+    c = client
     body = """
     03/01/2026 $100.00 $0.00 $0.00 Pending
     02/15/2026 $200.00 $0.00 $0.00 Processing
@@ -232,8 +235,8 @@ def test_non_posted_detection_mixed_statuses() -> None:
     assert date(2026, 1, 15) not in got
 
 
-def test_payment_history_list_detection_matches_table_view() -> None:
-    c = _client()
+def test_payment_history_list_detection_matches_table_view(client) -> None:
+    c = client
     body = """
     Payment Activity
     Payment History
@@ -247,8 +250,8 @@ def test_payment_history_list_detection_matches_table_view() -> None:
     assert c._looks_like_payment_history_list(body) is True
 
 
-def test_payment_detail_context_detection_rejects_list_view_text() -> None:
-    c = _client()
+def test_payment_detail_context_detection_rejects_list_view_text(client) -> None:
+    c = client
     body = """
     Payment Activity
     Payment History
@@ -260,8 +263,8 @@ def test_payment_detail_context_detection_rejects_list_view_text() -> None:
     assert c._looks_like_payment_detail_context(body, expected_groups={"AA", "AB"}) is False
 
 
-def test_payment_detail_context_detection_accepts_group_breakdown_text() -> None:
-    c = _client()
+def test_payment_detail_context_detection_accepts_group_breakdown_text(client) -> None:
+    c = client
     body = """
     Payment Date: 01/26/2026
     Loan Group: AA
@@ -276,19 +279,19 @@ def test_payment_detail_context_detection_accepts_group_breakdown_text() -> None
     assert c._looks_like_payment_detail_context(body, expected_groups={"AA", "AB"}) is True
 
 
-def test_looks_like_access_denied_matches_403_text() -> None:
-    c = _client()
+def test_looks_like_access_denied_matches_403_text(client) -> None:
+    c = client
     page = _BodyOnlyPage("HTTP 403 Access denied.")
     assert c._looks_like_access_denied(page) is True
 
 
-def test_looks_like_access_denied_matches_short_access_denied_text() -> None:
-    c = _client()
+def test_looks_like_access_denied_matches_short_access_denied_text(client) -> None:
+    c = client
     page = _BodyOnlyPage("Access denied")
     assert c._looks_like_access_denied(page) is True
 
 
-def test_looks_like_access_denied_ignores_normal_page_content() -> None:
-    c = _client()
+def test_looks_like_access_denied_ignores_normal_page_content(client) -> None:
+    c = client
     page = _BodyOnlyPage("Welcome back. Payment Activity is ready.")
     assert c._looks_like_access_denied(page) is False
@@ -7,8 +7,11 @@ import pytest
 from studentaid_monarch_sync.portal.client import PortalCredentials, ServicerPortalClient
 
 
-def _client() -> ServicerPortalClient:
-    # Construct a client only to reuse parsing helpers. No navigation is performed in these tests.
+@pytest.fixture(scope="module")
+def client() -> ServicerPortalClient:
+    # Construct a client only to reuse parsing helpers. No navigation is performed in
+    # these tests, and the helpers are pure on body text, so one shared instance
+    # amortizes construction across the module.
     return ServicerPortalClient(
         base_url="https://example.studentaid.gov",
         creds=PortalCredentials(username="u", password="p"),
@@ -81,6 +84,7 @@ Toggle details row AG  $56.97  $32.90  $24.07
     ids=["cri", "nelnet"],
 )
 def test_parse_payment_allocations_across_servicers(
+    client,
     provider: str,
     body_text: str,
     expected_groups: set[str],
@@ -91,7 +95,7 @@ def test_parse_payment_allocations_across_servicers(
     """
     Regression coverage for payment allocation parsing across servicers.
     """
-    c = _client()
+    c = client
     allocs = c._parse_payment_allocations(body_text, expected_groups=set(expected_groups))
 
     assert {a.group for a in allocs} == set(expected_rows.keys()), f"groups mismatch for provider={provider}"
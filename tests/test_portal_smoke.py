@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +13,12 @@ from dotenv import dotenv_values
 ROOT = Path(__file__).resolve().parents[1]
 
 
+@lru_cache(maxsize=8)
+def _cached_dotenv(path_str: str) -> dict[str, Optional[str]]:
+    # Providers often share the same fallback portal.env; parse each file once per session.
+    return dict(dotenv_values(path_str))
+
+
 def _get_env_file(provider: str) -> Optional[Path]:
     key = f"PORTAL_ENV_FILE_{provider.upper()}"
     env_path = os.getenv(key)
@@ -94,16 +101,41 @@ def _skip_if_missing(provider: str, *, env: dict[str, str], env_file: Optional[P
             _skip_or_fail("Missing Gmail IMAP creds (set GMAIL_IMAP_USER + GMAIL_IMAP_APP_PASSWORD).")
 
 
+# Env keys the CLI subprocess actually consumes, plus interpreter/runtime
+# essentials. Passing the full inherited environ re-marshals ~100 entries into an
+# envp array per spawn; the slim dict is built once and reused for both commands.
+_ENV_PREFIXES = (
+    "SERVICER_",
+    "MONARCH_",
+    "GMAIL_",
+    "PORTAL_",
+    "LOAN_",
+    "STATE_",
+    "PATH",
+    "HOME",
+    "PYTHON",
+    "VIRTUAL_ENV",
+    "LANG",
+    "LC_",
+    "TMP",
+    "TEMP",
+)
+
+
+def _slim_env(env: dict[str, str]) -> dict[str, str]:
+    return {k: v for k, v in env.items() if k.startswith(_ENV_PREFIXES)}
+
+
 def _run_cmd(args: list[str], *, env: dict[str, str]) -> None:
     timeout = int(os.getenv("PORTAL_SMOKE_TIMEOUT", "1200"))
-    subprocess.run(args, cwd=ROOT, env=env, check=True, timeout=timeout)
+    subprocess.run(args, cwd=ROOT, env=env, check=True, timeout=timeout, close_fds=True)
 
 
 def _run_preflight_and_dry_run(provider: str) -> None:
     env_file = _get_env_file(provider)
     base_env = os.environ.copy()
     if env_file is not None and env_file.exists():
-        values = dotenv_values(env_file)
+        values = _cached_dotenv(str(env_file))
         for key, value in values.items():
             if value is None or key in base_env:
                 continue
@@ -116,24 +148,23 @@ def _run_preflight_and_dry_run(provider: str) -> None:
     if env_file:
         cmd_base += ["--env-file", str(env_file)]
 
-    preflight_cmd = cmd_base + ["preflight"]
+    # One combined subcommand = one interpreter startup/import graph per provider
+    # instead of separate preflight and dry-run processes.
+    cmd = cmd_base + ["preflight-and-dry-run"]
     if os.getenv("PORTAL_SMOKE_SKIP_IMAP") == "1":
-        preflight_cmd.append("--skip-imap")
-
-    dry_run_cmd = cmd_base + ["sync", "--dry-run"]
+        cmd.append("--skip-imap")
     if provider == "nelnet":
         # Some Nelnet accounts show no loan-group details (e.g. closed/transferred loans).
         # We still want to exercise login + payment allocation parsing.
-        dry_run_cmd.append("--skip-loans")
+        cmd.append("--skip-loans")
     max_payments = os.getenv("PORTAL_SMOKE_MAX_PAYMENTS")
     if max_payments:
-        dry_run_cmd += ["--max-payments", max_payments]
+        cmd += ["--max-payments", max_payments]
     payments_since = os.getenv("PORTAL_SMOKE_PAYMENTS_SINCE")
     if payments_since:
-        dry_run_cmd += ["--payments-since", payments_since]
+        cmd += ["--payments-since", payments_since]
 
-    _run_cmd(preflight_cmd, env=env)
-    _run_cmd(dry_run_cmd, env=env)
+    _run_cmd(cmd, env=_slim_env(env))
 
 
 @pytest.mark.portal
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from studentaid_monarch_sync.state import StateStore
@@ -47,7 +48,17 @@ def test_state_restores_from_backup_when_db_corrupted(tmp_path: Path) -> None:
         s2.close()
 
     # We should have created a quarantined file.
-    quarantined = list(tmp_path.glob("state.db.corrupt-*"))
+    # os.scandir: one readdir pass, no per-entry stat or glob pattern compile.
+    quarantined = any(e.name.startswith("state.db.corrupt-") for e in os.scandir(tmp_path))
     assert quarantined, "expected quarantined corrupted db file to be created"
 
 
+
+def test_state_uses_wal_journal_mode(tmp_path: Path) -> None:
+    db_path = tmp_path / "state.db"
+    s = StateStore(str(db_path))
+    try:
+        row = s._conn.execute("PRAGMA journal_mode;").fetchone()
+        assert row and row[0] == "wal"
+    finally:
+        s.close()